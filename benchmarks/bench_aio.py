@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Benchmark : réactivité de la boucle asyncio pendant une grosse sauvegarde,
+save_to_file appelé sur la boucle vs AsyncTaskManager.save
+"""
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.task_manager.aio import AsyncTaskManager
+from src.task_manager.manager import TaskManager
+
+
+async def measure_lag(work, interval=0.001):
+    lags = []
+    done = asyncio.Event()
+
+    async def ticker():
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(interval)
+            lags.append(time.perf_counter() - start - interval)
+
+    tick = asyncio.ensure_future(ticker())
+    await asyncio.sleep(0.01)
+    start = time.perf_counter()
+    await work()
+    elapsed = time.perf_counter() - start
+    done.set()
+    await tick
+    lags.sort()
+    return elapsed, lags[-1], lags[int(len(lags) * 0.99) - 1] if lags else 0.0
+
+
+def main(n=100_000):
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = TaskManager(str(Path(tmp) / "tasks.json"))
+        for i in range(n):
+            manager.add_task(f"Task {i}", "Description")
+        facade = AsyncTaskManager(manager)
+
+        async def blocking():
+            manager.save_to_file()
+
+        async def offloaded():
+            await facade.save()
+
+        print(f"n={n}")
+        for label, work in (("save_to_file on loop", blocking), ("AsyncTaskManager.save", offloaded)):
+            elapsed, worst, p99 = asyncio.run(measure_lag(work))
+            print(f"  {label:<24} save {elapsed * 1e3:8.1f} ms   max loop lag {worst * 1e3:8.1f} ms"
+                  f"   p99 lag {p99 * 1e3:6.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
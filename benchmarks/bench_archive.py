@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark : archivage des tâches terminées (TaskArchive).
+
+Sur un historique où la plupart des tâches sont terminées, compare le
+chargement, la sauvegarde et les statistiques avant et après archivage,
+puis mesure une requête d'un mois dans l'archive et un rapport
+d'historique qui combine tâches actives et archivées.
+"""
+import os
+import sys
+import tempfile
+import time
+from datetime import date, datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.dataset import write_dataset
+from src.task_manager.archive import TaskArchive
+from src.task_manager.manager import TaskManager
+from src.task_manager.services import ReportService
+from src.task_manager.task import Status
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def hot_path(manager):
+    load, _ = timed(manager.load_from_file)
+    save, _ = timed(manager.save_to_file)
+    stats, _ = timed(manager.get_statistics)
+    return load, save, stats, os.path.getsize(manager.storage_file)
+
+
+def directory_size(directory):
+    return sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+
+
+def main(count=200_000):
+    # Trois ans d'historique, 80 % de tâches terminées
+    statuses = {Status.TODO: 0.1, Status.IN_PROGRESS: 0.05, Status.DONE: 0.8, Status.CANCELLED: 0.05}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "tasks.json")
+        write_dataset(path, count, seed=11, statuses=statuses, days=3 * 365)
+        manager = TaskManager(path)
+        before = hot_path(manager)
+
+        archive = TaskArchive(os.path.join(tmp, "archive"))
+        elapsed, archived = timed(lambda: manager.archive_completed(archive, date(2026, 7, 1)))
+        manager.save_to_file()
+        print(f"{archived} tâches archivées sur {count} en {elapsed:.2f}s, "
+              f"{len(archive.partitions())} mois, {directory_size(archive.directory) / 1e6:.1f} Mo compressés")
+        after = hot_path(manager)
+
+        print(f"{'':<20}{'avant':>12}{'après':>12}")
+        for label, index in (("load_from_file", 0), ("save_to_file", 1), ("get_statistics", 2)):
+            print(f"{label:<20}{before[index] * 1e3:9.1f} ms{after[index] * 1e3:9.1f} ms")
+        print(f"{'fichier':<20}{before[3] / 1e6:9.1f} Mo{after[3] / 1e6:9.1f} Mo")
+
+        month, tasks = timed(lambda: list(archive.iter_tasks(date(2025, 3, 1), date(2025, 4, 1))))
+        print(f"\nrequête sur un mois d'archive : {month * 1e3:.1f} ms ({len(tasks)} tâches)")
+        service = ReportService()
+        report, _ = timed(lambda: service.generate_range_report(manager.tasks, datetime(2026, 1, 1),
+                                                                  datetime(2026, 3, 31), archive=archive))
+        print(f"rapport d'historique sur un trimestre : {report * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Benchmark : opérations groupées du TaskManager (add_tasks, complete_tasks,
+update_priorities, assign_to_project, delete_tasks) vs boucles d'appels
+unitaires, en mémoire et avec le journal.
+"""
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.task_manager.manager import TaskManager
+from src.task_manager.task import Priority
+
+
+def timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def per_item(manager, titles):
+    ids = []
+    results = {"add": timed(lambda: ids.extend(manager.add_task(title) for title in titles))}
+    half = ids[::2]
+    results["complete"] = timed(lambda: [manager.get_task(i).mark_completed() for i in half])
+    results["priority"] = timed(lambda: [manager.get_task(i).update_priority(Priority.URGENT) for i in half])
+    results["project"] = timed(lambda: [manager.get_task(i).assign_to_project("p1") for i in half])
+    # L'index trié sur created_at existe dès qu'une requête l'a demandé
+    manager.query().order_by("created_at").first()
+    results["delete"] = timed(lambda: [manager.delete_task(i) for i in half])
+    return results
+
+
+def bulk(manager, titles):
+    ids = []
+    results = {"add": timed(lambda: ids.extend(manager.add_tasks(titles)))}
+    half = ids[::2]
+    results["complete"] = timed(lambda: manager.complete_tasks(half))
+    results["priority"] = timed(lambda: manager.update_priorities(half, Priority.URGENT))
+    results["project"] = timed(lambda: manager.assign_to_project(half, "p1"))
+    manager.query().order_by("created_at").first()
+    results["delete"] = timed(lambda: manager.delete_tasks(half))
+    return results
+
+
+def compare(label, make_manager, count):
+    titles = [f"Task {i}" for i in range(count)]
+    loop = per_item(make_manager("loop"), titles)
+    grouped = bulk(make_manager("bulk"), titles)
+    print(f"{label} ({count} ajouts, {count // 2} mutations/suppressions par opération)")
+    for operation in loop:
+        print(f"  {operation:<9}: boucle {loop[operation]:7.3f}s   groupé {grouped[operation]:7.3f}s   "
+              f"x{loop[operation] / grouped[operation]:.1f}")
+
+
+def main(count=100_000):
+    compare("En mémoire", lambda name: TaskManager(), count)
+    with tempfile.TemporaryDirectory() as tmp:
+        compare("Avec journal", lambda name: TaskManager(os.path.join(tmp, f"{name}.json"), journal=True,
+                                                         compact_threshold=0), count // 5)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmark multi-thread : lectures concurrentes avec un rédacteur en fond,
+ConcurrentTaskManager (verrou lecteurs/rédacteur) vs verrou exclusif unique.
+
+Sous CPython avec GIL le débit total reste borné par un cœur : le gain
+attendu est que les lecteurs ne se sérialisent plus entre eux (latence et
+équité), pas un passage à l'échelle linéaire.
+"""
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.task_manager.concurrency import ConcurrentTaskManager
+from src.task_manager.manager import TaskManager
+from src.task_manager.task import Priority, Status
+
+
+class MutexTaskManager(TaskManager):
+    # Référence : un seul verrou exclusif pour toutes les opérations
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._mutex = threading.Lock()
+
+    def get_task(self, task_id):
+        with self._mutex:
+            return super().get_task(task_id)
+
+    def get_statistics(self):
+        with self._mutex:
+            return super().get_statistics()
+
+    def add_task(self, *args, **kwargs):
+        with self._mutex:
+            return super().add_task(*args, **kwargs)
+
+
+def run(manager, ids, readers, duration=1.0):
+    stop = threading.Event()
+    counts = [0] * readers
+
+    def reader(slot):
+        rng = random.Random(slot)
+        while not stop.is_set():
+            manager.get_task(rng.choice(ids))
+            manager.get_statistics()
+            counts[slot] += 2
+
+    def writer():
+        while not stop.is_set():
+            manager.add_task("Background", priority=Priority.LOW)
+            time.sleep(0.001)
+
+    threads = [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+    threads.append(threading.Thread(target=writer))
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return sum(counts) / duration
+
+
+def main(n=50_000, reader_counts=(1, 2, 4, 8)):
+    print(f"{'readers':>8} {'mutex ops/s':>14} {'rwlock ops/s':>14}")
+    for readers in reader_counts:
+        results = []
+        for cls in (MutexTaskManager, ConcurrentTaskManager):
+            manager = cls("bench_tasks.json")
+            ids = [manager.add_task(f"Task {i}") for i in range(n)]
+            results.append(run(manager, ids, readers))
+        print(f"{readers:>8} {results[0]:>14.0f} {results[1]:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
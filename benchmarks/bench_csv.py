@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark : débit de l'export CSV (lignes/s), ReportService.export_tasks_csv
+vs write_tasks_csv (morceaux, gzip, pool de processus), et de l'import.
+"""
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.task_manager.csv_io import read_tasks_csv, write_tasks_csv
+from src.task_manager.services import ReportService
+from src.task_manager.task import Task, Priority
+
+
+def make_tasks(count):
+    priorities = list(Priority)
+    tasks = []
+    for i in range(count):
+        task = Task(f"Task {i}", f"Description de la tâche {i}, avec une virgule", priorities[i % 4])
+        if i % 3 == 0:
+            task.mark_completed()
+        tasks.append(task)
+    return tasks
+
+
+def report(label, count, elapsed):
+    print(f"  {label:<36}: {count / elapsed:>10,.0f} lignes/s  ({elapsed:.2f}s)")
+
+
+def main(count=200_000):
+    tasks = make_tasks(count)
+    print(f"{count} tâches")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "tasks.csv")
+        start = time.perf_counter()
+        ReportService().export_tasks_csv(tasks, path)
+        report("export_tasks_csv", count, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        write_tasks_csv(path, tasks)
+        report("write_tasks_csv", count, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        write_tasks_csv(path, (task for task in tasks))
+        report("write_tasks_csv (générateur)", count, time.perf_counter() - start)
+
+
+        gz_path = path + ".gz"
+        start = time.perf_counter()
+        write_tasks_csv(gz_path, tasks)
+        report("write_tasks_csv, gzip", count, time.perf_counter() - start)
+
+        processes = os.cpu_count() or 1
+        if processes > 1:
+            start = time.perf_counter()
+            write_tasks_csv(path, tasks, processes=processes)
+            report(f"write_tasks_csv, {processes} processus", count, time.perf_counter() - start)
+            start = time.perf_counter()
+            write_tasks_csv(gz_path, tasks, processes=processes)
+            report(f"write_tasks_csv, gzip, {processes} processus", count, time.perf_counter() - start)
+        else:
+            print("  (un seul CPU : pas de mesure avec pool de processus)")
+
+        start = time.perf_counter()
+        loaded = sum(1 for _ in read_tasks_csv(path))
+        report("read_tasks_csv", loaded, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark : envoi de rappels, une connexion SMTP par message vs
+DeliveryPipeline (pool de connexions, envois par lots).
+
+Le serveur est simulé : l'ouverture de connexion (TCP + EHLO + STARTTLS +
+LOGIN) coûte CONNECT_COST, chaque message SEND_COST.
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.task_manager.delivery import DeliveryPipeline, SMTPConnectionPool, build_message
+
+CONNECT_COST = 0.02
+SEND_COST = 0.001
+
+
+class SimulatedSMTP:
+    connections = 0
+
+    def __init__(self, host, port, timeout=None):
+        SimulatedSMTP.connections += 1
+        time.sleep(CONNECT_COST)
+
+    def send_message(self, message):
+        time.sleep(SEND_COST)
+
+    def quit(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def one_connection_per_message(messages):
+    for message in messages:
+        connection = SimulatedSMTP("smtp.example.com", 587)
+        connection.send_message(message)
+        connection.quit()
+
+
+def pipeline(messages, workers):
+    pool = SMTPConnectionPool("smtp.example.com", size=workers, factory=SimulatedSMTP)
+    delivery = DeliveryPipeline(pool, workers=workers, batch_size=100)
+    futures = [delivery.submit(message) for message in messages]
+    for future in futures:
+        future.result()
+    delivery.close()
+
+
+def main(count=500):
+    messages = [build_message("noreply@example.com", f"user{i}@example.com", f"Reminder {i}", "Due soon")
+                for i in range(count)]
+    print(f"{count} messages (connexion {CONNECT_COST * 1000:.0f}ms, envoi {SEND_COST * 1000:.0f}ms)")
+
+    SimulatedSMTP.connections = 0
+    start = time.perf_counter()
+    one_connection_per_message(messages)
+    elapsed = time.perf_counter() - start
+    print(f"  une connexion par message : {elapsed:.2f}s  ({SimulatedSMTP.connections} connexions)")
+
+    for workers in (1, 4):
+        SimulatedSMTP.connections = 0
+        start = time.perf_counter()
+        pipeline(messages, workers)
+        elapsed = time.perf_counter() - start
+        print(f"  pipeline, {workers} worker(s)    : {elapsed:.2f}s  ({SimulatedSMTP.connections} connexions)")
+
+
+if __name__ == "__main__":
+    main()
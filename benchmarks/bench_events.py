@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark : flux de changements (changes()) vs relecture complète.
+
+Mesure le surcoût des abonnés sur les mutations unitaires et groupées, le
+coût du diff publié au rechargement, et compare un consommateur qui suit
+les fins de tâches par le flux à un consommateur qui relit toutes les
+tâches terminées pour trouver les nouvelles.
+"""
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.dataset import generate_tasks
+from src.task_manager.events import COMPLETED
+from src.task_manager.manager import TaskManager
+from src.task_manager.task import Status
+
+
+def timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def mutations(manager, count):
+    ids = manager.add_tasks([f"Task {index}" for index in range(count)])
+    add_many = timed(lambda: manager.add_tasks([f"Bulk {index}" for index in range(count)]))
+    single = timed(lambda: [manager.get_task(task_id).mark_completed() for task_id in ids])
+    return add_many / count, single / count
+
+
+def main(count=100_000, batch=10_000):
+    print(f"{'':<30}{'add_tasks':>14}{'mark_completed':>16}")
+    for subscribers in (0, 1, 4):
+        manager = TaskManager()
+        subscriptions = [manager.changes().subscribe(maxsize=4 * batch) for _ in range(subscribers)]
+        add_many, single = mutations(manager, batch)
+        print(f"{subscribers} abonné(s){'':<20}{add_many * 1e6:11.2f} µs{single * 1e6:13.2f} µs")
+        for subscription in subscriptions:
+            subscription.close()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = TaskManager(os.path.join(tmp, "tasks.json"))
+        manager.tasks = generate_tasks(count, seed=5)
+        manager.save_to_file()
+        manager.add_tasks([f"New {index}" for index in range(batch)])
+        subscription = manager.changes().subscribe(maxsize=count + batch)
+        reload = timed(manager.load_from_file)
+        events = len(subscription.get_batch(count + batch, timeout=0))
+        subscription.close()
+        plain = timed(manager.load_from_file)
+        print(f"\nrechargement de {count} tâches : {plain * 1e3:.1f} ms sans abonné, "
+              f"{reload * 1e3:.1f} ms avec diff ({events} événements)")
+
+        # Suivi des fins de tâches après chaque lot de mutations
+        todo = [task.id for task in manager.get_tasks_by_status(Status.TODO)][:batch]
+        steps = [todo[index:index + batch // 10] for index in range(0, len(todo), batch // 10)]
+        subscription = manager.changes().subscribe(kinds=[COMPLETED], maxsize=batch)
+        seen = {task.id for task in manager.get_tasks_by_status(Status.DONE)}
+        feed_time = rescan_time = 0.0
+        for step in steps:
+            manager.complete_tasks(step)
+            feed_time += timed(lambda: subscription.get_batch(batch, timeout=0))
+            start = time.perf_counter()
+            done = {task.id for task in manager.get_tasks_by_status(Status.DONE)}
+            new = done - seen
+            seen = done
+            rescan_time += time.perf_counter() - start
+        subscription.close()
+        print(f"suivi des fins ({len(steps)} lots) : flux {feed_time * 1e3:.2f} ms, "
+              f"relecture {rescan_time * 1e3:.2f} ms ({len(new)} nouvelles au dernier lot)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Benchmark : hydratation des tâches, ancien from_dict vs from_trusted_dict
+"""
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.task_manager.task import Task, Priority, Status
+
+
+def legacy_from_dict(data):
+    # Implémentation d'origine : constructeur complet puis écrasement des champs
+    task = Task(
+        title=data["title"],
+        description=data.get("description", ""),
+        priority=Priority(data["priority"])
+    )
+    task.id = data["id"]
+    task.status = Status(data["status"])
+    task.created_at = datetime.fromisoformat(data["created_at"])
+    if data.get("completed_at"):
+        task.completed_at = datetime.fromisoformat(data["completed_at"])
+    task.project_id = data.get("project_id")
+    return task
+
+
+def make_records(n):
+    records = []
+    for i in range(n):
+        task = Task(f"Task {i}", "Description", list(Priority)[i % 4])
+        if i % 3 == 0:
+            task.mark_completed()
+        records.append(task.to_dict())
+    return records
+
+
+def timed(fn, records):
+    start = time.perf_counter()
+    for data in records:
+        fn(data)
+    return time.perf_counter() - start
+
+
+def main(sizes=(10_000, 100_000)):
+    print(f"{'n':>8} {'legacy (ms)':>12} {'from_dict (ms)':>15} {'trusted (ms)':>13} {'speedup':>8}")
+    for n in sizes:
+        records = make_records(n)
+        t_legacy = timed(legacy_from_dict, records)
+        t_checked = timed(Task.from_dict, records)
+        t_trusted = timed(Task.from_trusted_dict, records)
+        print(f"{n:>8} {t_legacy * 1e3:>12.1f} {t_checked * 1e3:>15.1f} {t_trusted * 1e3:>13.1f} {t_legacy / t_trusted:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
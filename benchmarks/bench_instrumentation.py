@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Benchmark : coût de l'instrumentation sur les appels du TaskManager, sans
+instrumentation, instrumenté, puis après uninstrument() (chemin désactivé).
+"""
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.task_manager.instrumentation import Instrumentation
+from src.task_manager.manager import TaskManager
+from src.task_manager.task import Priority
+
+
+def measure(manager, ids):
+    results = {}
+    start = time.perf_counter()
+    for task_id in ids:
+        manager.get_task(task_id)
+    results["get_task"] = (time.perf_counter() - start) / len(ids)
+    start = time.perf_counter()
+    for _ in range(len(ids) // 10):
+        manager.get_statistics()
+    results["get_statistics"] = (time.perf_counter() - start) / (len(ids) // 10)
+    start = time.perf_counter()
+    for task_id in ids[:len(ids) // 10]:
+        manager.get_task(task_id).update_priority(Priority.HIGH)
+        manager.get_task(task_id).update_priority(Priority.LOW)
+    results["mutation"] = (time.perf_counter() - start) / (len(ids) // 5)
+    return results
+
+
+def main(count=100_000, calls=200_000):
+    manager = TaskManager()
+    ids = manager.add_tasks([f"Task {i}" for i in range(count)])
+    ids = (ids * (calls // count + 1))[:calls]
+    instrumentation = Instrumentation()
+
+    runs = {"désactivé": measure(manager, ids)}
+    instrumentation.instrument(manager)
+    runs["instrumenté"] = measure(manager, ids)
+    instrumentation.uninstrument(manager)
+    runs["après retrait"] = measure(manager, ids)
+
+    print(f"{'':<16}" + "".join(f"{name:>16}" for name in runs["désactivé"]))
+    for label, results in runs.items():
+        print(f"{label:<16}" + "".join(f"{value * 1e6:13.3f} µs" for value in results.values()))
+
+    with tempfile.TemporaryDirectory() as tmp, instrumentation.profile(cpu=True) as capture:
+        manager.save_to_file(os.path.join(tmp, "tasks.json"))
+    print("\nProfil de save_to_file (5 premières lignes) :")
+    print(capture.stats(sort="cumulative", limit=5))
+
+
+if __name__ == "__main__":
+    main()
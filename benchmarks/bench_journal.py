@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Benchmark : coût d'écriture par mutation, save_to_file complet vs journal
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.task_manager.manager import TaskManager
+from src.task_manager.task import Priority
+
+
+def fill(manager, n):
+    return [manager.add_task(f"Task {i}", "Description", Priority.MEDIUM) for i in range(n)]
+
+
+def per_mutation(manager, ids, persist, mutations):
+    start = time.perf_counter()
+    for i in range(mutations):
+        manager.get_task(ids[i % len(ids)]).update_priority(Priority.HIGH if i % 2 else Priority.LOW)
+        persist()
+    return (time.perf_counter() - start) / mutations
+
+
+def main(sizes=(1_000, 10_000, 100_000), mutations=50):
+    print(f"{'n':>8} {'full save (us)':>16} {'journal (us)':>14}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            plain = TaskManager(str(Path(tmp) / f"plain_{n}.json"))
+            ids = fill(plain, n)
+            t_full = per_mutation(plain, ids, plain.save_to_file, mutations)
+
+            # Compaction désactivée pour ne mesurer que l'append
+            journaled = TaskManager(str(Path(tmp) / f"journal_{n}.json"), journal=True, compact_threshold=0)
+            ids = fill(journaled, n)
+            t_journal = per_mutation(journaled, ids, lambda: None, mutations)
+            journaled.close()
+
+            print(f"{n:>8} {t_full * 1e6:>16.1f} {t_journal * 1e6:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
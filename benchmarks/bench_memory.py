@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark mémoire : octets par tâche, objet avec __dict__ vs Task (__slots__) vs TaskTable
+"""
+import gc
+import sys
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.task_manager.columnar import TaskTable
+from src.task_manager.task import Task, Priority, Status
+
+
+class DictTask:
+    # Même structure que Task avant __slots__
+    def __init__(self, task_id, title, description, priority, created_at):
+        self.id = task_id
+        self.title = title
+        self.description = description
+        self.priority = priority
+        self.status = Status.TODO
+        self.created_at = created_at
+        self.completed_at = None
+        self.project_id = None
+
+
+def make_fields(n):
+    base = datetime(2024, 1, 1)
+    title, description = "Task", "Description"
+    return [(uuid.UUID(int=i + (1 << 100)), title, description, list(Priority)[i % 4], base + timedelta(seconds=i))
+            for i in range(n)]
+
+
+def build_dict_tasks(fields):
+    return [DictTask(str(u), t, d, p, c + timedelta(0)) for u, t, d, p, c in fields]
+
+
+def slot_task(u, t, d, p, c):
+    task = Task.__new__(Task)
+    task.id, task._title, task._description = str(u), t, d
+    task._priority, task._status = p, Status.TODO
+    task._created_at, task._completed_at = c + timedelta(0), None
+    task._project_id, task._due_at, task._observers = None, None, ()
+    return task
+
+
+def build_slot_tasks(fields):
+    return [slot_task(*f) for f in fields]
+
+
+def build_table(fields):
+    # Les Task intermédiaires sont libérées aussitôt ajoutées
+    return TaskTable(slot_task(*f) for f in fields)
+
+
+def measure(builder, fields):
+    gc.collect()
+    tracemalloc.start()
+    result = builder(fields)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current / len(fields)
+
+
+def main(n=100_000):
+    fields = make_fields(n)
+    print(f"{n} tâches (titres et descriptions partagés, non comptés)")
+    for name, builder in (("dict-based object", build_dict_tasks),
+                          ("Task (__slots__)", build_slot_tasks),
+                          ("TaskTable", build_table)):
+        print(f"  {name:<20} {measure(builder, fields):>8.1f} bytes/task")
+    # Compté ci-dessus ; détaillé car il grandit par paliers (puissances de deux)
+    table = build_table(fields)
+    print(f"  {'dont index des ids':<20} {table.index_nbytes() / n:>8.1f} bytes/task")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Benchmark : moteur de requêtes vs filtrage naïf par compréhension de liste
+"""
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.task_manager.manager import TaskManager
+from src.task_manager.task import Priority, Status
+
+BASE = datetime(2024, 1, 1)
+
+
+def build(n, seed=7):
+    rng = random.Random(seed)
+    manager = TaskManager("bench_tasks.json")
+    for i in range(n):
+        task = manager.get_task(manager.add_task(f"Task {i}", "", rng.choice(list(Priority))))
+        task.created_at = BASE + timedelta(minutes=rng.randrange(365 * 24 * 60))
+        task.assign_to_project(f"project-{rng.randrange(200)}")
+        if rng.random() < 0.4:
+            task.mark_completed()
+    return manager
+
+
+def timed(fn, repeat=5):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - start) / repeat * 1e3, result
+
+
+def main(n=200_000):
+    manager = build(n)
+    tasks = list(manager.tasks)
+    week = (BASE + timedelta(days=100), BASE + timedelta(days=107))
+
+    cases = {
+        "urgent, not done, project, last week, page 3": (
+            lambda: sorted([t for t in tasks if t.priority == Priority.URGENT and t.status != Status.DONE
+                            and t.project_id == "project-42" and week[0] <= t.created_at < week[1]],
+                           key=lambda t: (t.created_at, t.id))[20:30],
+            lambda: (manager.query().priority(Priority.URGENT).exclude_status(Status.DONE).project("project-42")
+                     .created_between(*week).order_by("created_at").offset(20).limit(10))),
+        "10 oldest todo": (
+            lambda: sorted([t for t in tasks if t.status == Status.TODO], key=lambda t: (t.created_at, t.id))[:10],
+            lambda: manager.query().status(Status.TODO).order_by("created_at").limit(10)),
+        "one project": (
+            lambda: [t for t in tasks if t.project_id == "project-7"],
+            lambda: manager.query().project("project-7")),
+        "title substring": (
+            lambda: [t for t in tasks if "task 1999" in t.title.casefold()],
+            lambda: manager.query().title_contains("task 1999")),
+    }
+    # Construit l'index trié sur created_at avant les mesures
+    manager.query().order_by("created_at").first()
+    print(f"n={n}")
+    for name, (naive, build_query) in cases.items():
+        t_naive, expected = timed(naive)
+        t_query, result = timed(lambda: build_query().all())
+        assert [t.id for t in result] == [t.id for t in expected] or name == "one project"
+        print(f"  {name:<46} naive {t_naive:8.2f} ms  query {t_query:8.2f} ms  plan: {build_query().explain()}")
+
+
+if __name__ == "__main__":
+    main()
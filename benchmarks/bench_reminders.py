@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark : rappels d'échéance, scan complet des tâches à chaque tick vs
+ReminderScheduler (tas indexé par heure d'envoi).
+"""
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.task_manager.reminders import ReminderScheduler
+from src.task_manager.task import Task, Priority, Status
+
+
+class NullEmailService:
+    sent = 0
+
+    def _is_valid_email(self, email):
+        return True
+
+    def send_task_reminder(self, email, task_title, due_date):
+        NullEmailService.sent += 1
+        return True
+
+
+def make_tasks(count, start):
+    rng = random.Random(42)
+    priorities = list(Priority)
+    return [Task(f"Task {i}", priority=rng.choice(priorities),
+                 due_at=start + timedelta(seconds=rng.randrange(7 * 24 * 3600)))
+            for i in range(count)]
+
+
+def scan_tick(tasks, reminded, now, service):
+    for task in tasks:
+        if task.due_at <= now and task.status is Status.TODO and task.id not in reminded:
+            reminded.add(task.id)
+            service.send_task_reminder("user@example.com", task.title, task.due_at)
+
+
+def main(count=200_000, ticks=100):
+    start = datetime(2024, 1, 1)
+    tasks = make_tasks(count, start)
+    service = NullEmailService()
+    step = timedelta(minutes=1)
+    print(f"{count} tâches, {ticks} ticks d'une minute")
+
+    reminded = set()
+    t0 = time.perf_counter()
+    for tick in range(ticks):
+        scan_tick(tasks, reminded, start + tick * step, service)
+    scan = time.perf_counter() - t0
+    print(f"  scan complet    : {scan / ticks * 1000:8.2f} ms/tick  ({len(reminded)} rappels)")
+
+    scheduler = ReminderScheduler(service)
+    t0 = time.perf_counter()
+    scheduler.schedule_many((task, "user@example.com") for task in tasks)
+    build = time.perf_counter() - t0
+    NullEmailService.sent = 0
+    t0 = time.perf_counter()
+    for tick in range(ticks):
+        scheduler.run_pending(start + tick * step)
+    heap = time.perf_counter() - t0
+    print(f"  planificateur   : {heap / ticks * 1000:8.2f} ms/tick  ({NullEmailService.sent} rappels, "
+          f"chargement {build:.2f}s)")
+
+    t0 = time.perf_counter()
+    for task in tasks[:10_000]:
+        task.update_priority(Priority.URGENT if task.priority is not Priority.URGENT else Priority.LOW)
+    print(f"  10k repriorisations : {(time.perf_counter() - t0) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Benchmark : rapport sur 30 jours, 30 appels à generate_daily_report vs
+ReportAggregator (un parcours, puis lecture des seaux journaliers).
+"""
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.task_manager.analytics import ReportAggregator
+from src.task_manager.services import ReportService
+from src.task_manager.task import Task, Priority
+
+
+def make_tasks(count, start):
+    rng = random.Random(42)
+    tasks = []
+    for i in range(count):
+        task = Task(f"Task {i}", priority=rng.choice(list(Priority)))
+        task._created_at = start + timedelta(seconds=rng.randrange(90 * 24 * 3600))
+        if rng.random() < 0.6:
+            task.mark_completed()
+            task.completed_at = task.created_at + timedelta(hours=rng.randrange(1, 200))
+        tasks.append(task)
+    return tasks
+
+
+def main(count=200_000, days=30):
+    start = datetime(2024, 1, 1)
+    tasks = make_tasks(count, start)
+    service = ReportService()
+    print(f"{count} tâches, rapport sur {days} jours")
+
+    t0 = time.perf_counter()
+    daily = [service.generate_daily_report(tasks, start + timedelta(days=d)) for d in range(days)]
+    print(f"  {days} x generate_daily_report : {time.perf_counter() - t0:.3f}s")
+
+    t0 = time.perf_counter()
+    aggregator = ReportAggregator(tasks)
+    build = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    report = aggregator.range_report(start, start + timedelta(days=days - 1))
+    aggregator.throughput(start, start + timedelta(days=days - 1))
+    aggregator.completion_time_percentiles()
+    query = time.perf_counter() - t0
+    assert report["days"] == daily
+    print(f"  agrégation (un parcours)      : {build:.3f}s")
+    print(f"  rapport + débit + percentiles : {query * 1000:.2f} ms")
+
+    t0 = time.perf_counter()
+    for task in tasks[:10_000]:
+        aggregator.update(task)
+    print(f"  10k mises à jour incrémentales : {(time.perf_counter() - t0) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
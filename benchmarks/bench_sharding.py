@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark : ShardedTaskManager avec 1, 2 et 4 shards (un processus chacun).
+
+Mesure le débit d'insertion groupée, de recherche plein texte et de filtres
+répartis sur tous les shards, ainsi que les lectures par id routées depuis
+plusieurs threads. Le gain attendu suit le nombre de cœurs disponibles : sur
+une machine à un seul cœur, les shards ne font qu'ajouter des échanges.
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.task_manager.sharding import ShardedTaskManager
+from src.task_manager.task import Status
+
+WORDS = ["report", "review", "client", "budget", "deploy", "release", "meeting", "invoice", "backup", "audit"]
+
+
+def make_titles(count):
+    return [f"{WORDS[i % 10]} {WORDS[i * 7 % 10]} {WORDS[i * 3 % 10]} task {i}" for i in range(count)]
+
+
+def timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def routed_reads(manager, ids, threads):
+    # Chaque thread lit sa part des ids, un aller-retour par lecture
+    parts = [ids[index::threads] for index in range(threads)]
+    workers = [threading.Thread(target=lambda part=part: [manager.get_task(task_id) for task_id in part])
+               for part in parts]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start
+
+
+def run(shards, titles, searches, reads):
+    with tempfile.TemporaryDirectory() as tmp:
+        with ShardedTaskManager(os.path.join(tmp, "tasks.json"), shards=shards) as manager:
+            ids = []
+            chunk = 10_000
+            insert = timed(lambda: [ids.extend(manager.add_tasks(titles[start:start + chunk]))
+                                    for start in range(0, len(titles), chunk)])
+            # Premier appel : construction des index de recherche dans chaque shard
+            manager.search("report")
+            search = timed(lambda: [manager.search(f"{WORDS[i % 10]} {WORDS[i * 3 % 10][:3]}", limit=20)
+                                    for i in range(searches)])
+            filters = timed(lambda: [manager.get_tasks_by_status(Status.TODO) for _ in range(3)])
+            lookups = routed_reads(manager, ids[:reads], threads=shards)
+    return {
+        "insertion (tâches/s)": len(titles) / insert,
+        "recherche (req/s)": searches / search,
+        "filtre statut (req/s)": 3 / filters,
+        "lecture routée (req/s)": reads / lookups,
+    }
+
+
+def main(count=100_000, searches=200, reads=20_000):
+    print(f"{count} tâches, {os.cpu_count()} cœur(s) disponible(s)")
+    titles = make_titles(count)
+    baseline = None
+    for shards in (1, 2, 4):
+        results = run(shards, titles, searches, reads)
+        baseline = baseline or results
+        print(f"{shards} shard(s)")
+        for label, value in results.items():
+            print(f"  {label:<24}: {value:12,.1f}   x{value / baseline[label]:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Benchmark : démarrage à froid, load_from_file JSON vs snapshot binaire mappé
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.task_manager.manager import TaskManager
+from src.task_manager.task import Priority
+
+
+def main(n=200_000):
+    with tempfile.TemporaryDirectory() as tmp:
+        json_file = str(Path(tmp) / "tasks.json")
+        binary_file = str(Path(tmp) / "tasks.bin")
+        manager = TaskManager(json_file)
+        ids = [manager.add_task(f"Task {i}", "Description", list(Priority)[i % 4]) for i in range(n)]
+        manager.save_to_file()
+        manager.save_to_file(binary_file, format="binary")
+        target = ids[n // 2]
+
+        for label, fmt, path in (("json", "json", json_file), ("binary", "binary", binary_file)):
+            start = time.perf_counter()
+            cold = TaskManager(path)
+            cold.load_from_file(format=fmt)
+            loaded = time.perf_counter()
+            cold.get_task(target)
+            looked_up = time.perf_counter()
+            cold.get_statistics()
+            done = time.perf_counter()
+            cold.close()
+            print(f"{label:<7} n={n} load {1e3 * (loaded - start):8.1f} ms"
+                  f"  get_task {1e3 * (looked_up - loaded):6.2f} ms"
+                  f"  get_statistics {1e3 * (done - looked_up):6.2f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
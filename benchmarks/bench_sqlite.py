@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Benchmark : store SQLite vs fichier JSON (TaskManager en mémoire).
+
+Compare l'ouverture (chargement complet du JSON vs connexion à la base), la
+sauvegarde après une mutation, les lectures par id, les filtres et les
+statistiques, ainsi que la migration JSON -> SQLite.
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.dataset import write_dataset
+from src.task_manager.manager import TaskManager
+from src.task_manager.sqlite_store import migrate_from_json
+from src.task_manager.task import Priority, Status
+
+
+def timed(function, repeat=1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat
+
+
+def workload(manager, ids, fmt):
+    results = {}
+    sample = random.Random(1).sample(ids, 2000)
+    # Lectures froides : premier accès à chaque id
+    results["get_task (froid)"] = timed(lambda: [manager.get_task(task_id) for task_id in sample]) / len(sample)
+    results["get_task (chaud)"] = timed(lambda: [manager.get_task(task_id) for task_id in sample]) / len(sample)
+    results["get_tasks_by_priority"] = timed(lambda: manager.get_tasks_by_priority(Priority.URGENT), 3)
+    results["count DONE"] = timed(lambda: manager.tasks.count_by_status(Status.DONE), 100)
+    results["get_statistics"] = timed(manager.get_statistics, 20)
+    results["mutation + save"] = timed(lambda: (manager.get_task(sample[0]).update_priority(Priority.HIGH),
+                                                manager.get_task(sample[0]).update_priority(Priority.LOW),
+                                                manager.save_to_file(format=fmt)), 3)
+    return results
+
+
+def main(count=200_000):
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, "tasks.json")
+        db_path = os.path.join(tmp, "tasks.db")
+        write_dataset(json_path, count, seed=3)
+        migration = timed(lambda: migrate_from_json(json_path, db_path))
+        print(f"{count} tâches ; migration JSON -> SQLite : {migration:.2f}s")
+
+        json_manager = TaskManager(json_path)
+        json_open = timed(json_manager.load_from_file)
+        ids = [task.id for task in json_manager.tasks]
+        sqlite_manager = TaskManager(db_path)
+        sqlite_open = timed(lambda: sqlite_manager.load_from_file(format="sqlite"))
+
+        json_results = workload(json_manager, ids, "json")
+        sqlite_results = workload(sqlite_manager, ids, "sqlite")
+        sqlite_manager.close()
+
+        print(f"{'':<24}{'JSON':>14}{'SQLite':>14}")
+        print(f"{'ouverture':<24}{json_open * 1e3:11.1f} ms{sqlite_open * 1e3:11.1f} ms")
+        for label in json_results:
+            print(f"{label:<24}{json_results[label] * 1e6:11.1f} µs{sqlite_results[label] * 1e6:11.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
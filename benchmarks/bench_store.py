@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Benchmark : recherche par id et filtres, liste brute vs TaskStore indexé
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.task_manager.store import TaskStore
+from src.task_manager.task import Task, Priority, Status
+
+
+def make_tasks(n, seed=42):
+    rng = random.Random(seed)
+    priorities = list(Priority)
+    tasks = []
+    for i in range(n):
+        task = Task(f"Task {i}", priority=rng.choice(priorities))
+        if rng.random() < 0.3:
+            task.mark_completed()
+        tasks.append(task)
+    return tasks
+
+
+def timed(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main(sizes=(1_000, 10_000, 100_000)):
+    print(f"{'n':>8} {'op':<18} {'list (us)':>12} {'store (us)':>12} {'speedup':>9}")
+    for n in sizes:
+        tasks = make_tasks(n)
+        store = TaskStore(tasks)
+        rng = random.Random(n)
+        ids = [rng.choice(tasks).id for _ in range(200)]
+
+        def list_lookup():
+            for task_id in ids:
+                next((t for t in tasks if t.id == task_id), None)
+
+        def store_lookup():
+            for task_id in ids:
+                store.get(task_id)
+
+        def list_filter():
+            return [t for t in tasks if t.status == Status.DONE]
+
+        def store_filter():
+            return store.by_status(Status.DONE)
+
+        for op, naive, indexed, repeat in (
+            ("get_task x200", list_lookup, store_lookup, 3),
+            ("by_status(DONE)", list_filter, store_filter, 20),
+        ):
+            t_list = timed(naive, repeat) * 1e6
+            t_store = timed(indexed, repeat) * 1e6
+            print(f"{n:>8} {op:<18} {t_list:>12.1f} {t_store:>12.1f} {t_list / t_store:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
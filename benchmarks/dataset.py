@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Générateur déterministe de tâches synthétiques pour les benchmarks.
+
+Même graine, mêmes paramètres : mêmes tâches, ids et dates compris. Les
+répartitions de priorités et de statuts, la longueur des textes, les projets
+et les échéances sont réglables. En ligne de commande, écrit un fichier au
+format de TaskManager.save_to_file :
+
+    python benchmarks/dataset.py 1M tasks_1m.json --seed 7
+"""
+import argparse
+import json
+import random
+import sys
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.task_manager.task import Task, Priority, Status
+
+WORDS = ("report review client budget deploy release meeting invoice backup audit design migrate "
+         "database server update plan roadmap sprint hiring onboarding support ticket email call "
+         "contract legal security patch test refactor document analytics dashboard").split()
+DEFAULT_PRIORITIES = {Priority.LOW: 0.25, Priority.MEDIUM: 0.4, Priority.HIGH: 0.25, Priority.URGENT: 0.1}
+DEFAULT_STATUSES = {Status.TODO: 0.45, Status.IN_PROGRESS: 0.2, Status.DONE: 0.3, Status.CANCELLED: 0.05}
+START = datetime(2024, 1, 1)
+_SIZE_SUFFIXES = {"k": 1_000, "m": 1_000_000}
+
+
+def parse_size(text) -> int:
+    # "1000", "10k", "1M"
+    text = str(text).strip().lower()
+    if text[-1:] in _SIZE_SUFFIXES:
+        return int(float(text[:-1]) * _SIZE_SUFFIXES[text[-1]])
+    return int(text)
+
+
+def format_size(count) -> str:
+    for suffix, factor in (("M", 1_000_000), ("k", 1_000)):
+        if count >= factor and count % factor == 0:
+            return f"{count // factor}{suffix}"
+    return str(count)
+
+
+def _words(rng, bounds):
+    low, high = bounds
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(low, high)))
+
+
+def iter_task_dicts(count, seed=0, priorities=None, statuses=None, title_words=(2, 6),
+                    description_words=(0, 20), projects=10, due_ratio=0.5, days=365):
+    """Produit ``count`` tâches au format de Task.to_dict.
+
+    ``priorities`` et ``statuses`` sont des poids par membre d'enum, les
+    bornes de ``title_words`` et ``description_words`` sont inclusives.
+    ``projects`` est le nombre de projets (0 : aucun), les créations sont
+    réparties sur ``days`` jours à partir du 1er janvier 2024.
+    """
+    rng = random.Random(seed)
+    priorities = priorities or DEFAULT_PRIORITIES
+    statuses = statuses or DEFAULT_STATUSES
+    priority_values, priority_weights = [p.value for p in priorities], list(priorities.values())
+    status_values, status_weights = [s.value for s in statuses], list(statuses.values())
+    project_ids = [f"project-{index}" for index in range(projects)]
+    for index in range(count):
+        created = START + timedelta(seconds=rng.randrange(days * 86400))
+        status = rng.choices(status_values, status_weights)[0]
+        completed = None
+        if status == Status.DONE.value:
+            completed = (created + timedelta(minutes=rng.randrange(1, 14 * 1440))).isoformat()
+        due = None
+        if rng.random() < due_ratio:
+            due = (created + timedelta(hours=rng.randrange(1, 60 * 24))).isoformat()
+        yield {
+            "id": str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+            "title": f"{_words(rng, title_words)} {index}",
+            "description": _words(rng, description_words),
+            "priority": rng.choices(priority_values, priority_weights)[0],
+            "status": status,
+            "created_at": created.isoformat(),
+            "completed_at": completed,
+            "project_id": rng.choice(project_ids) if project_ids and rng.random() < 0.8 else None,
+            "due_at": due
+        }
+
+
+def generate_tasks(count, seed=0, **options):
+    # Options : voir iter_task_dicts
+    return [Task.from_trusted_dict(data) for data in iter_task_dicts(count, seed, **options)]
+
+
+def write_dataset(filename, count, seed=0, **options) -> int:
+    # Fichier JSON au format de save_to_file, écrit tâche par tâche
+    with open(filename, "w", encoding="utf-8") as f:
+        f.write("[")
+        for index, data in enumerate(iter_task_dicts(count, seed, **options)):
+            f.write(",\n" if index else "\n")
+            json.dump(data, f)
+        f.write("\n]\n")
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("count", type=parse_size, help="nombre de tâches (1000, 10k, 1M...)")
+    parser.add_argument("output", help="fichier JSON à écrire")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--projects", type=int, default=10)
+    parser.add_argument("--title-words", type=int, nargs=2, default=(2, 6), metavar=("MIN", "MAX"))
+    parser.add_argument("--description-words", type=int, nargs=2, default=(0, 20), metavar=("MIN", "MAX"))
+    parser.add_argument("--done-ratio", type=float, default=None,
+                        help="part des tâches terminées (le reste garde les proportions par défaut)")
+    args = parser.parse_args(argv)
+    statuses = None
+    if args.done_ratio is not None:
+        others = {status: weight for status, weight in DEFAULT_STATUSES.items() if status is not Status.DONE}
+        scale = (1 - args.done_ratio) / sum(others.values())
+        statuses = {status: weight * scale for status, weight in others.items()}
+        statuses[Status.DONE] = args.done_ratio
+    write_dataset(args.output, args.count, args.seed, statuses=statuses, projects=args.projects,
+                  title_words=tuple(args.title_words), description_words=tuple(args.description_words))
+    print(f"{args.count} tâches écrites dans {args.output}")
+
+
+if __name__ == "__main__":
+    main()
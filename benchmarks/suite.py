@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Suite de benchmarks des chemins critiques du task_manager, sur les jeux de
+données synthétiques de benchmarks/dataset.py (de 1k à 10M tâches).
+
+Chaque cas est répété ``--repeat`` fois ; on retient la médiane du temps par
+opération. Les résultats sont écrits en JSON et peuvent être comparés à une
+référence : un cas plus lent que la référence au-delà de la tolérance fait
+échouer la commande (code de sortie 1).
+
+    python benchmarks/suite.py --sizes 1k,10k,100k --output bench_results.json
+    python benchmarks/suite.py --save-baseline bench_baseline.json
+    python benchmarks/suite.py --baseline bench_baseline.json --tolerance 0.25
+
+La référence dépend de la machine : elle n'est pas versionnée et se génère
+sur la machine de mesure (make bench-check la crée au premier passage). Une
+référence mesurée ailleurs est refusée (code de sortie 2) au lieu d'être
+comparée. Compter quelques Go de mémoire par million de tâches au-delà de 1M.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.dataset import format_size, generate_tasks, iter_task_dicts, parse_size
+from src.task_manager.manager import TaskManager
+from src.task_manager.services import ReportService
+from src.task_manager.task import Task, Priority, Status
+
+DEFAULT_SIZES = "1k,10k,100k"
+# Champs de meta qui identifient la machine de mesure
+HOST_FIELDS = ("host", "platform", "python", "cpu_count")
+# Nombre maximal d'opérations unitaires par répétition
+SAMPLE = 10_000
+perf_counter = time.perf_counter
+
+
+class Bench:
+    """Jeu de données d'une taille donnée, chargé dans un TaskManager."""
+
+    def __init__(self, size, seed, directory):
+        self.size = size
+        self.seed = seed
+        self.path = os.path.join(directory, f"tasks_{size}.json")
+        self.csv_path = os.path.join(directory, f"tasks_{size}.csv")
+        self.manager = TaskManager(self.path)
+        self.manager.tasks = generate_tasks(size, seed)
+        self.manager.save_to_file()
+        rng = random.Random(seed)
+        ids = [task.id for task in self.manager.tasks]
+        self.sample_ids = rng.sample(ids, min(SAMPLE, size))
+        self.report_date = datetime(2024, 6, 1)
+
+
+def case_add_task(bench):
+    titles = [f"New task {index}" for index in range(min(SAMPLE, bench.size))]
+    manager = bench.manager
+    start = perf_counter()
+    ids = [manager.add_task(title, "", Priority.HIGH) for title in titles]
+    elapsed = perf_counter() - start
+    manager.delete_tasks(ids)
+    return len(ids), elapsed
+
+
+def case_get_task(bench):
+    get_task = bench.manager.get_task
+    # Sur les petits jeux, l'échantillon est parcouru plusieurs fois
+    ids = bench.sample_ids * max(1, SAMPLE // len(bench.sample_ids))
+    start = perf_counter()
+    for task_id in ids:
+        get_task(task_id)
+    return len(ids), perf_counter() - start
+
+
+def case_delete_task(bench):
+    manager = bench.manager
+    tasks = [manager.get_task(task_id) for task_id in bench.sample_ids]
+    start = perf_counter()
+    for task in tasks:
+        manager.delete_task(task.id)
+    elapsed = perf_counter() - start
+    for task in tasks:
+        manager._insert(task)
+    return len(tasks), elapsed
+
+
+def _repeated(function, calls):
+    start = perf_counter()
+    for _ in range(calls):
+        function()
+    return calls, perf_counter() - start
+
+
+def case_filter_status(bench):
+    return _repeated(lambda: bench.manager.get_tasks_by_status(Status.TODO), 5)
+
+
+def case_filter_priority(bench):
+    return _repeated(lambda: bench.manager.get_tasks_by_priority(Priority.HIGH), 5)
+
+
+def case_filter_project(bench):
+    return _repeated(lambda: bench.manager.get_tasks_by_project("project-3"), 5)
+
+
+def case_get_statistics(bench):
+    return _repeated(bench.manager.get_statistics, 1000)
+
+
+def case_save_to_file(bench):
+    return _repeated(bench.manager.save_to_file, 1)
+
+
+def case_load_from_file(bench):
+    return _repeated(TaskManager(bench.path).load_from_file, 1)
+
+
+def case_from_dict(bench):
+    dicts = list(iter_task_dicts(min(SAMPLE, bench.size), bench.seed + 1))
+    from_dict = Task.from_dict
+    start = perf_counter()
+    for data in dicts:
+        from_dict(data)
+    return len(dicts), perf_counter() - start
+
+
+def case_daily_report(bench):
+    service = ReportService()
+    return _repeated(lambda: service.generate_daily_report(bench.manager.tasks, bench.report_date), 1)
+
+
+def case_export_tasks_csv(bench):
+    service = ReportService()
+    return _repeated(lambda: service.export_tasks_csv(bench.manager.tasks, bench.csv_path), 1)
+
+
+CASES = {
+    "add_task": case_add_task,
+    "get_task": case_get_task,
+    "delete_task": case_delete_task,
+    "filter_status": case_filter_status,
+    "filter_priority": case_filter_priority,
+    "filter_project": case_filter_project,
+    "get_statistics": case_get_statistics,
+    "save_to_file": case_save_to_file,
+    "load_from_file": case_load_from_file,
+    "from_dict": case_from_dict,
+    "daily_report": case_daily_report,
+    "export_tasks_csv": case_export_tasks_csv,
+}
+
+
+def run_suite(sizes, cases=None, repeat=5, seed=0, progress=None) -> dict:
+    """Exécute les cas sur chaque taille et renvoie les résultats (dict JSON)."""
+    cases = list(cases or CASES)
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            bench = Bench(size, seed, directory)
+            for case in cases:
+                timings = []
+                for _ in range(repeat):
+                    ops, elapsed = CASES[case](bench)
+                    timings.append(elapsed / ops)
+                median = statistics.median(timings)
+                key = f"{case}@{format_size(size)}"
+                results[key] = {
+                    "case": case,
+                    "size": size,
+                    "ops": ops,
+                    "repeat": repeat,
+                    "median_us": median * 1e6,
+                    "min_us": min(timings) * 1e6,
+                    "ops_per_sec": 1 / median if median else None,
+                }
+                if progress is not None:
+                    progress(key, results[key])
+            bench.manager.close()
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "host": platform.node(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "sizes": list(sizes),
+            "repeat": repeat,
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+
+def host_mismatch(current, baseline):
+    """Champs de HOST_FIELDS qui diffèrent entre les deux résultats : une
+    référence d'une autre machine ne dit rien des temps mesurés ici."""
+    return [field for field in HOST_FIELDS
+            if current["meta"].get(field) != baseline.get("meta", {}).get(field)]
+
+
+def compare(current, baseline, tolerance=0.25):
+    """Compare deux résultats ; renvoie (lignes, régressions).
+
+    Une ligne est (clé, référence µs, actuel µs, ratio). Un cas régresse si
+    sa médiane dépasse celle de la référence de plus de ``tolerance``.
+    """
+    rows = []
+    regressions = []
+    for key, result in current["results"].items():
+        reference = baseline["results"].get(key)
+        if reference is None:
+            continue
+        ratio = result["median_us"] / reference["median_us"] if reference["median_us"] else 1.0
+        row = (key, reference["median_us"], result["median_us"], ratio)
+        rows.append(row)
+        if ratio > 1 + tolerance:
+            regressions.append(row)
+    return rows, regressions
+
+
+def _print_result(key, result):
+    print(f"{key:<28} {result['median_us']:14.3f} µs/op {result['ops_per_sec'] or 0:16,.1f} op/s", flush=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Suite de benchmarks du task_manager")
+    parser.add_argument("--sizes", help=f"tailles séparées par des virgules (défaut {DEFAULT_SIZES}, "
+                                        "ou celles de la référence)")
+    parser.add_argument("--cases", help="cas séparés par des virgules : " + ",".join(CASES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="fichier JSON des résultats")
+    parser.add_argument("--baseline", help="référence à comparer ; échoue en cas de régression")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="ralentissement toléré (0.25 = +25%%)")
+    parser.add_argument("--save-baseline", help="écrit les résultats comme nouvelle référence")
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    if args.sizes:
+        sizes = [parse_size(size) for size in args.sizes.split(",")]
+    elif baseline is not None:
+        sizes = baseline["meta"]["sizes"]
+    else:
+        sizes = [parse_size(size) for size in DEFAULT_SIZES.split(",")]
+    cases = args.cases.split(",") if args.cases else None
+    unknown = set(cases or ()) - set(CASES)
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(sorted(unknown))}")
+
+    current = run_suite(sizes, cases, args.repeat, args.seed, progress=_print_result)
+    for filename in (args.output, args.save_baseline):
+        if filename:
+            with open(filename, "w", encoding="utf-8") as f:
+                json.dump(current, f, indent=2)
+                f.write("\n")
+    if baseline is None:
+        return 0
+    mismatch = host_mismatch(current, baseline)
+    if mismatch:
+        print(f"\nRéférence mesurée sur une autre machine ({', '.join(mismatch)} différents) : "
+              f"régénérez-la ici avec --save-baseline (make bench-baseline)")
+        return 2
+
+    rows, regressions = compare(current, baseline, args.tolerance)
+    print(f"\n{'cas':<28} {'référence µs':>14} {'actuel µs':>14} {'ratio':>7}")
+    for key, reference, result, ratio in rows:
+        flag = "  RÉGRESSION" if ratio > 1 + args.tolerance else ""
+        print(f"{key:<28} {reference:14.3f} {result:14.3f} {ratio:7.2f}{flag}")
+    if regressions:
+        print(f"\n{len(regressions)} régression(s) au-delà de +{args.tolerance:.0%}")
+        return 1
+    print(f"\nAucune régression au-delà de +{args.tolerance:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
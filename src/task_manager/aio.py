@@ -0,0 +1,142 @@
+import asyncio
+
+from .manager import TaskManager
+from .services import EmailService, ReportService
+from .snapshot import write_snapshot
+from .streaming import iter_tasks_from_file, write_tasks
+from .task import Task
+
+
+def _write_json(filename, tasks):
+    with open(filename, "w", encoding="utf-8") as f:
+        write_tasks(f, tasks)
+
+
+def _read_json(filename):
+    try:
+        return list(iter_tasks_from_file(filename))
+    except FileNotFoundError:
+        return []
+
+
+class AsyncTaskManager:
+    """Façade asyncio autour d'un TaskManager.
+
+    Le gestionnaire n'est modifié que depuis la boucle d'événements ; la
+    lecture et le décodage des fichiers, la sérialisation et l'écriture sont
+    délégués à un exécuteur. Les sauvegardes demandées pendant qu'une écriture
+    est en cours sont regroupées en une seule écriture suivante.
+    """
+
+    def __init__(self, manager: TaskManager, executor=None, coalesce_delay=0.0):
+        self.manager = manager
+        self._executor = executor
+        self.coalesce_delay = coalesce_delay
+        self._next_save = None
+        self._writer = None
+
+    async def _run(self, function, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, function, *args)
+
+    async def load(self, filename=None):
+        manager = self.manager
+        if manager._uses_journal(filename):
+            try:
+                data = await self._run(manager._journal.load)
+            except (ValueError, KeyError, OSError) as e:
+                raise IOError(f"Failed to load tasks: {e}")
+            tasks = await self._run(lambda: [Task.from_trusted_dict(task_data) for task_data in data])
+            # Seul le remplacement du contenu se fait sur la boucle
+            manager._replace_tasks(tasks)
+            return
+        try:
+            tasks = await self._run(_read_json, filename if filename is not None else manager.storage_file)
+        except (ValueError, OSError) as e:
+            raise IOError(f"Failed to load tasks: {e}")
+        manager._load_tasks(tasks)
+
+    def save(self, filename=None, format="json"):
+        # Les sauvegardes vers storage_file sont regroupées ; les autres
+        # (autre fichier, format binaire) partent immédiatement
+        if filename not in (None, self.manager.storage_file) or format != "json":
+            return asyncio.ensure_future(self._save_once(filename, format))
+        if self._next_save is None:
+            self._next_save = asyncio.get_running_loop().create_future()
+        future = self._next_save
+        if self._writer is None or self._writer.done():
+            self._writer = asyncio.ensure_future(self._write_loop())
+        return future
+
+    async def flush(self):
+        if self._writer is not None:
+            await asyncio.shield(self._writer)
+
+    async def _write_loop(self):
+        while self._next_save is not None:
+            if self.coalesce_delay:
+                await asyncio.sleep(self.coalesce_delay)
+            future, self._next_save = self._next_save, None
+            try:
+                await self._save_once(None, "json")
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(None)
+
+    async def _save_once(self, filename, format):
+        manager = self.manager
+        if format == "json" and manager._uses_journal(filename):
+            await self._run(manager.save_to_file)
+            return
+        if filename is None:
+            filename = manager.storage_file
+        # Copie des tâches sur la boucle : l'exécuteur sérialise l'état du moment
+        # de l'appel, jamais une tâche en cours de modification
+        tasks = [task._detached_copy() for task in manager.tasks]
+        if format == "binary":
+            writer = write_snapshot
+        elif format == "json":
+            writer = _write_json
+        else:
+            raise ValueError(f"Unknown storage format: {format}")
+        try:
+            await self._run(writer, filename, tasks)
+        except OSError as e:
+            raise IOError(f"Failed to save tasks: {e}")
+
+    # Délégation des opérations en mémoire, qui ne bloquent pas
+    def __getattr__(self, name):
+        return getattr(self.manager, name)
+
+
+class AsyncReportService:
+    def __init__(self, report_service=None, executor=None):
+        self.report_service = report_service or ReportService()
+        self._executor = executor
+
+    def generate_daily_report(self, tasks, date=None):
+        return self.report_service.generate_daily_report(tasks, date)
+
+    async def export_tasks_csv(self, tasks, filename):
+        loop = asyncio.get_running_loop()
+        tasks = [task._detached_copy() for task in tasks]
+        await loop.run_in_executor(self._executor, self.report_service.export_tasks_csv, tasks, filename)
+
+
+class AsyncEmailService:
+    def __init__(self, email_service=None, executor=None):
+        self.email_service = email_service or EmailService()
+        self._executor = executor
+
+    async def _run(self, function, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, function, *args)
+
+    async def send_task_reminder(self, email, task_title, due_date) -> bool:
+        return await self._run(self.email_service.send_task_reminder, email, task_title, due_date)
+
+    async def send_completion_notification(self, email, task_title) -> bool:
+        return await self._run(self.email_service.send_completion_notification, email, task_title)
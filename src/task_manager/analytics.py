@@ -0,0 +1,179 @@
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List
+
+from .task import Task, Status
+
+
+def _day(value):
+    return value.date() if isinstance(value, datetime) else value
+
+
+def _rate(done, total):
+    # Même convention que generate_daily_report : 0 (entier) sans tâche
+    return done / total * 100 if total else 0
+
+
+class ReportAggregator:
+    """Agrégats de reporting tenus par jour, par projet et par durée.
+
+    Chaque tâche est comptée une fois dans des seaux journaliers (créations,
+    créations terminées, fins) et par projet, avec sa durée de réalisation.
+    Un rapport sur une plage de jours ne lit que les seaux de ces jours, sans
+    reparcourir les tâches. update() recompte une seule tâche après une
+    mutation.
+    """
+
+    def __init__(self, tasks: Iterable[Task] = ()):
+        self._created = Counter()
+        self._created_done = Counter()
+        self._completed = Counter()
+        self._project_totals = Counter()
+        self._project_done = Counter()
+        # Durées triées, plus les ajouts et retraits pas encore fusionnés : les
+        # mises à jour sont en O(1), le tri se fait à la demande des percentiles
+        self._durations = []
+        self._added_durations = []
+        self._removed_durations = Counter()
+        self._counted = {}
+        self.add_many(tasks)
+
+    def __len__(self):
+        return len(self._counted)
+
+    def add(self, task: Task):
+        if task.id in self._counted:
+            self.remove(task.id)
+        created = task.created_at.date()
+        done = task.status is Status.DONE
+        completed = task.completed_at.date() if done and task.completed_at else None
+        duration = (task.completed_at - task.created_at).total_seconds() if completed else None
+        self._created[created] += 1
+        self._project_totals[task.project_id] += 1
+        if done:
+            self._created_done[created] += 1
+            self._project_done[task.project_id] += 1
+        if completed is not None:
+            self._completed[completed] += 1
+            self._added_durations.append(duration)
+        self._counted[task.id] = (created, task.project_id, done, completed, duration)
+
+    def add_many(self, tasks: Iterable[Task]):
+        for task in tasks:
+            self.add(task)
+
+    def remove(self, task_id):
+        counted = self._counted.pop(task_id, None)
+        if counted is None:
+            return
+        created, project_id, done, completed, duration = counted
+        self._decrement(self._created, created)
+        self._decrement(self._project_totals, project_id)
+        if done:
+            self._decrement(self._created_done, created)
+            self._decrement(self._project_done, project_id)
+        if completed is not None:
+            self._decrement(self._completed, completed)
+            self._removed_durations[duration] += 1
+
+    def update(self, task: Task):
+        self.add(task)
+
+    def clear(self):
+        self.__init__()
+
+    def _sorted_durations(self):
+        durations = self._durations
+        if self._added_durations:
+            durations.extend(self._added_durations)
+            durations.sort()
+            self._added_durations = []
+        if self._removed_durations:
+            removed = self._removed_durations
+            kept = []
+            for duration in durations:
+                if removed.get(duration):
+                    removed[duration] -= 1
+                else:
+                    kept.append(duration)
+            durations = self._durations = kept
+            self._removed_durations = Counter()
+        return durations
+
+    @staticmethod
+    def _decrement(counter, key):
+        counter[key] -= 1
+        if not counter[key]:
+            del counter[key]
+
+    def daily_report(self, date) -> dict:
+        # Même résultat que ReportService.generate_daily_report
+        day = _day(date)
+        created = self._created.get(day, 0)
+        done = self._created_done.get(day, 0)
+        return {
+            "date": day.strftime("%Y-%m-%d"),
+            "total_tasks_created": created,
+            "tasks_completed": done,
+            "completion_rate": _rate(done, created)
+        }
+
+    def range_report(self, start, end) -> dict:
+        # Jours de start à end inclus
+        start, end = _day(start), _day(end)
+        days = [self.daily_report(start + timedelta(days=offset)) for offset in range((end - start).days + 1)]
+        created = sum(day["total_tasks_created"] for day in days)
+        done = sum(day["tasks_completed"] for day in days)
+        return {
+            "start": start.strftime("%Y-%m-%d"),
+            "end": end.strftime("%Y-%m-%d"),
+            "total_tasks_created": created,
+            "tasks_completed": done,
+            "completion_rate": _rate(done, created),
+            "days": days
+        }
+
+    def weekly_report(self, date) -> dict:
+        # Semaine du lundi au dimanche contenant ``date``
+        day = _day(date)
+        monday = day - timedelta(days=day.weekday())
+        return self.range_report(monday, monday + timedelta(days=6))
+
+    def throughput(self, start, end) -> dict:
+        # Tâches terminées par jour de fin (et non de création)
+        start, end = _day(start), _day(end)
+        days = (end - start).days + 1
+        per_day = {}
+        for offset in range(days):
+            day = start + timedelta(days=offset)
+            per_day[day.strftime("%Y-%m-%d")] = self._completed.get(day, 0)
+        completed = sum(per_day.values())
+        return {"completed": completed, "per_day": per_day, "average_per_day": completed / days if days > 0 else 0}
+
+    def project_report(self, project_id) -> dict:
+        total = self._project_totals.get(project_id, 0)
+        done = self._project_done.get(project_id, 0)
+        return {
+            "project_id": project_id,
+            "total_tasks": total,
+            "completed_tasks": done,
+            "completion_rate": _rate(done, total)
+        }
+
+    def projects_report(self) -> List[dict]:
+        return [self.project_report(project_id) for project_id in self._project_totals]
+
+    def completion_time_percentiles(self, percentiles=(50, 90, 99)) -> Dict[int, timedelta]:
+        # Rang le plus proche sur les durées triées ; vide sans tâche terminée
+        durations = self._sorted_durations()
+        if not durations:
+            return {}
+        result = {}
+        for percentile in percentiles:
+            rank = max(1, int(-(-percentile * len(durations) // 100)))
+            result[percentile] = timedelta(seconds=durations[min(rank, len(durations)) - 1])
+        return result
+
+    def on_task_changed(self, task, field, old, new):
+        if field in ("status", "created_at", "completed_at", "project_id") and task.id in self._counted:
+            self.update(task)
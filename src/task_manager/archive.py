@@ -0,0 +1,109 @@
+import gzip
+import json
+import os
+from datetime import date, datetime, time
+from typing import Dict, Iterable, Iterator, List
+
+from .task import Task, Status
+
+ARCHIVED_STATUSES = (Status.DONE, Status.CANCELLED)
+_SEPARATORS = (",", ":")
+_GZIP_LEVEL = 6
+_PREFIX = "tasks-"
+_SUFFIX = ".jsonl.gz"
+
+
+def archived_at(task) -> datetime:
+    # Date d'archivage : la fin de la tâche, ou sa création pour une tâche
+    # annulée (ou passée à DONE sans mark_completed) qui n'a pas de fin
+    return task.completed_at or task.created_at
+
+
+def _archived_at(data) -> str:
+    return data["completed_at"] or data["created_at"]
+
+
+def _as_datetime(value) -> datetime:
+    return value if isinstance(value, datetime) else datetime.combine(value, time())
+
+
+def _bound(value):
+    # Bornes comparées aux dates ISO des fichiers, sans les parser
+    return value.isoformat() if isinstance(value, (date, datetime)) else value
+
+
+class TaskArchive:
+    """Archive compressée des tâches terminées, partitionnée par mois.
+
+    Chaque mois de fin (voir archived_at) a son fichier ``tasks-AAAA-MM.jsonl.gz``
+    : une tâche par ligne au format de Task.to_dict. Chaque ajout est un
+    membre gzip écrit à la fin du fichier, sans relire ni recompresser ce qui
+    précède. Une requête sur une plage de dates n'ouvre que les mois
+    concernés. Une tâche archivée deux fois (ajout interrompu puis repris)
+    n'est renvoyée qu'une fois.
+    """
+
+    def __init__(self, directory, fsync=True):
+        self.directory = directory
+        self.fsync = fsync
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{_PREFIX}{key}{_SUFFIX}")
+
+    def partitions(self) -> List[str]:
+        # Mois archivés ("2024-03"), dans l'ordre
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+        return sorted(name[len(_PREFIX):-len(_SUFFIX)] for name in names
+                      if name.startswith(_PREFIX) and name.endswith(_SUFFIX))
+
+    def add(self, tasks: Iterable[Task]) -> int:
+        groups: Dict[str, List[str]] = {}
+        for task in tasks:
+            data = task.to_dict()
+            groups.setdefault(_archived_at(data)[:7], []).append(json.dumps(data, separators=_SEPARATORS))
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            for key, lines in groups.items():
+                member = gzip.compress(("\n".join(lines) + "\n").encode("utf-8"), _GZIP_LEVEL)
+                with open(self._path(key), "ab") as f:
+                    f.write(member)
+                    f.flush()
+                    if self.fsync:
+                        os.fsync(f.fileno())
+        except OSError as e:
+            raise IOError(f"Failed to archive tasks: {e}")
+        return sum(len(lines) for lines in groups.values())
+
+    def iter_task_dicts(self, start=None, end=None) -> Iterator[dict]:
+        # Tâches archivées dans [start, end[ (dates ou datetimes), mois par mois
+        start, end = _bound(start), _bound(end)
+        seen = set()
+        for key in self.partitions():
+            if (start is not None and key < start[:7]) or (end is not None and key > end[:7]):
+                continue
+            try:
+                with gzip.open(self._path(key), "rt", encoding="utf-8") as f:
+                    for line in f:
+                        data = json.loads(line)
+                        moment = _archived_at(data)
+                        if (start is not None and moment < start) or (end is not None and moment >= end):
+                            continue
+                        if data["id"] in seen:
+                            continue
+                        seen.add(data["id"])
+                        yield data
+            except (OSError, EOFError, ValueError) as e:
+                raise IOError(f"Failed to read archive {key}: {e}")
+
+    def iter_tasks(self, start=None, end=None) -> Iterator[Task]:
+        for data in self.iter_task_dicts(start, end):
+            yield Task.from_trusted_dict(data)
+
+    def __iter__(self) -> Iterator[Task]:
+        return self.iter_tasks()
+
+    def count(self, start=None, end=None) -> int:
+        return sum(1 for _ in self.iter_task_dicts(start, end))
@@ -0,0 +1,352 @@
+import uuid
+import weakref
+from array import array
+from datetime import datetime, timedelta
+from typing import Iterator, List, Optional
+
+from .task import Task, Priority, Status
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_NO_TIME = -(2 ** 63)
+_NO_PROJECT = -1
+# Ligne supprimée : code absent de toutes les colonnes d'enums et de projets
+_DEAD = -2
+_ID_SIZE = 16
+# Cases de l'index des ids : vide, ou libérée par une suppression
+_EMPTY = -1
+_DELETED = -2
+_MIN_CAPACITY = 8
+# Les ids qui ne sont pas des UUID sont stockés à part, repérés par ce préfixe
+_FOREIGN_PREFIX = bytes(8)
+
+_PRIORITIES = list(Priority)
+_STATUSES = list(Status)
+_PRIORITY_CODES = {priority: code for code, priority in enumerate(_PRIORITIES)}
+_STATUS_CODES = {status: code for code, status in enumerate(_STATUSES)}
+
+
+def _to_micros(value):
+    if value is None:
+        return _NO_TIME
+    if value.tzinfo is not None:
+        raise ValueError("TaskTable only stores naive datetimes")
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _from_micros(value):
+    if value == _NO_TIME:
+        return None
+    return _EPOCH + timedelta(microseconds=value)
+
+
+class TaskTable:
+    """Table de tâches en colonnes, alternative compacte à TaskStore.
+
+    Les ids sont stockés en UUID binaires de 16 octets, les dates en
+    microsecondes depuis l'epoch (int64) et les enums en petits entiers, dans
+    des colonnes ``array``. Les Task renvoyées sont matérialisées à la demande
+    et les tâches ajoutées sont observées : leurs mutations (mark_completed,
+    update_priority, assign_to_project...) sont répercutées dans la table. Tant
+    qu'une Task est référencée ailleurs, get() renvoie ce même objet (cache
+    faible) ; la table ne garde pas d'objet Task par tâche.
+
+    La recherche par id passe par une table de hachage à adressage ouvert
+    dans un ``array`` d'entiers (numéros de ligne), de 8 à 16 octets par
+    tâche. Une suppression marque la ligne morte au lieu de décaler les
+    colonnes ; elles sont compactées quand la moitié des lignes sont mortes.
+    """
+
+    def __init__(self, tasks=()):
+        self._ids = bytearray()
+        self._titles = []
+        self._descriptions = []
+        self._priorities = array("b")
+        self._statuses = array("b")
+        self._created_at = array("q")
+        self._completed_at = array("q")
+        self._due_at = array("q")
+        self._projects = array("i")
+        self._project_values = []
+        self._project_codes = {}
+        self._foreign_ids = {}
+        self._foreign_values = []
+        self._index = array("i", [_EMPTY]) * _MIN_CAPACITY
+        # Cases non vides de l'index, libérées comprises
+        self._used = 0
+        self._dead = 0
+        # Task encore référencées ailleurs : get() renvoie le même objet
+        self._live = weakref.WeakValueDictionary()
+        self._listeners = []
+        for task in tasks:
+            self.add(task)
+
+    def add_listener(self, callback):
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        self._listeners.remove(callback)
+
+    def add(self, task: Task):
+        key = self._key(task.id, create=True)
+        if self._slot(key) != -1:
+            self.remove(task.id)
+        self._insert_key(key, len(self._titles))
+        self._ids += key
+        self._titles.append(task.title)
+        self._descriptions.append(task.description)
+        self._priorities.append(_PRIORITY_CODES[task.priority])
+        self._statuses.append(_STATUS_CODES[task.status])
+        self._created_at.append(_to_micros(task.created_at))
+        self._completed_at.append(_to_micros(task.completed_at))
+        self._due_at.append(_to_micros(task.due_at))
+        self._projects.append(self._project_code(task.project_id))
+        if self._on_task_changed not in task._observers:
+            task._add_observer(self._on_task_changed)
+        self._live[task.id] = task
+
+    def _detach(self, row):
+        # Tâche retirée : l'objet vivant cesse d'être observé, sinon une copie
+        task_id = self._id_at(row)
+        task = self._live.pop(task_id, None)
+        if task is None:
+            return self._materialize(row, observe=False)
+        task._remove_observer(self._on_task_changed)
+        return task
+
+    def remove(self, task_id) -> Optional[Task]:
+        row = self._row(task_id)
+        if row == -1:
+            return None
+        task = self._detach(row)
+        self._kill(row)
+        self._maybe_compact()
+        return task
+
+    def remove_many(self, task_ids) -> List[Task]:
+        # Tâches renvoyées dans l'ordre de la table, une compaction au plus
+        rows = sorted({row for row in map(self._row, task_ids) if row != -1})
+        removed = [self._detach(row) for row in rows]
+        for row in rows:
+            self._kill(row)
+        self._maybe_compact()
+        return removed
+
+    def _kill(self, row):
+        start = row * _ID_SIZE
+        self._index[self._slot(bytes(self._ids[start:start + _ID_SIZE]))] = _DELETED
+        self._titles[row] = self._descriptions[row] = None
+        self._priorities[row] = self._statuses[row] = self._projects[row] = _DEAD
+        self._dead += 1
+
+    def _maybe_compact(self):
+        if self._dead * 2 > len(self._titles):
+            self._compact()
+
+    def _compact(self):
+        # Retire les lignes mortes en reconstruisant chaque colonne une fois
+        statuses = self._statuses
+        keep = [row for row in range(len(self._titles)) if statuses[row] != _DEAD]
+        ids = bytes(self._ids)
+        self._ids[:] = b"".join(ids[row * _ID_SIZE:(row + 1) * _ID_SIZE] for row in keep)
+        for column in self._columns():
+            kept = [column[row] for row in keep]
+            column[:] = array(column.typecode, kept) if isinstance(column, array) else kept
+        self._dead = 0
+        self._rehash()
+
+    def _slot(self, key):
+        # Case de l'index qui contient la ligne de ``key``, ou -1
+        index = self._index
+        mask = len(index) - 1
+        ids = self._ids
+        slot = hash(key) & mask
+        while True:
+            row = index[slot]
+            if row == _EMPTY:
+                return -1
+            if row >= 0 and ids[row * _ID_SIZE:(row + 1) * _ID_SIZE] == key:
+                return slot
+            slot = (slot + 1) & mask
+
+    def _insert_key(self, key, row):
+        # Charge maximale 2/3, libérées comprises ; l'index est alors refait
+        if (self._used + 1) * 3 > len(self._index) * 2:
+            self._rehash(extra=1)
+        index = self._index
+        mask = len(index) - 1
+        slot = hash(key) & mask
+        while index[slot] >= 0:
+            slot = (slot + 1) & mask
+        if index[slot] == _EMPTY:
+            self._used += 1
+        index[slot] = row
+
+    def _rehash(self, extra=0):
+        # Taille : puissance de deux d'au moins deux fois le nombre de lignes vivantes
+        live = len(self._titles) - self._dead + extra
+        capacity = _MIN_CAPACITY
+        while capacity < 2 * live:
+            capacity *= 2
+        self._index = array("i", [_EMPTY]) * capacity
+        self._used = 0
+        statuses = self._statuses
+        ids = bytes(self._ids)
+        for row in range(len(self._titles)):
+            if statuses[row] != _DEAD:
+                self._insert_key(ids[row * _ID_SIZE:(row + 1) * _ID_SIZE], row)
+
+    def clear(self):
+        for task in list(self._live.values()):
+            task._remove_observer(self._on_task_changed)
+        listeners = self._listeners
+        self.__init__()
+        self._listeners = listeners
+
+    def get(self, task_id) -> Optional[Task]:
+        row = self._row(task_id)
+        return None if row == -1 else self._materialize(row)
+
+    def by_status(self, status: Status) -> List[Task]:
+        return self._select(self._statuses, _STATUS_CODES[status])
+
+    def by_priority(self, priority: Priority) -> List[Task]:
+        return self._select(self._priorities, _PRIORITY_CODES[priority])
+
+    def by_project(self, project_id) -> List[Task]:
+        if project_id is None:
+            return self._select(self._projects, _NO_PROJECT)
+        code = self._project_codes.get(project_id)
+        return [] if code is None else self._select(self._projects, code)
+
+    def count_by_status(self, status: Status) -> int:
+        return self._statuses.count(_STATUS_CODES[status])
+
+    def count_by_priority(self, priority: Priority) -> int:
+        return self._priorities.count(_PRIORITY_CODES[priority])
+
+    def count_by_project(self, project_id) -> int:
+        if project_id is None:
+            return self._projects.count(_NO_PROJECT)
+        code = self._project_codes.get(project_id)
+        return 0 if code is None else self._projects.count(code)
+
+    def nbytes(self) -> int:
+        # Taille des colonnes hors chaînes de caractères (titres, descriptions)
+        return len(self._ids) + sum(column.itemsize * len(column) for column in self._columns()
+                                    if isinstance(column, array))
+
+    def index_nbytes(self) -> int:
+        # Taille de l'index des ids, en plus de nbytes()
+        return self._index.itemsize * len(self._index)
+
+    def _columns(self):
+        return (self._titles, self._descriptions, self._priorities, self._statuses,
+                self._created_at, self._completed_at, self._due_at, self._projects)
+
+    def _key(self, task_id, create=False):
+        try:
+            value = uuid.UUID(task_id)
+        except (ValueError, TypeError, AttributeError):
+            value = None
+        if value is not None and str(value) == task_id and value.bytes[:8] != _FOREIGN_PREFIX:
+            return value.bytes
+        index = self._foreign_ids.get(task_id)
+        if index is None:
+            if not create:
+                return None
+            index = len(self._foreign_values)
+            self._foreign_ids[task_id] = index
+            self._foreign_values.append(task_id)
+        return _FOREIGN_PREFIX + index.to_bytes(8, "big")
+
+    def _id_at(self, row):
+        key = bytes(self._ids[row * _ID_SIZE:(row + 1) * _ID_SIZE])
+        if key[:8] == _FOREIGN_PREFIX:
+            return self._foreign_values[int.from_bytes(key[8:], "big")]
+        return str(uuid.UUID(bytes=key))
+
+    def _row(self, task_id):
+        key = self._key(task_id)
+        if key is None:
+            return -1
+        slot = self._slot(key)
+        return -1 if slot == -1 else self._index[slot]
+
+    def _project_code(self, project_id):
+        if project_id is None:
+            return _NO_PROJECT
+        code = self._project_codes.get(project_id)
+        if code is None:
+            code = len(self._project_values)
+            self._project_codes[project_id] = code
+            self._project_values.append(project_id)
+        return code
+
+    def _select(self, column, code):
+        return [self._materialize(row) for row, value in enumerate(column) if value == code]
+
+    def _materialize(self, row, observe=True):
+        task_id = self._id_at(row)
+        if observe:
+            task = self._live.get(task_id)
+            if task is not None:
+                return task
+        task = Task.__new__(Task)
+        task.id = task_id
+        task._title = self._titles[row]
+        task._description = self._descriptions[row]
+        task._priority = _PRIORITIES[self._priorities[row]]
+        task._status = _STATUSES[self._statuses[row]]
+        task._created_at = _from_micros(self._created_at[row])
+        task._completed_at = _from_micros(self._completed_at[row])
+        project = self._projects[row]
+        task._project_id = None if project == _NO_PROJECT else self._project_values[project]
+        task._due_at = _from_micros(self._due_at[row])
+        task._observers = (self._on_task_changed,) if observe else ()
+        if observe:
+            self._live[task_id] = task
+        return task
+
+    def _on_task_changed(self, task, field, old, new):
+        if self._live.get(task.id) is not task:
+            return
+        row = self._row(task.id)
+        if field == "status":
+            self._statuses[row] = _STATUS_CODES[new]
+            self._completed_at[row] = _to_micros(task.completed_at)
+        elif field == "priority":
+            self._priorities[row] = _PRIORITY_CODES[new]
+        elif field == "project_id":
+            self._projects[row] = self._project_code(new)
+        elif field == "created_at":
+            self._created_at[row] = _to_micros(new)
+        elif field == "completed_at":
+            self._completed_at[row] = _to_micros(new)
+        elif field == "due_at":
+            self._due_at[row] = _to_micros(new)
+        elif field == "title":
+            self._titles[row] = new
+        elif field == "description":
+            self._descriptions[row] = new
+        for callback in self._listeners:
+            callback(task, field, old, new)
+
+    def __len__(self):
+        return len(self._titles) - self._dead
+
+    def __iter__(self) -> Iterator[Task]:
+        statuses = self._statuses
+        return iter([self._materialize(row) for row in range(len(self._titles)) if statuses[row] != _DEAD])
+
+    def __contains__(self, task_id):
+        return self._row(task_id) != -1
+
+    def __getitem__(self, index):
+        # Accès positionnel : les lignes mortes sont d'abord retirées
+        if self._dead:
+            self._compact()
+        return self._materialize(range(len(self._titles))[index])
+
+    def __repr__(self):
+        return f"TaskTable({len(self)} tasks)"
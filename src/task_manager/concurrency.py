@@ -0,0 +1,231 @@
+import functools
+import threading
+from typing import Iterator, List
+
+from .manager import TaskManager
+from .query import Query
+from .store import TaskStore
+from .task import Task
+
+
+class _Held:
+    # Contexte sans générateur : @contextmanager coûte plus que la prise du verrou
+    __slots__ = ("_acquire", "_release")
+
+    def __init__(self, acquire, release):
+        self._acquire = acquire
+        self._release = release
+
+    def __enter__(self):
+        self._acquire()
+
+    def __exit__(self, exc_type, exc, tb):
+        self._release()
+
+
+class ReadWriteLock:
+    """Verrou lecteurs/rédacteur, avec priorité aux rédacteurs.
+
+    Plusieurs lecteurs peuvent tenir le verrou en même temps. Le rédacteur est
+    réentrant et peut aussi prendre le verrou en lecture ; un lecteur ne doit
+    pas demander le verrou en écriture (pas de promotion). Sans rédacteur, une
+    lecture ne coûte qu'une prise de verrou simple à l'entrée et à la sortie.
+    """
+
+    def __init__(self):
+        self._mutex = threading.Lock()
+        self._condition = threading.Condition(self._mutex)
+        self._readers = 0
+        self._writer = None
+        self._writer_depth = 0
+        self._waiting_writers = 0
+        self._read = _Held(self.acquire_read, self.release_read)
+        self._write = _Held(self.acquire_write, self.release_write)
+
+    def acquire_read(self):
+        with self._mutex:
+            if self._writer is None and not self._waiting_writers:
+                self._readers += 1
+                return
+            if self._writer == threading.get_ident():
+                self._writer_depth += 1
+                return
+            while self._writer is not None or self._waiting_writers:
+                self._condition.wait()
+            self._readers += 1
+
+    def release_read(self):
+        with self._mutex:
+            if self._writer is not None and self._writer == threading.get_ident():
+                self._release_writer()
+                return
+            self._readers -= 1
+            if not self._readers and self._waiting_writers:
+                self._condition.notify_all()
+
+    def acquire_write(self):
+        me = threading.get_ident()
+        with self._mutex:
+            if self._writer == me:
+                self._writer_depth += 1
+                return
+            self._waiting_writers += 1
+            try:
+                while self._writer is not None or self._readers:
+                    self._condition.wait()
+            finally:
+                self._waiting_writers -= 1
+            self._writer = me
+            self._writer_depth = 1
+
+    def release_write(self) -> bool:
+        # True quand le rédacteur a rendu sa dernière prise (réentrance)
+        with self._mutex:
+            return self._release_writer()
+
+    def _release_writer(self):
+        self._writer_depth -= 1
+        if self._writer_depth:
+            return False
+        self._writer = None
+        self._condition.notify_all()
+        return True
+
+    def read(self):
+        return self._read
+
+    def write(self):
+        return self._write
+
+
+class _LockedTaskStore(TaskStore):
+    # Les mutations faites directement sur une Task (mark_completed, ...) mettent
+    # à jour les index sous le verrou d'écriture ; le journal est écrit après
+    def __init__(self, lock):
+        self._lock = lock
+        self._after_write = None
+        super().__init__()
+
+    def _on_task_changed(self, task, field, old, new):
+        self._lock.acquire_write()
+        try:
+            super()._on_task_changed(task, field, old, new)
+        finally:
+            if self._lock.release_write() and self._after_write is not None:
+                self._after_write()
+
+
+class _LockedQuery(Query):
+    def __init__(self, store, lock):
+        super().__init__(store)
+        self._lock = lock
+
+    def __iter__(self) -> Iterator[Task]:
+        # Le résultat est matérialisé sous le verrou : un itérateur paresseux
+        # ne peut pas garder le verrou ouvert entre deux next()
+        with self._lock.read():
+            return iter(list(super().__iter__()))
+
+
+def _reading(method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        lock = self._lock
+        lock.acquire_read()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            lock.release_read()
+    return wrapper
+
+
+def _writing(method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        lock = self._lock
+        lock.acquire_write()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            # Écritures du journal mises en file sous le verrou, faites hors verrou
+            if lock.release_write() and self._journal is not None:
+                self._journal.drain()
+    return wrapper
+
+
+class ConcurrentTaskManager(TaskManager):
+    """TaskManager utilisable depuis plusieurs threads.
+
+    Les lectures (get_task, filtres, requêtes, statistiques, recherche)
+    partagent un verrou en lecture ; les ajouts, suppressions, chargements et
+    mutations de tâches prennent le verrou en écriture. save_to_file ne copie
+    les tâches que sous le verrou : la sérialisation et l'écriture du fichier
+    se font ensuite sans le tenir. De même, les enregistrements du journal sont
+    mis en file sous le verrou puis écrits, dans l'ordre, une fois celui-ci
+    rendu.
+    """
+
+    def __init__(self, storage_file="tasks.json", journal=False, compact_threshold=10000):
+        self._lock = ReadWriteLock()
+        super().__init__(storage_file, journal=journal, compact_threshold=compact_threshold,
+                         store=_LockedTaskStore(self._lock))
+        if self._journal is not None:
+            self._journal.deferred = True
+            self._store._after_write = self._journal.drain
+
+    @property
+    def tasks(self) -> List[Task]:
+        with self._lock.read():
+            return list(self._store)
+
+    @tasks.setter
+    def tasks(self, tasks):
+        TaskManager.tasks.fset(self, tasks)
+
+    get_task = _reading(TaskManager.get_task)
+    get_tasks_by_status = _reading(TaskManager.get_tasks_by_status)
+    get_tasks_by_priority = _reading(TaskManager.get_tasks_by_priority)
+    get_tasks_by_project = _reading(TaskManager.get_tasks_by_project)
+    get_statistics = _reading(TaskManager.get_statistics)
+
+    add_task = _writing(TaskManager.add_task)
+    _insert = _writing(TaskManager._insert)
+    # Chemin groupé d'add_tasks et d'import_csv (le fichier est lu hors verrou)
+    _insert_many = _writing(TaskManager._insert_many)
+    add_tasks = _writing(TaskManager.add_tasks)
+    delete_tasks = _writing(TaskManager.delete_tasks)
+    complete_tasks = _writing(TaskManager.complete_tasks)
+    update_priorities = _writing(TaskManager.update_priorities)
+    assign_to_project = _writing(TaskManager.assign_to_project)
+    archive_completed = _writing(TaskManager.archive_completed)
+    delete_task = _writing(TaskManager.delete_task)
+    _replace_tasks = _writing(TaskManager._replace_tasks)
+    # Remplacement et reset du journal sous la même prise du verrou
+    _load_tasks = _writing(TaskManager._load_tasks)
+    # Premier appel : les agrégats sont construits sous le verrou d'écriture
+    reports = _writing(TaskManager.reports)
+    changes = _writing(TaskManager.changes)
+
+    def query(self) -> Query:
+        return _LockedQuery(self._store, self._lock)
+
+    def search(self, text, limit=20, prefix=True) -> List[Task]:
+        with self._lock.read():
+            if self._search_index is not None:
+                return super().search(text, limit, prefix)
+        # Première recherche : l'index est construit sous le verrou d'écriture
+        with self._lock.write():
+            return super().search(text, limit, prefix)
+
+    def _tasks_to_save(self):
+        with self._lock.read():
+            return [task._detached_copy() for task in self._store]
+
+    def load_from_file(self, filename=None, streaming=False, format=None):
+        # Un store paresseux (MappedTaskStore, SQLiteTaskStore) se modifie
+        # pendant les lectures et remplacerait le store verrouillé
+        if format == "binary":
+            raise ValueError("Binary snapshots cannot be loaded into a ConcurrentTaskManager")
+        if format == "sqlite":
+            raise ValueError("SQLite databases cannot be loaded into a ConcurrentTaskManager")
+        super().load_from_file(filename, streaming=streaming, format=format)
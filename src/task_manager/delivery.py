@@ -0,0 +1,241 @@
+import queue
+import smtplib
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from email.message import EmailMessage
+
+# Erreurs après lesquelles un nouvel essai a des chances d'aboutir
+_TRANSIENT_ERRORS = (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError, ConnectionError, TimeoutError)
+
+
+def build_message(sender, recipient, subject, body) -> EmailMessage:
+    message = EmailMessage()
+    message["From"] = sender
+    message["To"] = recipient
+    message["Subject"] = subject
+    message.set_content(body)
+    return message
+
+
+def _is_transient(error):
+    if isinstance(error, _TRANSIENT_ERRORS):
+        return True
+    # Codes 4xx : refus temporaire du serveur
+    code = getattr(error, "smtp_code", None)
+    return code is not None and 400 <= code < 500
+
+
+class SMTPConnectionPool:
+    """Pool de connexions SMTP réutilisables.
+
+    Les connexions sont ouvertes à la demande, dans la limite de ``size``, et
+    rendues au pool après usage. Une connexion qui a échoué est fermée au lieu
+    d'être rendue.
+    """
+
+    def __init__(self, host, port=587, size=4, username=None, password=None, starttls=False,
+                 timeout=30, factory=smtplib.SMTP):
+        self.host = host
+        self.port = port
+        self.size = size
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.timeout = timeout
+        self._factory = factory
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._closed = False
+
+    def _connect(self):
+        connection = self._factory(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.starttls:
+                connection.starttls()
+            if self.username:
+                connection.login(self.username, self.password)
+        except Exception:
+            self._close_quietly(connection)
+            raise
+        return connection
+
+    @contextmanager
+    def connection(self):
+        if self._closed:
+            raise RuntimeError("Connection pool is closed")
+        self._slots.acquire()
+        try:
+            try:
+                connection = self._idle.get_nowait()
+            except queue.Empty:
+                connection = self._connect()
+            try:
+                yield connection
+            except Exception:
+                self._close_quietly(connection)
+                raise
+            if self._closed:
+                self._close_quietly(connection)
+            else:
+                self._idle.put(connection)
+        finally:
+            self._slots.release()
+
+    def close(self):
+        self._closed = True
+        while True:
+            try:
+                connection = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                connection.quit()
+            except Exception:
+                self._close_quietly(connection)
+
+    @staticmethod
+    def _close_quietly(connection):
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+
+class RateLimiter:
+    # Seau à jetons partagé entre les workers : ``rate`` envois par seconde
+    def __init__(self, rate, burst=None):
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class DeliveryPipeline:
+    """File d'envoi bornée servie par des workers qui partagent un pool SMTP.
+
+    Chaque worker prend jusqu'à ``batch_size`` messages et les envoie sur une
+    même connexion. Les échecs transitoires sont réessayés avec un backoff
+    exponentiel ; submit() renvoie un Future résolu à True une fois le
+    message accepté par le serveur, ou en erreur après le dernier essai.
+    """
+
+    _STOP = object()
+
+    def __init__(self, pool: SMTPConnectionPool, queue_size=1000, batch_size=50, workers=2,
+                 max_retries=3, backoff=0.5, rate_limit=None):
+        self.pool = pool
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self._limiter = RateLimiter(rate_limit) if rate_limit else None
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._workers = [threading.Thread(target=self._work, daemon=True) for _ in range(workers)]
+        self._closed = False
+        for worker in self._workers:
+            worker.start()
+
+    def submit(self, message: EmailMessage, timeout=None) -> Future:
+        # Bloque quand la file est pleine : c'est la contre-pression sur l'appelant
+        if self._closed:
+            raise RuntimeError("Delivery pipeline is closed")
+        future = Future()
+        self._queue.put((message, future, 0), timeout=timeout)
+        return future
+
+    def qsize(self) -> int:
+        return self._queue.qsize()
+
+    def close(self, wait=True):
+        if self._closed:
+            return
+        self._closed = True
+        for _ in self._workers:
+            self._queue.put(self._STOP)
+        if wait:
+            for worker in self._workers:
+                worker.join()
+        self.pool.close()
+
+    def _next_batch(self):
+        item = self._queue.get()
+        if item is self._STOP:
+            return None
+        batch = [item]
+        while len(batch) < self.batch_size:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is self._STOP:
+                # Remis en file pour arrêter ce worker après ce lot
+                self._queue.put(item)
+                break
+            batch.append(item)
+        return batch
+
+    def _work(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            self._send_batch(batch)
+
+    def _send_batch(self, batch):
+        pending = list(batch)
+        try:
+            with self.pool.connection() as connection:
+                while pending:
+                    message, future, attempt = pending[0]
+                    if self._limiter is not None:
+                        self._limiter.acquire()
+                    try:
+                        connection.send_message(message)
+                    except smtplib.SMTPRecipientsRefused as e:
+                        future.set_exception(e)
+                    except smtplib.SMTPResponseException as e:
+                        if not _is_transient(e):
+                            pending.pop(0)
+                            future.set_exception(e)
+                            continue
+                        raise
+                    else:
+                        future.set_result(True)
+                    pending.pop(0)
+        except Exception as e:
+            # La connexion est perdue : le reste du lot est réessayé plus tard
+            self._retry(pending, e)
+
+    def _retry(self, items, error):
+        if not _is_transient(error):
+            for _, future, _ in items:
+                future.set_exception(error)
+            return
+        for message, future, attempt in items:
+            if attempt >= self.max_retries:
+                future.set_exception(error)
+                continue
+            delay = self.backoff * (2 ** attempt)
+            timer = threading.Timer(delay, self._requeue, args=((message, future, attempt + 1),))
+            timer.daemon = True
+            timer.start()
+
+    def _requeue(self, item):
+        if self._closed:
+            item[1].set_exception(RuntimeError("Delivery pipeline closed before retry"))
+            return
+        self._queue.put(item)
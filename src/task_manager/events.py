@@ -0,0 +1,287 @@
+import itertools
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Iterable, Iterator, List, Optional
+
+from .task import Status
+
+CREATED = "created"
+DELETED = "deleted"
+COMPLETED = "completed"
+STATUS_CHANGED = "status_changed"
+PRIORITY_CHANGED = "priority_changed"
+PROJECT_ASSIGNED = "project_assigned"
+KINDS = (CREATED, DELETED, COMPLETED, STATUS_CHANGED, PRIORITY_CHANGED, PROJECT_ASSIGNED)
+
+# Politiques quand la file d'un abonné est pleine
+BLOCK = "block"
+DROP_OLDEST = "drop_oldest"
+DROP_NEWEST = "drop_newest"
+_POLICIES = (BLOCK, DROP_OLDEST, DROP_NEWEST)
+
+_FIELD_KINDS = {"priority": PRIORITY_CHANGED, "project_id": PROJECT_ASSIGNED}
+
+
+class TaskEvent:
+    """Changement d'une tâche : ``old`` et ``new`` sont les valeurs du champ
+    concerné (statut, priorité, projet), ou None pour une création ou une
+    suppression. ``task`` est l'objet Task lui-même, pas une copie."""
+
+    __slots__ = ("kind", "task_id", "task", "old", "new", "sequence")
+
+    def __init__(self, kind, task, old=None, new=None, sequence=0):
+        self.kind = kind
+        self.task_id = task.id
+        self.task = task
+        self.old = old
+        self.new = new
+        self.sequence = sequence
+
+    def __repr__(self):
+        return f"TaskEvent({self.kind}, {self.task_id}, {self.old!r} -> {self.new!r})"
+
+
+class Subscription:
+    """File bornée d'un abonné, alimentée par un ChangeFeed.
+
+    Les événements sont lus un par un (get) ou par lots (get_batch,
+    batches). Quand la file est pleine, la politique décide : BLOCK fait
+    attendre l'émetteur (jusqu'à ``block_timeout``, puis l'événement est
+    perdu), DROP_OLDEST écarte le plus ancien, DROP_NEWEST le nouveau. Les
+    événements perdus sont comptés dans ``dropped``.
+    """
+
+    def __init__(self, feed, kinds=None, predicate=None, maxsize=1000, policy=DROP_OLDEST,
+                 batch_size=100, block_timeout=None):
+        if policy not in _POLICIES:
+            raise ValueError(f"Unknown backpressure policy: {policy}")
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.kinds = frozenset(kinds) if kinds is not None else None
+        self.predicate = predicate
+        self.maxsize = maxsize
+        self.policy = policy
+        self.batch_size = batch_size
+        self.block_timeout = block_timeout
+        self.dropped = 0
+        self.closed = False
+        self._feed = feed
+        self._queue = deque()
+        self._condition = threading.Condition()
+        self._thread = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __len__(self):
+        return len(self._queue)
+
+    def _accepts(self, event):
+        return (self.kinds is None or event.kind in self.kinds) and (self.predicate is None or self.predicate(event))
+
+    def _offer(self, events):
+        # Appelé par l'émetteur ; un seul passage sous le verrou par lot
+        events = [event for event in events if self._accepts(event)]
+        if not events:
+            return
+        with self._condition:
+            queue = self._queue
+            for event in events:
+                if self.closed:
+                    return
+                if len(queue) >= self.maxsize:
+                    if self.policy == DROP_NEWEST:
+                        self.dropped += 1
+                        continue
+                    if self.policy == DROP_OLDEST:
+                        queue.popleft()
+                        self.dropped += 1
+                    else:
+                        deadline = None if self.block_timeout is None else time.monotonic() + self.block_timeout
+                        self._condition.notify_all()
+                        while len(queue) >= self.maxsize and not self.closed:
+                            remaining = None if deadline is None else deadline - time.monotonic()
+                            if remaining is not None and remaining <= 0:
+                                break
+                            self._condition.wait(remaining)
+                        if len(queue) >= self.maxsize or self.closed:
+                            self.dropped += 1
+                            continue
+                queue.append(event)
+            self._condition.notify_all()
+
+    def get(self, timeout=None) -> Optional[TaskEvent]:
+        # Un événement, ou None après ``timeout`` secondes ou à la fermeture
+        batch = self.get_batch(1, timeout)
+        return batch[0] if batch else None
+
+    def get_batch(self, max_items=None, timeout=None) -> List[TaskEvent]:
+        # Attend au moins un événement (au plus ``timeout`` secondes) puis
+        # vide la file jusqu'à ``max_items`` (batch_size par défaut)
+        limit = max_items or self.batch_size
+        with self._condition:
+            if not self._queue and not self.closed:
+                self._condition.wait_for(lambda: self._queue or self.closed, timeout)
+            queue = self._queue
+            batch = [queue.popleft() for _ in range(min(limit, len(queue)))]
+            if batch:
+                self._condition.notify_all()
+            return batch
+
+    def batches(self, timeout=None) -> Iterator[List[TaskEvent]]:
+        # Lots successifs jusqu'à la fermeture, ou jusqu'à un délai sans événement
+        while True:
+            batch = self.get_batch(timeout=timeout)
+            if not batch:
+                return
+            yield batch
+
+    def _deliver(self, callback):
+        while not self.closed or self._queue:
+            batch = self.get_batch()
+            if batch:
+                callback(batch)
+
+    def close(self):
+        self._feed._unsubscribe(self)
+        with self._condition:
+            self.closed = True
+            self._condition.notify_all()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+
+class ChangeFeed:
+    """Flux des changements de tâches d'un TaskManager (voir changes()).
+
+    Chaque abonné a sa propre file bornée et ses filtres. Sans abonné,
+    publier ne coûte qu'un test : le gestionnaire ne crée d'ailleurs le flux
+    qu'au premier appel de changes().
+    """
+
+    def __init__(self):
+        self._subscriptions = ()
+        self._lock = threading.Lock()
+        self._sequence = itertools.count(1)
+        # Événements retenus par batch(), par thread
+        self._local = threading.local()
+
+    def __len__(self):
+        return len(self._subscriptions)
+
+    @property
+    def active(self) -> bool:
+        return bool(self._subscriptions)
+
+    def subscribe(self, kinds: Optional[Iterable[str]] = None, predicate: Optional[Callable] = None,
+                  maxsize=1000, policy=DROP_OLDEST, batch_size=100, block_timeout=None,
+                  callback: Optional[Callable[[List[TaskEvent]], None]] = None) -> Subscription:
+        """Abonne aux événements dont le type est dans ``kinds`` (tous par
+        défaut) et qui passent ``predicate``.
+
+        Avec ``callback``, un thread dédié lui passe les événements par lots
+        jusqu'à la fermeture de l'abonnement. Avec BLOCK, l'émetteur attend
+        le consommateur : celui-ci ne doit pas tourner dans le même thread.
+        """
+        unknown = set(kinds or ()) - set(KINDS)
+        if unknown:
+            raise ValueError(f"Unknown event kinds: {', '.join(sorted(unknown))}")
+        subscription = Subscription(self, kinds, predicate, maxsize, policy, batch_size, block_timeout)
+        with self._lock:
+            self._subscriptions = self._subscriptions + (subscription,)
+        if callback is not None:
+            subscription._thread = threading.Thread(target=subscription._deliver, args=(callback,), daemon=True)
+            subscription._thread.start()
+        return subscription
+
+    def _unsubscribe(self, subscription):
+        with self._lock:
+            self._subscriptions = tuple(s for s in self._subscriptions if s is not subscription)
+
+    def _event(self, kind, task, old=None, new=None) -> TaskEvent:
+        return TaskEvent(kind, task, old, new, next(self._sequence))
+
+    def publish(self, kind, task, old=None, new=None):
+        if self._subscriptions:
+            self.publish_many([self._event(kind, task, old, new)])
+
+    @contextmanager
+    def batch(self):
+        # Les événements publiés dans le bloc par ce thread partent en un seul
+        # lot à la sortie : un passage par abonné au lieu d'un par tâche
+        if getattr(self._local, "events", None) is not None:
+            yield
+            return
+        events = self._local.events = []
+        try:
+            yield
+        finally:
+            self._local.events = None
+            if events:
+                self.publish_many(events)
+
+    def publish_many(self, events: List[TaskEvent]):
+        buffered = getattr(self._local, "events", None)
+        if buffered is not None:
+            buffered.extend(events)
+            return
+        for subscription in self._subscriptions:
+            subscription._offer(events)
+
+    def created(self, tasks):
+        if self._subscriptions:
+            self.publish_many([self._event(CREATED, task) for task in tasks])
+
+    def deleted(self, tasks):
+        if self._subscriptions:
+            self.publish_many([self._event(DELETED, task) for task in tasks])
+
+    def on_task_changed(self, task, field, old, new):
+        if not self._subscriptions:
+            return
+        if field == "status":
+            kind = COMPLETED if new is Status.DONE else STATUS_CHANGED
+        else:
+            kind = _FIELD_KINDS.get(field)
+            if kind is None:
+                return
+        self.publish_many([self._event(kind, task, old, new)])
+
+    @staticmethod
+    def state(tasks):
+        # État comparé par diff() : {id: (statut, priorité, projet, tâche)}
+        return {task.id: (task.status, task.priority, task.project_id, task) for task in tasks}
+
+    def diff(self, before, tasks):
+        """Publie en un lot le passage de l'état ``before`` (voir state) aux
+        tâches ``tasks`` : créations, suppressions et changements de statut,
+        de priorité ou de projet, au lieu d'une relecture complète."""
+        if not self._subscriptions:
+            return
+        events = []
+        event = self._event
+        seen = set()
+        for task in tasks:
+            seen.add(task.id)
+            previous = before.get(task.id)
+            if previous is None:
+                events.append(event(CREATED, task))
+                continue
+            status, priority, project_id, _ = previous
+            if task.status is not status:
+                kind = COMPLETED if task.status is Status.DONE else STATUS_CHANGED
+                events.append(event(kind, task, status, task.status))
+            if task.priority is not priority:
+                events.append(event(PRIORITY_CHANGED, task, priority, task.priority))
+            if task.project_id != project_id:
+                events.append(event(PROJECT_ASSIGNED, task, project_id, task.project_id))
+        for task_id, removed in before.items():
+            if task_id not in seen:
+                events.append(event(DELETED, removed[3]))
+        if events:
+            self.publish_many(events)
@@ -0,0 +1,379 @@
+import cProfile
+import functools
+import io
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from bisect import bisect_left
+from typing import Callable, Dict, List, Optional
+
+# Bornes en secondes, de 5 µs à 10 s
+DEFAULT_BUCKETS = (0.000005, 0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+                   0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+MANAGER_METHODS = (
+    "add_task", "add_tasks", "get_task", "delete_task", "delete_tasks", "complete_tasks", "update_priorities",
+    "assign_to_project", "get_tasks_by_status", "get_tasks_by_priority", "get_tasks_by_project", "query",
+    "search", "get_statistics", "save_to_file", "load_from_file", "export_csv", "import_csv",
+)
+REPORT_METHODS = ("generate_daily_report", "generate_range_report", "generate_weekly_report",
+                  "export_tasks_csv", "stream_tasks_csv")
+EMAIL_METHODS = ("send_task_reminder", "send_completion_notification", "send_task_reminders")
+
+
+def _label_key(labels):
+    return tuple(sorted(labels.items()))
+
+
+class Counter:
+    __slots__ = ("value", "_lock")
+
+    def __init__(self):
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1):
+        with self._lock:
+            self.value += amount
+
+
+class Histogram:
+    """Histogramme à seaux cumulés, au sens de Prometheus."""
+
+    __slots__ = ("buckets", "counts", "count", "sum", "_lock")
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        # Un seau par borne, plus le dernier (+Inf)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.sum += value
+
+    def cumulative(self) -> List[int]:
+        total = 0
+        result = []
+        for count in self.counts:
+            total += count
+            result.append(total)
+        return result
+
+
+class MetricsRegistry:
+    """Compteurs, histogrammes et jauges, identifiés par nom et labels.
+
+    Les jauges sont des fonctions lues au moment de l'export (profondeur
+    d'une file, nombre de tâches...), sans coût entre deux exports.
+    """
+
+    def __init__(self):
+        self._metrics = {}
+        self._gauges = {}
+        self._help = {}
+        self._lock = threading.Lock()
+
+    def _get(self, kind, name, labels, factory):
+        key = (name, _label_key(labels))
+        metric = self._metrics.get(key)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(key)
+                if metric is None:
+                    metric = self._metrics[key] = (kind, factory())
+        if metric[0] != kind:
+            raise ValueError(f"Metric {name} is already registered as a {metric[0]}")
+        return metric[1]
+
+    def describe(self, name, help_text):
+        self._help[name] = help_text
+
+    def counter(self, name, **labels) -> Counter:
+        return self._get("counter", name, labels, Counter)
+
+    def histogram(self, name, buckets=DEFAULT_BUCKETS, **labels) -> Histogram:
+        return self._get("histogram", name, labels, lambda: Histogram(buckets))
+
+    def gauge(self, name, function: Callable[[], float], **labels):
+        self._gauges[(name, _label_key(labels))] = function
+
+    def remove_gauge(self, name, **labels):
+        self._gauges.pop((name, _label_key(labels)), None)
+
+    def reset(self):
+        with self._lock:
+            self._metrics.clear()
+
+    def snapshot(self) -> Dict[str, list]:
+        # {nom: [{"labels": {...}, ...valeurs}]}, lisible et sérialisable en JSON
+        result = {}
+        for (name, labels), (kind, metric) in sorted(self._metrics.items()):
+            entry = {"type": kind, "labels": dict(labels)}
+            if kind == "counter":
+                entry["value"] = metric.value
+            else:
+                entry.update(count=metric.count, sum=metric.sum,
+                             buckets=dict(zip(metric.buckets + (float("inf"),), metric.cumulative())))
+            result.setdefault(name, []).append(entry)
+        for (name, labels), function in sorted(self._gauges.items(), key=lambda item: item[0]):
+            try:
+                value = function()
+            except Exception:
+                continue
+            result.setdefault(name, []).append({"type": "gauge", "labels": dict(labels), "value": value})
+        return result
+
+    def export(self, exporter=None):
+        # exporter : fonction appliquée au snapshot (prometheus_text...) ;
+        # sans exporter, renvoie le snapshot
+        snapshot = self.snapshot()
+        return snapshot if exporter is None else exporter(snapshot, self._help)
+
+
+def _format_labels(labels, extra=None):
+    items = list(labels.items()) + ([extra] if extra else [])
+    if not items:
+        return ""
+    escaped = (str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"') for _, value in items)
+    return "{" + ",".join(f'{key}="{value}"' for (key, _), value in zip(items, escaped)) + "}"
+
+
+def _format_bound(bound):
+    return "+Inf" if bound == float("inf") else repr(float(bound))
+
+
+def prometheus_text(snapshot, help_texts=None) -> str:
+    """Exporteur au format texte de Prometheus (version 0.0.4)."""
+    help_texts = help_texts or {}
+    lines = []
+    for name, entries in snapshot.items():
+        kind = entries[0]["type"]
+        if name in help_texts:
+            lines.append(f"# HELP {name} {help_texts[name]}")
+        lines.append(f"# TYPE {name} {kind}")
+        for entry in entries:
+            labels = entry["labels"]
+            if kind == "histogram":
+                for bound, count in entry["buckets"].items():
+                    lines.append(f"{name}_bucket{_format_labels(labels, ('le', _format_bound(bound)))} {count}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {entry['sum']}")
+                lines.append(f"{name}_count{_format_labels(labels)} {entry['count']}")
+            else:
+                lines.append(f"{name}{_format_labels(labels)} {entry['value']}")
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def _file_size(filename):
+    try:
+        return os.path.getsize(filename)
+    except (OSError, TypeError):
+        return 0
+
+
+class Instrumentation:
+    """Instrumentation à la demande des gestionnaires et des services.
+
+    instrument() remplace les méthodes publiques d'un objet par des versions
+    mesurées (nombre d'appels, erreurs, histogramme de latence), au niveau de
+    l'instance ; uninstrument() les retire. Les objets non instrumentés
+    gardent leurs méthodes d'origine : le chemin désactivé ne coûte rien.
+    """
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None):
+        self.registry = registry if registry is not None else MetricsRegistry()
+        self._instrumented = {}
+        self.registry.describe("task_manager_call_seconds", "Latency of TaskManager methods")
+        self.registry.describe("task_manager_errors_total", "TaskManager calls that raised")
+        self.registry.describe("task_mutations_total", "Task field changes seen by instrumented managers")
+        self.registry.describe("task_manager_bytes_written_total", "Bytes written by save and export")
+        self.registry.describe("task_manager_bytes_read_total", "Bytes read by load and import")
+        self.registry.describe("report_service_call_seconds", "Latency of ReportService methods")
+        self.registry.describe("email_service_call_seconds", "Latency of EmailService methods")
+        self.registry.describe("email_queue_depth", "Messages waiting in the delivery pipeline")
+
+    def _wrap(self, target, prefix, name, after=None):
+        function = getattr(target, name)
+        histogram = self.registry.histogram(f"{prefix}_call_seconds", method=name)
+        errors = self.registry.counter(f"{prefix}_errors_total", method=name)
+        perf_counter = time.perf_counter
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                result = function(*args, **kwargs)
+            except BaseException:
+                errors.inc()
+                raise
+            finally:
+                histogram.observe(perf_counter() - start)
+            if after is not None:
+                after(args, kwargs, result)
+            return result
+
+        return wrapper
+
+    def _install(self, target, prefix, methods, after=None, cleanup=None):
+        if id(target) in self._instrumented:
+            return target
+        after = after or {}
+        names = [name for name in methods if hasattr(target, name)]
+        for name in names:
+            setattr(target, name, self._wrap(target, prefix, name, after.get(name)))
+        self._instrumented[id(target)] = (target, names, cleanup)
+        return target
+
+    def instrument(self, target):
+        # Choisit les méthodes selon le type : TaskManager (et dérivés),
+        # ReportService ou EmailService
+        from .manager import TaskManager
+        from .services import EmailService, ReportService
+        if isinstance(target, TaskManager):
+            return self.instrument_manager(target)
+        if isinstance(target, ReportService):
+            return self.instrument_report_service(target)
+        if isinstance(target, EmailService):
+            return self.instrument_email_service(target)
+        raise TypeError(f"Cannot instrument {type(target).__name__}")
+
+    def instrument_manager(self, manager, name="default"):
+        if id(manager) in self._instrumented:
+            return manager
+        registry = self.registry
+        written = registry.counter("task_manager_bytes_written_total", manager=name)
+        read = registry.counter("task_manager_bytes_read_total", manager=name)
+        mutations = {}
+
+        def on_task_changed(task, field, old, new):
+            counter = mutations.get(field)
+            if counter is None:
+                counter = mutations[field] = registry.counter("task_mutations_total", manager=name, field=field)
+            counter.inc()
+
+        def storage_file(args, kwargs):
+            filename = args[0] if args else kwargs.get("filename")
+            return filename if filename is not None else manager.storage_file
+
+        def cleanup():
+            manager._listeners.remove(on_task_changed)
+            manager._store.remove_listener(on_task_changed)
+            registry.remove_gauge("task_manager_tasks", manager=name)
+
+        after = {
+            "save_to_file": lambda args, kwargs, result: written.inc(_file_size(storage_file(args, kwargs))),
+            "load_from_file": lambda args, kwargs, result: read.inc(_file_size(storage_file(args, kwargs))),
+            "export_csv": lambda args, kwargs, result: written.inc(_file_size(args[0] if args else None)),
+            "import_csv": lambda args, kwargs, result: read.inc(_file_size(args[0] if args else None)),
+        }
+        self._install(manager, "task_manager", MANAGER_METHODS, after, cleanup)
+        manager._add_store_listener(on_task_changed)
+        registry.gauge("task_manager_tasks", lambda: len(manager.tasks), manager=name)
+        return manager
+
+    def instrument_report_service(self, service):
+        written = self.registry.counter("report_service_bytes_written_total")
+
+        def exported(args, kwargs, result):
+            written.inc(_file_size(args[1] if len(args) > 1 else kwargs.get("filename", kwargs.get("target"))))
+
+        after = {"export_tasks_csv": exported, "stream_tasks_csv": exported}
+        return self._install(service, "report_service", REPORT_METHODS, after)
+
+    def instrument_email_service(self, service, name="default"):
+        if id(service) in self._instrumented:
+            return service
+        registry = self.registry
+        if service.pipeline is not None:
+            registry.gauge("email_queue_depth", service.pipeline.qsize, service=name)
+
+        def cleanup():
+            registry.remove_gauge("email_queue_depth", service=name)
+
+        return self._install(service, "email_service", EMAIL_METHODS, cleanup=cleanup)
+
+    def uninstrument(self, target):
+        entry = self._instrumented.pop(id(target), None)
+        if entry is None:
+            return
+        _, names, cleanup = entry
+        for name in names:
+            # L'attribut d'instance masquait la méthode de classe
+            delattr(target, name)
+        if cleanup is not None:
+            cleanup()
+
+    def close(self):
+        for target, _, _ in list(self._instrumented.values()):
+            self.uninstrument(target)
+
+    def snapshot(self):
+        return self.registry.snapshot()
+
+    def prometheus(self) -> str:
+        return self.registry.export(prometheus_text)
+
+    def profile(self, cpu=True, memory=False, frames=1) -> "ProfileCapture":
+        return ProfileCapture(cpu, memory, frames)
+
+
+class ProfileCapture:
+    """Capture cProfile et/ou tracemalloc, à utiliser comme context manager.
+
+    Le profil CPU ne couvre que le thread qui ouvre la capture. tracemalloc
+    n'est arrêté à la sortie que s'il a été démarré par la capture.
+    """
+
+    def __init__(self, cpu=True, memory=False, frames=1):
+        self.cpu = cpu
+        self.memory = memory
+        self.frames = frames
+        self.profiler = None
+        self.memory_snapshot = None
+        self.peak_memory = None
+        self._started_tracemalloc = False
+
+    def __enter__(self):
+        if self.memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(self.frames)
+                self._started_tracemalloc = True
+            if hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+        if self.cpu:
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.profiler is not None:
+            self.profiler.disable()
+        if self.memory:
+            self.memory_snapshot = tracemalloc.take_snapshot()
+            self.peak_memory = tracemalloc.get_traced_memory()[1]
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+
+    def stats(self, sort="cumulative", limit=20) -> str:
+        # Rapport texte de pstats
+        if self.profiler is None:
+            return ""
+        output = io.StringIO()
+        pstats.Stats(self.profiler, stream=output).sort_stats(sort).print_stats(limit)
+        return output.getvalue()
+
+    def dump(self, filename):
+        # Fichier lisible par pstats, snakeviz...
+        self.profiler.dump_stats(filename)
+
+    def top_allocations(self, limit=10, key="lineno") -> List[str]:
+        if self.memory_snapshot is None:
+            return []
+        return [str(stat) for stat in self.memory_snapshot.statistics(key)[:limit]]
@@ -0,0 +1,259 @@
+import json
+import os
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, List
+
+from .task import Status
+
+_SEPARATORS = (",", ":")
+# Champs journalisés par l'opération "edit", avec leur valeur au format de to_dict
+_EDITED_FIELDS = ("title", "description", "created_at", "completed_at")
+
+
+def apply_record(tasks: Dict[str, dict], record):
+    # Chaque enregistrement est idempotent : rejouer un journal déjà inclus
+    # dans le snapshot redonne le même état
+    op = record["op"]
+    if op == "add":
+        data = record["task"]
+        tasks.pop(data["id"], None)
+        tasks[data["id"]] = dict(data)
+    elif op == "delete":
+        tasks.pop(record["id"], None)
+    elif op == "reset":
+        tasks.clear()
+    else:
+        data = tasks.get(record["id"])
+        if data is None:
+            return
+        if op == "complete":
+            data["status"] = Status.DONE.value
+            data["completed_at"] = record["completed_at"]
+        elif op == "status":
+            data["status"] = record["status"]
+        elif op == "reprioritize":
+            data["priority"] = record["priority"]
+        elif op == "assign":
+            data["project_id"] = record["project_id"]
+        elif op == "reschedule":
+            data["due_at"] = record["due_at"]
+        elif op == "edit" and record["field"] in _EDITED_FIELDS:
+            data[record["field"]] = record["value"]
+        else:
+            raise ValueError(f"Unknown journal operation: {op}")
+
+
+class TaskJournal:
+    """Journal append-only des mutations, compacté périodiquement en snapshot.
+
+    Le snapshot est un fichier JSON au même format que save_to_file ; le journal
+    (``<snapshot>.log``) contient un enregistrement JSON compact par ligne. Lors
+    d'une compaction, le journal courant est renommé en ``<snapshot>.log.1`` puis
+    fusionné avec le snapshot dans un thread en arrière-plan.
+    """
+
+    def __init__(self, snapshot_file, compact_threshold=10000, fsync=False):
+        self.snapshot_file = snapshot_file
+        self.log_file = snapshot_file + ".log"
+        self.rotated_log_file = snapshot_file + ".log.1"
+        self.compact_threshold = compact_threshold
+        self.fsync = fsync
+        self._lock = threading.Lock()
+        self._log = None
+        self._records = 0
+        self._compaction = None
+        self._compaction_error = None
+        self._batch = None
+        # Mode différé : les enregistrements sont mis en file (dans l'ordre des
+        # mutations) et écrits par drain(), hors du verrou de l'appelant
+        self.deferred = False
+        self._pending = deque()
+
+    def load(self) -> List[dict]:
+        with self._lock:
+            self._wait_for_compaction()
+            self._drain_locked()
+            self._close_log()
+            # Un journal tourné qui traîne vient d'une compaction interrompue
+            if os.path.exists(self.rotated_log_file):
+                self._compact_files()
+            tasks = self._read_snapshot()
+            self._records = self._replay(self.log_file, tasks)
+        return list(tasks.values())
+
+    def record_add(self, task):
+        self.append({"op": "add", "task": task.to_dict()})
+
+    def record_delete(self, task_id):
+        self.append({"op": "delete", "id": task_id})
+
+    def record_reset(self, tasks):
+        with self.batch():
+            self.append({"op": "reset"})
+            for task in tasks:
+                self.record_add(task)
+
+    def record_change(self, task, field, old, new):
+        if field == "status":
+            if new is Status.DONE:
+                completed_at = task.completed_at.isoformat() if task.completed_at else None
+                record = {"op": "complete", "id": task.id, "completed_at": completed_at}
+            else:
+                record = {"op": "status", "id": task.id, "status": new.value}
+        elif field == "priority":
+            record = {"op": "reprioritize", "id": task.id, "priority": new.value}
+        elif field == "project_id":
+            record = {"op": "assign", "id": task.id, "project_id": new}
+        elif field == "due_at":
+            record = {"op": "reschedule", "id": task.id, "due_at": new.isoformat() if new else None}
+        elif field in _EDITED_FIELDS:
+            value = new.isoformat() if field.endswith("_at") and new else new
+            record = {"op": "edit", "id": task.id, "field": field, "value": value}
+        else:
+            return
+        self.append(record)
+
+    def append(self, record):
+        if self._batch is not None:
+            self._batch.append(record)
+            return
+        self._write([record])
+
+    @contextmanager
+    def batch(self):
+        # Les enregistrements du bloc sont écrits en une fois (un write, un
+        # flush, un fsync) à la sortie, même en cas d'exception : les
+        # mutations déjà faites en mémoire doivent rester journalisées
+        if self._batch is not None:
+            yield
+            return
+        self._batch = []
+        try:
+            yield
+        finally:
+            records, self._batch = self._batch, None
+            if records:
+                self._write(records)
+
+    def _write(self, records):
+        if self.deferred:
+            self._pending.extend(records)
+            return
+        with self._lock:
+            self._write_locked(records)
+
+    def drain(self):
+        # Écrit les enregistrements mis en file ; au retour, ceux mis en file
+        # avant l'appel sont dans le fichier (même écrits par un autre thread)
+        with self._lock:
+            self._drain_locked()
+
+    def _drain_locked(self):
+        pending = self._pending
+        records = [pending.popleft() for _ in range(len(pending))]
+        if records:
+            self._write_locked(records)
+
+    def _write_locked(self, records):
+        data = "".join(json.dumps(record, separators=_SEPARATORS) + "\n" for record in records)
+        if self._log is None:
+            self._log = open(self.log_file, "a", encoding="utf-8")
+        self._log.write(data)
+        self._log.flush()
+        if self.fsync:
+            os.fsync(self._log.fileno())
+        self._records += len(records)
+        if self.compact_threshold and self._records >= self.compact_threshold:
+            self._start_compaction()
+
+    def compact(self, wait=False):
+        with self._lock:
+            self._drain_locked()
+            self._start_compaction()
+            thread = self._compaction
+        if wait and thread is not None:
+            thread.join()
+            self._raise_compaction_error()
+
+    def close(self):
+        with self._lock:
+            self._drain_locked()
+            self._wait_for_compaction()
+            self._close_log()
+
+    def _start_compaction(self):
+        self._wait_for_compaction()
+        self._close_log()
+        if not os.path.exists(self.log_file):
+            return
+        os.replace(self.log_file, self.rotated_log_file)
+        self._records = 0
+        self._compaction = threading.Thread(target=self._run_compaction, daemon=True)
+        self._compaction.start()
+
+    def _run_compaction(self):
+        try:
+            self._compact_files()
+        except (OSError, ValueError) as e:
+            self._compaction_error = e
+
+    def _wait_for_compaction(self):
+        if self._compaction is not None:
+            self._compaction.join()
+            self._compaction = None
+        self._raise_compaction_error()
+
+    def _raise_compaction_error(self):
+        if self._compaction_error is not None:
+            error, self._compaction_error = self._compaction_error, None
+            raise IOError(f"Failed to compact journal: {error}")
+
+    def _compact_files(self):
+        tasks = self._read_snapshot()
+        self._replay(self.rotated_log_file, tasks)
+        tmp_file = self.snapshot_file + ".tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(list(tasks.values()), f, separators=_SEPARATORS)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.snapshot_file)
+        os.remove(self.rotated_log_file)
+
+    def _read_snapshot(self) -> Dict[str, dict]:
+        try:
+            with open(self.snapshot_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        return {task_data["id"]: task_data for task_data in data}
+
+    def _replay(self, filename, tasks) -> int:
+        try:
+            f = open(filename, "rb")
+        except FileNotFoundError:
+            return 0
+        count = 0
+        valid_end = 0
+        with f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    if line.endswith(b"\n"):
+                        raise
+                    # Dernière ligne tronquée par un crash pendant l'écriture
+                    break
+                apply_record(tasks, record)
+                valid_end += len(line)
+                count += 1
+        if valid_end < os.path.getsize(filename):
+            with open(filename, "r+b") as f:
+                f.truncate(valid_end)
+        return count
+
+    def _close_log(self):
+        if self._log is not None:
+            self._log.close()
+            self._log = None
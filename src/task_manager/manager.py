@@ -1,75 +1,440 @@
 import json
-from typing import List, Optional
+import os
+import sqlite3
+from contextlib import ExitStack, contextmanager
+from datetime import datetime
+from typing import Iterable, List, Optional
 from .task import Task, Priority, Status
+from .store import TaskStore
+from .journal import TaskJournal
+from .streaming import iter_tasks_from_file, write_tasks
+from .snapshot import MappedTaskStore, write_snapshot
+from .sqlite_store import SQLiteTaskStore, write_sqlite
+from .query import Query
+from .search import SearchIndex
+from .analytics import ReportAggregator
+from .csv_io import read_tasks_csv, write_tasks_csv
+from .events import ChangeFeed
+from .archive import ARCHIVED_STATUSES, TaskArchive, _as_datetime, archived_at
 
 class TaskManager:
-    def __init__(self, storage_file="tasks.json"):
-        self.tasks = []
+    def __init__(self, storage_file="tasks.json", journal=False, compact_threshold=10000, store=None):
+        # store : TaskStore par défaut, ou TaskTable pour un stockage en colonnes
+        self._store = store if store is not None else TaskStore()
         self.storage_file = storage_file
+        self._listeners = []
+        # Index plein texte construit à la première recherche, puis tenu à jour
+        self._search_index = None
+        # Agrégats de reporting, construits au premier appel de reports()
+        self._report_index = None
+        # Flux de changements, créé au premier appel de changes()
+        self._change_feed = None
+        self._add_store_listener(self._on_task_changed)
+        self._journal = None
+        if journal:
+            self._journal = TaskJournal(storage_file, compact_threshold=compact_threshold)
+            self._add_store_listener(self._journal.record_change)
 
-    def add_task(self, title, description="", priority=Priority.MEDIUM):
-        task = Task(title, description, priority)
-        self.tasks.append(task)
+    def _add_store_listener(self, callback):
+        self._listeners.append(callback)
+        self._store.add_listener(callback)
+
+    def _set_store(self, store):
+        # Les listeners suivent le gestionnaire quand le store est remplacé
+        old_store = self._store
+        before = self._feed_state(old_store)
+        for callback in self._listeners:
+            old_store.remove_listener(callback)
+            store.add_listener(callback)
+        self._store = store
+        self._search_index = None
+        self._report_index = None
+        if before is not None:
+            self._change_feed.diff(before, store)
+        if hasattr(old_store, "close"):
+            old_store.close()
+
+    def _on_task_changed(self, task, field, old, new):
+        if self._search_index is not None and field in ("title", "description"):
+            self._search_index.update(task)
+        if self._report_index is not None:
+            self._report_index.on_task_changed(task, field, old, new)
+        if self._change_feed is not None:
+            self._change_feed.on_task_changed(task, field, old, new)
+
+    def _feed_state(self, tasks):
+        # État avant un remplacement complet, seulement s'il y a des abonnés
+        if self._change_feed is not None and self._change_feed.active:
+            return ChangeFeed.state(tasks)
+        return None
+
+    @property
+    def tasks(self):
+        return self._store
+
+    @tasks.setter
+    def tasks(self, tasks):
+        self._load_tasks(list(tasks))
+
+    def _load_tasks(self, tasks):
+        # Contenu qui ne vient pas du journal (affectation, autre fichier) : le
+        # journal repart de ce contenu, sinon la prochaine compaction le perdrait
+        self._replace_tasks(tasks)
+        if self._journal is not None:
+            self._journal.record_reset(tasks)
+
+    def _record_loaded_store(self):
+        if self._journal is not None:
+            self._journal.record_reset(list(self._store))
+
+    def _replace_tasks(self, tasks):
+        before = self._feed_state(self._store)
+        with self._store_batch():
+            self._store.clear()
+            for task in tasks:
+                self._store.add(task)
+        if self._search_index is not None:
+            self._search_index.clear()
+            self._search_index.add_many(tasks)
+        if self._report_index is not None:
+            self._report_index.clear()
+            self._report_index.add_many(tasks)
+        if before is not None:
+            self._change_feed.diff(before, tasks)
+
+    def _uses_journal(self, filename):
+        return self._journal is not None and filename in (None, self.storage_file)
+
+    def add_task(self, title, description="", priority=Priority.MEDIUM, due_at=None):
+        task = Task(title, description, priority, due_at)
+        self._insert(task)
         return task.id
 
+    def _insert(self, task):
+        self._store.add(task)
+        if self._search_index is not None:
+            self._search_index.add(task)
+        if self._report_index is not None:
+            self._report_index.add(task)
+        if self._journal is not None:
+            self._journal.record_add(task)
+        # Événement publié une fois la tâche journalisée
+        if self._change_feed is not None:
+            self._change_feed.created((task,))
+
+    @contextmanager
+    def _batch(self):
+        # Une opération groupée : une seule écriture de journal, un seul lot
+        # d'événements et, pour un store transactionnel (SQLite), une seule
+        # transaction. Les événements partent en dernier, une fois le lot écrit
+        with ExitStack() as stack:
+            if self._change_feed is not None:
+                stack.enter_context(self._change_feed.batch())
+            if self._journal is not None:
+                stack.enter_context(self._journal.batch())
+            stack.enter_context(self._store_batch())
+            yield
+
+    def _store_batch(self):
+        batch = getattr(self._store, "batch", None)
+        return batch() if batch is not None else ExitStack()
+
+    def _tasks_by_ids(self, task_ids):
+        get = self._store.get
+        for task_id in dict.fromkeys(task_ids):
+            task = get(task_id)
+            if task is not None:
+                yield task
+
+    def add_tasks(self, specs) -> List[str]:
+        # specs : titres ou dicts (title, description, priority, due_at, project_id).
+        # Tout le lot est validé avant la première insertion
+        tasks = Task.create_many(specs)
+        self._insert_many(tasks)
+        return [task.id for task in tasks]
+
+    def _insert_many(self, tasks):
+        with self._store_batch():
+            for task in tasks:
+                self._store.add(task)
+        if self._search_index is not None:
+            self._search_index.add_many(tasks)
+        if self._report_index is not None:
+            self._report_index.add_many(tasks)
+        if self._journal is not None:
+            with self._journal.batch():
+                for task in tasks:
+                    self._journal.record_add(task)
+        if self._change_feed is not None:
+            self._change_feed.created(tasks)
+
+    def delete_tasks(self, task_ids: Iterable[str]) -> int:
+        store = self._store
+        if hasattr(store, "remove_many"):
+            removed = store.remove_many(dict.fromkeys(task_ids))
+        else:
+            removed = [task for task in map(store.remove, dict.fromkeys(task_ids)) if task is not None]
+        with self._batch():
+            for task in removed:
+                if self._search_index is not None:
+                    self._search_index.remove(task.id)
+                if self._report_index is not None:
+                    self._report_index.remove(task.id)
+                if self._journal is not None:
+                    self._journal.record_delete(task.id)
+        if self._change_feed is not None:
+            self._change_feed.deleted(removed)
+        return len(removed)
+
+    def complete_tasks(self, task_ids: Iterable[str]) -> int:
+        # Même horodatage de fin pour tout le lot
+        now = datetime.now()
+        count = 0
+        with self._batch():
+            for task in self._tasks_by_ids(task_ids):
+                if task.status is not Status.DONE:
+                    task._complete(now)
+                    count += 1
+        return count
+
+    def update_priorities(self, task_ids: Iterable[str], priority: Priority) -> int:
+        if not isinstance(priority, Priority):
+            raise TypeError("Priority must be a Priority enum")
+        count = 0
+        with self._batch():
+            for task in self._tasks_by_ids(task_ids):
+                if task.priority is not priority:
+                    task.priority = priority
+                    count += 1
+        return count
+
+    def assign_to_project(self, task_ids: Iterable[str], project_id) -> int:
+        count = 0
+        with self._batch():
+            for task in self._tasks_by_ids(task_ids):
+                if task.project_id != project_id:
+                    task.project_id = project_id
+                    count += 1
+        return count
+
+    def archive_completed(self, archive: TaskArchive, before) -> int:
+        # Déplace vers ``archive`` les tâches DONE et CANCELLED terminées avant
+        # ``before`` ; l'archive est écrite avant la suppression. Sauvegarder
+        # ensuite (hors journal) pour alléger aussi le fichier
+        before = _as_datetime(before)
+        tasks = [task for status in ARCHIVED_STATUSES for task in self._store.by_status(status)
+                 if archived_at(task) < before]
+        if not tasks:
+            return 0
+        archive.add(tasks)
+        return self.delete_tasks([task.id for task in tasks])
+
     def get_task(self, task_id) -> Optional[Task]:
-        for task in self.tasks:
-            if task.id == task_id:
-                return task
-        return None
+        return self._store.get(task_id)
 
     def get_tasks_by_status(self, status: Status) -> List[Task]:
-        return [task for task in self.tasks if task.status == status]
+        return self._store.by_status(status)
 
     def get_tasks_by_priority(self, priority: Priority) -> List[Task]:
-        return [task for task in self.tasks if task.priority == priority]
+        return self._store.by_priority(priority)
+
+    def get_tasks_by_project(self, project_id) -> List[Task]:
+        return self._store.by_project(project_id)
+
+    def query(self) -> Query:
+        return Query(self._store)
+
+    def search(self, text, limit=20, prefix=True) -> List[Task]:
+        if self._search_index is None:
+            self._search_index = SearchIndex(self._store)
+        return [self._store.get(task_id) for task_id in self._search_index.search(text, limit, prefix)]
+
+    def reports(self) -> ReportAggregator:
+        if self._report_index is None:
+            self._report_index = ReportAggregator(self._store)
+        return self._report_index
+
+    def changes(self) -> ChangeFeed:
+        # Abonnements : manager.changes().subscribe(kinds=..., policy=...)
+        if self._change_feed is None:
+            self._change_feed = ChangeFeed()
+        return self._change_feed
 
     def delete_task(self, task_id) -> bool:
-        for i, task in enumerate(self.tasks):
-            if task.id == task_id:
-                del self.tasks[i]
-                return True
-        return False
+        task = self._store.remove(task_id)
+        if task is None:
+            return False
+        if self._search_index is not None:
+            self._search_index.remove(task_id)
+        if self._report_index is not None:
+            self._report_index.remove(task_id)
+        if self._journal is not None:
+            self._journal.record_delete(task_id)
+        if self._change_feed is not None:
+            self._change_feed.deleted((task,))
+        return True
+
+    def _tasks_to_save(self):
+        return self.tasks
+
+    def _current_format(self, filename):
+        # Format par défaut de save_to_file et load_from_file : celui du store
+        # ouvert si la cible est son propre fichier, pour ne jamais écrire du
+        # JSON par-dessus la base SQLite ; JSON, le format d'échange, sinon
+        store = self._store
+        if not isinstance(store, (SQLiteTaskStore, MappedTaskStore)):
+            return "json"
+        target = filename if filename is not None else self.storage_file
+        if os.path.abspath(target) != os.path.abspath(store.filename):
+            return "json"
+        return "sqlite" if isinstance(store, SQLiteTaskStore) else "binary"
+
+    def _check_not_open_database(self, filename):
+        store = self._store
+        if isinstance(store, SQLiteTaskStore) and os.path.abspath(filename) == os.path.abspath(store.filename):
+            raise IOError(f"Failed to save tasks: {filename} is the open SQLite database")
+
+    def save_to_file(self, filename=None, streaming=False, format=None):
+        if format is None:
+            format = self._current_format(filename)
+        if format == "sqlite":
+            filename = filename if filename is not None else self.storage_file
+            try:
+                if isinstance(self._store, SQLiteTaskStore) and self._store.filename == filename:
+                    # Les écritures sont déjà dans la base : on valide la transaction en cours
+                    self._store.flush()
+                else:
+                    write_sqlite(filename, self._tasks_to_save())
+            except (sqlite3.Error, IOError) as e:
+                raise IOError(f"Failed to save tasks: {e}")
+            return
+        if format == "binary":
+            filename = filename if filename is not None else self.storage_file
+            self._check_not_open_database(filename)
+            try:
+                write_snapshot(filename, self._tasks_to_save())
+            except IOError as e:
+                raise IOError(f"Failed to save tasks: {e}")
+            return
+        if format != "json":
+            raise ValueError(f"Unknown storage format: {format}")
+
+        if self._uses_journal(filename):
+            # En mode journal les mutations sont déjà persistées : on compacte
+            try:
+                self._journal.compact(wait=True)
+            except OSError as e:
+                raise IOError(f"Failed to save tasks: {e}")
+            return
 
-    def save_to_file(self, filename=None):
         if filename is None:
             filename = self.storage_file
+        self._check_not_open_database(filename)
+
+        if streaming:
+            try:
+                with open(filename, 'w', encoding='utf-8') as f:
+                    write_tasks(f, self._tasks_to_save())
+            except IOError as e:
+                raise IOError(f"Failed to save tasks: {e}")
+            return
         
         try:
             with open(filename, 'w') as f:
-                data = [task.to_dict() for task in self.tasks]
+                data = [task.to_dict() for task in self._tasks_to_save()]
                 json.dump(data, f, indent=2)
         except IOError as e:
             raise IOError(f"Failed to save tasks: {e}")
 
-    def load_from_file(self, filename=None):
+    def load_from_file(self, filename=None, streaming=False, format=None):
+        if format is None:
+            format = self._current_format(filename)
+        if format == "sqlite":
+            # Les tâches restent dans la base et sont lues à la demande
+            try:
+                self._set_store(SQLiteTaskStore(filename if filename is not None else self.storage_file))
+                self._record_loaded_store()
+            except (sqlite3.Error, IOError) as e:
+                raise IOError(f"Failed to load tasks: {e}")
+            return
+        if format == "binary":
+            # Le fichier est mappé : les tâches sont matérialisées à la demande
+            try:
+                self._set_store(MappedTaskStore(filename if filename is not None else self.storage_file))
+            except FileNotFoundError:
+                self._set_store(TaskStore())
+            except (ValueError, IOError) as e:
+                raise IOError(f"Failed to load tasks: {e}")
+            self._record_loaded_store()
+            return
+        if format != "json":
+            raise ValueError(f"Unknown storage format: {format}")
+
+        if self._uses_journal(filename):
+            try:
+                data = self._journal.load()
+            except (ValueError, KeyError, OSError) as e:
+                raise IOError(f"Failed to load tasks: {e}")
+            self._replace_tasks([Task.from_trusted_dict(task_data) for task_data in data])
+            return
+
         if filename is None:
             filename = self.storage_file
+
+        if streaming:
+            try:
+                self._load_tasks(list(iter_tasks_from_file(filename)))
+            except FileNotFoundError:
+                self._load_tasks([])
+            except (ValueError, IOError) as e:
+                raise IOError(f"Failed to load tasks: {e}")
+            return
         
         try:
             with open(filename, 'r') as f:
                 data = json.load(f)
-                self.tasks = [Task.from_dict(task_data) for task_data in data]
+                self._load_tasks([Task.from_trusted_dict(task_data) for task_data in data])
         except FileNotFoundError:
-            self.tasks = []
+            self._load_tasks([])
         except (json.JSONDecodeError, IOError) as e:
             raise IOError(f"Failed to load tasks: {e}")
 
+    def iter_tasks_from_file(self, filename=None):
+        # Itère sur les tâches d'un fichier sans les charger dans le gestionnaire
+        return iter_tasks_from_file(filename if filename is not None else self.storage_file)
+
+    def export_csv(self, target, **options) -> int:
+        # options : voir write_tasks_csv (chunk_size, compress, extended, processes)
+        try:
+            return write_tasks_csv(target, self._tasks_to_save(), **options)
+        except OSError as e:
+            raise IOError(f"Failed to export CSV: {e}")
+
+    def import_csv(self, source, replace=False) -> int:
+        # Ajoute les tâches d'un export CSV, ou remplace tout le contenu
+        try:
+            tasks = list(read_tasks_csv(source))
+        except (ValueError, OSError) as e:
+            raise IOError(f"Failed to import CSV: {e}")
+        if replace:
+            self.tasks = tasks
+        else:
+            self._insert_many(tasks)
+        return len(tasks)
+
+    def close(self):
+        if self._journal is not None:
+            self._journal.close()
+        if hasattr(self._store, "close"):
+            self._store.close()
+
     def get_statistics(self):
-        total_tasks = len(self.tasks)
-        completed_tasks = len(self.get_tasks_by_status(Status.DONE))
-        
-        tasks_by_priority = {}
-        for priority in Priority:
-            tasks_by_priority[priority.value] = len(self.get_tasks_by_priority(priority))
-        
-        tasks_by_status = {}
-        for status in Status:
-            tasks_by_status[status.value] = len(self.get_tasks_by_status(status))
-        
+        store = self._store
+        if hasattr(store, "statistics"):
+            return store.statistics()
         return {
-            "total_tasks": total_tasks,
-            "completed_tasks": completed_tasks,
-            "tasks_by_priority": tasks_by_priority,
-            "tasks_by_status": tasks_by_status
-        }
\ No newline at end of file
+            "total_tasks": len(store),
+            "completed_tasks": store.count_by_status(Status.DONE),
+            "tasks_by_priority": {priority.value: store.count_by_priority(priority) for priority in Priority},
+            "tasks_by_status": {status.value: store.count_by_status(status) for status in Status}
+        }
@@ -0,0 +1,300 @@
+import heapq
+from itertools import islice
+from typing import Iterator, List, Optional, Tuple
+
+from .task import Task, Priority, Status
+
+_PRIORITY_RANK = {priority: rank for rank, priority in enumerate(Priority)}
+_STATUS_RANK = {status: rank for rank, status in enumerate(Status)}
+SORT_FIELDS = ("created_at", "completed_at", "priority", "status", "title", "project_id", "due_at", "id")
+# En dessous de ce facteur de sélectivité, un index de filtre bat le parcours trié
+_ORDERED_SCAN_FACTOR = 10
+
+
+def _sort_key(field):
+    if field == "priority":
+        return lambda task: (0, _PRIORITY_RANK[task.priority], task.id)
+    if field == "status":
+        return lambda task: (0, _STATUS_RANK[task.status], task.id)
+    if field == "id":
+        return lambda task: (0, task.id, "")
+
+    def key(task):
+        value = getattr(task, field)
+        # Les valeurs None sont rangées après toutes les autres
+        return (1, 0, task.id) if value is None else (0, value, task.id)
+    return key
+
+
+class Query:
+    """Requête composable sur les tâches d'un TaskManager.
+
+    Les méthodes de filtre renvoient la requête elle-même pour être chaînées.
+    À l'exécution, le plan choisit la source la moins coûteuse (liste d'ids,
+    index statut/priorité/projet, index trié sur created_at ou parcours
+    complet) d'après les compteurs du store, puis applique les autres filtres
+    à la volée.
+    """
+
+    def __init__(self, store):
+        self._store = store
+        self._ids = None
+        self._statuses = None
+        self._priorities = None
+        self._projects = None
+        self._created = (None, None)
+        self._completed = (None, None)
+        self._due = (None, None)
+        self._title = None
+        self._description = None
+        self._predicates = []
+        self._order = None
+        self._descending = False
+        self._offset = 0
+        self._limit = None
+        self._after = None
+
+    def ids(self, *task_ids):
+        self._ids = set(task_ids) if self._ids is None else self._ids & set(task_ids)
+        return self
+
+    def status(self, *statuses: Status):
+        self._statuses = self._restrict(self._statuses, statuses, Status)
+        return self
+
+    def exclude_status(self, *statuses: Status):
+        return self.status(*(status for status in Status if status not in statuses))
+
+    def priority(self, *priorities: Priority):
+        self._priorities = self._restrict(self._priorities, priorities, Priority)
+        return self
+
+    def exclude_priority(self, *priorities: Priority):
+        return self.priority(*(priority for priority in Priority if priority not in priorities))
+
+    def project(self, *project_ids):
+        self._projects = set(project_ids) if self._projects is None else self._projects & set(project_ids)
+        return self
+
+    def created_between(self, start=None, end=None):
+        # Intervalle [start, end[ ; None laisse la borne ouverte
+        self._created = self._intersect(self._created, start, end)
+        return self
+
+    def completed_between(self, start=None, end=None):
+        self._completed = self._intersect(self._completed, start, end)
+        return self
+
+    def due_between(self, start=None, end=None):
+        self._due = self._intersect(self._due, start, end)
+        return self
+
+    def title_contains(self, text):
+        self._title = text.casefold()
+        return self
+
+    def description_contains(self, text):
+        self._description = text.casefold()
+        return self
+
+    def filter(self, predicate):
+        self._predicates.append(predicate)
+        return self
+
+    def order_by(self, field, descending=False):
+        if field not in SORT_FIELDS:
+            raise ValueError(f"Cannot sort on {field!r}")
+        self._order = field
+        self._descending = descending
+        return self
+
+    def offset(self, count):
+        if count < 0:
+            raise ValueError("Offset cannot be negative")
+        self._offset = count
+        return self
+
+    def limit(self, count):
+        if count is not None and count < 0:
+            raise ValueError("Limit cannot be negative")
+        self._limit = count
+        return self
+
+    def after(self, cursor):
+        # Pagination par curseur : reprend juste après la dernière tâche vue
+        self._after = cursor
+        return self
+
+    @staticmethod
+    def _restrict(current, values, enum_type):
+        for value in values:
+            if not isinstance(value, enum_type):
+                raise TypeError(f"Expected a {enum_type.__name__} enum")
+        values = set(values)
+        return values if current is None else current & values
+
+    @staticmethod
+    def _intersect(bounds, start, end):
+        old_start, old_end = bounds
+        if old_start is not None and (start is None or old_start > start):
+            start = old_start
+        if old_end is not None and (end is None or old_end < end):
+            end = old_end
+        return start, end
+
+    def _compile(self):
+        # Un prédicat par filtre actif seulement, pour garder le parcours léger ;
+        # les filtres texte sont testés en ligne par _match_text
+        checks = []
+        if self._ids is not None:
+            ids = self._ids
+            checks.append(lambda task: task.id in ids)
+        if self._statuses is not None and len(self._statuses) < len(Status):
+            statuses = self._statuses
+            checks.append(lambda task: task.status in statuses)
+        if self._priorities is not None and len(self._priorities) < len(Priority):
+            priorities = self._priorities
+            checks.append(lambda task: task.priority in priorities)
+        if self._projects is not None:
+            projects = self._projects
+            checks.append(lambda task: task.project_id in projects)
+        if self._created != (None, None):
+            checks.append(self._range_check("created_at", *self._created))
+        if self._completed != (None, None):
+            checks.append(self._range_check("completed_at", *self._completed))
+        if self._due != (None, None):
+            checks.append(self._range_check("due_at", *self._due))
+        checks.extend(self._predicates)
+        if not checks:
+            return None
+        if len(checks) == 1:
+            return checks[0]
+        return lambda task: all(check(task) for check in checks)
+
+    def _match_text(self, tasks):
+        # Sans index texte, le filtre parcourt souvent toutes les tâches : le
+        # test est écrit dans le générateur plutôt qu'appelé tâche par tâche
+        title, description = self._title, self._description
+        if title is None and description is None:
+            return tasks
+        if description is None:
+            return (task for task in tasks if title in task._title.casefold())
+        if title is None:
+            return (task for task in tasks if description in task._description.casefold())
+        return (task for task in tasks
+                if title in task._title.casefold() and description in task._description.casefold())
+
+    @staticmethod
+    def _range_check(field, start, end):
+        def check(task):
+            value = getattr(task, field)
+            return value is not None and (start is None or value >= start) and (end is None or value < end)
+        return check
+
+    def _candidates(self):
+        # Chaque source : (estimation, nom, fabrique d'itérateur, déjà triée ?)
+        store = self._store
+        sources = [(len(store), "scan", lambda: iter(store), False)]
+        if self._ids is not None:
+            sources.append((len(self._ids), "ids", self._iter_ids, False))
+        if self._statuses is not None:
+            estimate = sum(store.count_by_status(status) for status in self._statuses)
+            sources.append((estimate, "status index", lambda: self._iter_buckets(store.by_status, self._statuses), False))
+        if self._priorities is not None:
+            estimate = sum(store.count_by_priority(priority) for priority in self._priorities)
+            sources.append((estimate, "priority index",
+                            lambda: self._iter_buckets(store.by_priority, self._priorities), False))
+        if self._projects is not None:
+            estimate = sum(store.count_by_project(project_id) for project_id in self._projects)
+            sources.append((estimate, "project index",
+                            lambda: self._iter_buckets(store.by_project, self._projects), False))
+        if hasattr(store, "created_range"):
+            start, end = self._created
+            ordered = self._order == "created_at"
+            if ordered or self._created != (None, None):
+                sources.append((store.count_created_range(start, end), "created_at index", self._iter_created, ordered))
+        return sources
+
+    def _iter_ids(self):
+        for task_id in self._ids:
+            task = self._store.get(task_id)
+            if task is not None:
+                yield task
+
+    @staticmethod
+    def _iter_buckets(lookup, keys):
+        for key in keys:
+            yield from lookup(key)
+
+    def _iter_created(self):
+        start, end = self._created
+        after = None
+        if self._after is not None and self._order == "created_at":
+            after = (self._after[1], self._after[2]) if self._after[0] == 0 else None
+        return self._store.created_range(start, end, after=after, reverse=self._descending)
+
+    def _plan(self):
+        sources = self._candidates()
+        best = min(sources, key=lambda source: source[0])
+        ordered = [source for source in sources if source[3]]
+        if ordered and best is not ordered[0]:
+            # Le parcours déjà trié évite un tri complet et s'arrête tôt avec limit
+            if self._limit is not None and ordered[0][0] <= best[0] * _ORDERED_SCAN_FACTOR:
+                best = ordered[0]
+        return best
+
+    def explain(self) -> str:
+        estimate, name, _, ordered = self._plan()
+        sort = "" if self._order is None else (" (pre-sorted)" if ordered else f" + sort on {self._order}")
+        return f"{name} (~{estimate} candidates){sort}"
+
+    def __iter__(self) -> Iterator[Task]:
+        _, _, source, ordered = self._plan()
+        predicate = self._compile()
+        tasks = self._match_text(source() if predicate is None else filter(predicate, source()))
+        stop = None if self._limit is None else self._offset + self._limit
+        if self._order is not None and not ordered:
+            key = _sort_key(self._order)
+            if self._after is not None:
+                cursor = tuple(self._after)
+                if self._descending:
+                    tasks = (task for task in tasks if key(task) < cursor)
+                else:
+                    tasks = (task for task in tasks if key(task) > cursor)
+            if stop is not None:
+                select = heapq.nlargest if self._descending else heapq.nsmallest
+                tasks = iter(select(stop, tasks, key=key))
+            else:
+                tasks = iter(sorted(tasks, key=key, reverse=self._descending))
+        elif self._order is None and self._after is not None:
+            raise ValueError("Cursor pagination requires order_by")
+        return islice(tasks, self._offset, stop)
+
+    def all(self) -> List[Task]:
+        return list(self)
+
+    def first(self) -> Optional[Task]:
+        limit = self._limit
+        if limit is None or limit > 1:
+            self._limit = 1
+        try:
+            return next(iter(self), None)
+        finally:
+            self._limit = limit
+
+    def count(self) -> int:
+        return sum(1 for _ in self)
+
+    def cursor(self, task: Task) -> Tuple:
+        return _sort_key(self._order or "created_at")(task)
+
+    def page(self, size, cursor=None) -> Tuple[List[Task], Optional[Tuple]]:
+        # Renvoie une page et le curseur à passer pour obtenir la suivante
+        if self._order is None:
+            self.order_by("created_at")
+        self._offset = 0
+        self._limit = size
+        self._after = cursor
+        tasks = list(self)
+        next_cursor = self.cursor(tasks[-1]) if len(tasks) == size else None
+        return tasks, next_cursor
@@ -0,0 +1,203 @@
+import heapq
+import itertools
+import threading
+from datetime import datetime, timedelta
+
+from .task import Priority, Status
+
+_PRIORITY_RANK = {priority: rank for rank, priority in enumerate(Priority)}
+_FINISHED = (Status.DONE, Status.CANCELLED)
+# En dessous de cette taille, le tas n'est jamais reconstruit
+_MIN_COMPACT_SIZE = 1024
+
+
+class ReminderScheduler:
+    """Planificateur des rappels d'échéance, envoyés via un EmailService.
+
+    Les rappels sont rangés dans un tas par heure d'envoi (``due_at`` moins
+    l'avance définie pour la priorité), les priorités hautes passant d'abord à
+    heure égale. Replanifier ou annuler un rappel marque simplement l'ancienne
+    entrée comme périmée : elle est écartée quand elle remonte au sommet du
+    tas, qui est reconstruit si les entrées périmées deviennent majoritaires.
+    Le thread d'envoi (start/stop) dort jusqu'au prochain rappel.
+    """
+
+    def __init__(self, email_service, lead_times=None, manager=None, clock=datetime.now):
+        # lead_times : {Priority: timedelta}, avance du rappel sur l'échéance
+        self.email_service = email_service
+        self.lead_times = dict(lead_times or {})
+        # Si un gestionnaire est donné, les tâches supprimées depuis ne sont pas rappelées
+        self.manager = manager
+        self.clock = clock
+        self.errors = []
+        self._heap = []
+        self._entries = {}
+        self._stale = 0
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._stopping = False
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, task_id):
+        return task_id in self._entries
+
+    def schedule(self, task, email) -> bool:
+        if task.due_at is None:
+            raise ValueError("Task has no due date")
+        if not self.email_service._is_valid_email(email):
+            raise ValueError("Invalid email address")
+        if task.status in _FINISHED:
+            return False
+        with self._condition:
+            if task.id not in self._entries:
+                task._add_observer(self._on_task_changed)
+            entry = self._push(task, email)
+            if self._heap[0] is entry:
+                self._condition.notify()
+        return True
+
+    def schedule_many(self, reminders) -> int:
+        # reminders : itérable de (tâche, email). Le tas est reconstruit une
+        # seule fois (O(n)) au lieu de n insertions
+        entries = []
+        for task, email in reminders:
+            if task.due_at is None or task.status in _FINISHED:
+                continue
+            if not self.email_service._is_valid_email(email):
+                raise ValueError(f"Invalid email address: {email}")
+            entries.append((task, email))
+        with self._condition:
+            for task, email in entries:
+                old = self._entries.get(task.id)
+                if old is None:
+                    task._add_observer(self._on_task_changed)
+                else:
+                    old[3] = None
+                    self._stale += 1
+                entry = self._entry(task, email)
+                self._entries[task.id] = entry
+                self._heap.append(entry)
+            heapq.heapify(self._heap)
+            self._condition.notify()
+        return len(entries)
+
+    def cancel(self, task_id) -> bool:
+        with self._condition:
+            entry = self._entries.pop(task_id, None)
+            if entry is None:
+                return False
+            entry[3]._remove_observer(self._on_task_changed)
+            entry[3] = None
+            self._stale += 1
+            self._maybe_compact()
+        return True
+
+    def next_due(self):
+        with self._condition:
+            return self._peek()
+
+    def run_pending(self, now=None) -> int:
+        # Envoie les rappels arrivés à échéance ; renvoie le nombre d'envois réussis
+        if now is None:
+            now = self.clock()
+        due = []
+        with self._condition:
+            heap = self._heap
+            while heap and (heap[0][3] is None or heap[0][0] <= now):
+                entry = heapq.heappop(heap)
+                task, email = entry[3], entry[4]
+                if task is None:
+                    self._stale -= 1
+                    continue
+                del self._entries[task.id]
+                task._remove_observer(self._on_task_changed)
+                due.append((task, email))
+        sent = 0
+        for task, email in due:
+            if self.manager is not None and self.manager.get_task(task.id) is None:
+                continue
+            try:
+                self.email_service.send_task_reminder(email, task.title, task.due_at)
+            except Exception as e:
+                self.errors.append((task.id, e))
+            else:
+                sent += 1
+        return sent
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._stopping:
+                    next_due = self._peek()
+                    if next_due is None:
+                        self._condition.wait()
+                        continue
+                    delay = (next_due - self.clock()).total_seconds()
+                    if delay <= 0:
+                        break
+                    self._condition.wait(delay)
+                if self._stopping:
+                    return
+            self.run_pending()
+
+    def _entry(self, task, email):
+        fire_at = task.due_at - self.lead_times.get(task.priority, timedelta(0))
+        return [fire_at, -_PRIORITY_RANK[task.priority], next(self._counter), task, email]
+
+    def _push(self, task, email):
+        old = self._entries.get(task.id)
+        if old is not None:
+            old[3] = None
+            self._stale += 1
+        entry = self._entry(task, email)
+        self._entries[task.id] = entry
+        heapq.heappush(self._heap, entry)
+        self._maybe_compact()
+        return entry
+
+    def _peek(self):
+        heap = self._heap
+        while heap and heap[0][3] is None:
+            heapq.heappop(heap)
+            self._stale -= 1
+        return heap[0][0] if heap else None
+
+    def _maybe_compact(self):
+        if len(self._heap) > _MIN_COMPACT_SIZE and self._stale > len(self._heap) // 2:
+            self._heap = [entry for entry in self._heap if entry[3] is not None]
+            heapq.heapify(self._heap)
+            self._stale = 0
+
+    def _on_task_changed(self, task, field, old, new):
+        if field == "status" and new in _FINISHED:
+            self.cancel(task.id)
+        elif field in ("due_at", "priority"):
+            with self._condition:
+                entry = self._entries.get(task.id)
+                if entry is None:
+                    return
+                if task.due_at is None:
+                    self.cancel(task.id)
+                    return
+                entry = self._push(task, entry[4])
+                if self._heap[0] is entry:
+                    self._condition.notify()
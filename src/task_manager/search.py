@@ -0,0 +1,141 @@
+import heapq
+import math
+import re
+import unicodedata
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, Iterable, List, Tuple
+
+from .task import Task
+
+_TOKEN = re.compile(r"\w+")
+TITLE_WEIGHT = 3
+_K1 = 1.2
+_B = 0.75
+
+
+def normalize(text) -> str:
+    # "Réunion Équipe" -> "reunion equipe" : accents retirés, casse ignorée
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+
+
+def tokenize(text) -> List[str]:
+    return _TOKEN.findall(normalize(text)) if text else []
+
+
+class SearchIndex:
+    """Index inversé sur les titres et descriptions des tâches.
+
+    Chaque terme pointe vers les tâches qui le contiennent avec une fréquence
+    pondérée (les termes du titre comptent TITLE_WEIGHT fois). Les recherches
+    renvoient des ids classés par BM25. Le vocabulaire trié, utilisé pour les
+    recherches par préfixe, n'est reconstruit que si de nouveaux termes sont
+    apparus depuis la dernière recherche.
+    """
+
+    def __init__(self, tasks: Iterable[Task] = ()):
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._documents: Dict[str, Counter] = {}
+        self._lengths: Dict[str, int] = {}
+        self._total_length = 0
+        self._vocabulary = []
+        self._vocabulary_dirty = False
+        self.add_many(tasks)
+
+    def __len__(self):
+        return len(self._documents)
+
+    def add(self, task: Task):
+        if task.id in self._documents:
+            self.remove(task.id)
+        terms = Counter(tokenize(task.description))
+        for term in tokenize(task.title):
+            terms[term] += TITLE_WEIGHT
+        postings = self._postings
+        for term, frequency in terms.items():
+            posting = postings.get(term)
+            if posting is None:
+                posting = postings[term] = {}
+                self._vocabulary_dirty = True
+            posting[task.id] = frequency
+        length = sum(terms.values())
+        self._documents[task.id] = terms
+        self._lengths[task.id] = length
+        self._total_length += length
+
+    def add_many(self, tasks: Iterable[Task]):
+        for task in tasks:
+            self.add(task)
+
+    def remove(self, task_id):
+        terms = self._documents.pop(task_id, None)
+        if terms is None:
+            return
+        for term in terms:
+            posting = self._postings[term]
+            del posting[task_id]
+            if not posting:
+                del self._postings[term]
+                self._vocabulary_dirty = True
+        self._total_length -= self._lengths.pop(task_id)
+
+    def update(self, task: Task):
+        self.add(task)
+
+    def clear(self):
+        self.__init__()
+
+    def _expand(self, term, prefix):
+        if not prefix:
+            return [term] if term in self._postings else []
+        if self._vocabulary_dirty:
+            self._vocabulary = sorted(self._postings)
+            self._vocabulary_dirty = False
+        vocabulary = self._vocabulary
+        start = bisect_left(vocabulary, term)
+        end = start
+        while end < len(vocabulary) and vocabulary[end].startswith(term):
+            end += 1
+        return vocabulary[start:end]
+
+    def search_scored(self, query, limit=20, prefix=True) -> List[Tuple[str, float]]:
+        # Tous les termes doivent correspondre ; le dernier est traité comme un
+        # préfixe (saisie en cours), ou tout terme terminé par "*"
+        words = query.split()
+        terms = []
+        for position, word in enumerate(words):
+            is_prefix = word.endswith("*") or (prefix and position == len(words) - 1)
+            for token in tokenize(word.rstrip("*")):
+                terms.append((token, is_prefix))
+        if not terms or not self._documents:
+            return []
+
+        count = len(self._documents)
+        average_length = self._total_length / count or 1
+        scores = None
+        for token, is_prefix in terms:
+            term_scores = {}
+            for term in self._expand(token, is_prefix):
+                posting = self._postings[term]
+                idf = math.log(1 + (count - len(posting) + 0.5) / (len(posting) + 0.5))
+                for task_id, frequency in posting.items():
+                    norm = _K1 * (1 - _B + _B * self._lengths[task_id] / average_length)
+                    score = idf * frequency * (_K1 + 1) / (frequency + norm)
+                    if score > term_scores.get(task_id, 0.0):
+                        term_scores[task_id] = score
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {task_id: score + term_scores[task_id]
+                          for task_id, score in scores.items() if task_id in term_scores}
+            if not scores:
+                return []
+
+        rank = lambda item: (-item[1], item[0])
+        if limit is not None:
+            return heapq.nsmallest(limit, scores.items(), key=rank)
+        return sorted(scores.items(), key=rank)
+
+    def search(self, query, limit=20, prefix=True) -> List[str]:
+        return [task_id for task_id, _ in self.search_scored(query, limit, prefix)]
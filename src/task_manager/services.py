@@ -1,48 +1,138 @@
 import smtplib
 import csv
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import chain
 import re
 
+from .analytics import ReportAggregator, _day
+from .csv_io import write_tasks_csv
+from .delivery import DeliveryPipeline, SMTPConnectionPool, build_message
+from .task import Status
+
+_EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+
+@lru_cache(maxsize=4096)
+def _is_valid_address(email):
+    # Mémoïsé : une campagne de rappels revalide souvent les mêmes destinataires
+    return _EMAIL_PATTERN.match(email) is not None
+
+
 class EmailService:
-    def __init__(self, smtp_server="smtp.gmail.com", port=587):
+    def __init__(self, smtp_server="smtp.gmail.com", port=587, sender="noreply@taskmanager.local", pipeline=None):
         self.smtp_server = smtp_server
         self.port = port
+        self.sender = sender
+        self.pipeline = pipeline
+
+    @classmethod
+    def pooled(cls, smtp_server="smtp.gmail.com", port=587, sender="noreply@taskmanager.local",
+               pool_size=4, username=None, password=None, starttls=False, **pipeline_options):
+        # Service qui envoie réellement via un pool de connexions SMTP
+        pool = SMTPConnectionPool(smtp_server, port, size=pool_size, username=username,
+                                  password=password, starttls=starttls, factory=smtplib.SMTP)
+        pipeline_options.setdefault("workers", pool_size)
+        return cls(smtp_server, port, sender, DeliveryPipeline(pool, **pipeline_options))
 
     def send_task_reminder(self, email, task_title, due_date):
         if not self._is_valid_email(email):
             raise ValueError("Invalid email address")
         
-        # Je simule l'envoi d'email avec un print
-        print(f"Sending reminder to {email} for task: {task_title}")
-        return True
+        if self.pipeline is None:
+            # Je simule l'envoi d'email avec un print
+            print(f"Sending reminder to {email} for task: {task_title}")
+            return True
+        return self._deliver(email, *self._reminder(task_title, due_date))
 
     def send_completion_notification(self, email, task_title):
         if not self._is_valid_email(email):
             raise ValueError("Invalid email address")
         
-        # Je simule l'envoi d'email avec un print
-        print(f"Sending completion notification to {email} for task: {task_title}")
+        if self.pipeline is None:
+            # Je simule l'envoi d'email avec un print
+            print(f"Sending completion notification to {email} for task: {task_title}")
+            return True
+        return self._deliver(email, f"Task completed: {task_title}", f"The task \"{task_title}\" has been completed.")
+
+    def send_task_reminders(self, reminders):
+        # reminders : itérable de (email, titre, échéance). Renvoie un Future
+        # par message, résolu quand le serveur l'a accepté
+        if self.pipeline is None:
+            raise RuntimeError("Bulk sending requires a delivery pipeline")
+        futures = []
+        for email, task_title, due_date in reminders:
+            if not self._is_valid_email(email):
+                raise ValueError(f"Invalid email address: {email}")
+            futures.append(self._submit(email, *self._reminder(task_title, due_date)))
+        return futures
+
+    def close(self):
+        if self.pipeline is not None:
+            self.pipeline.close()
+
+    @staticmethod
+    def _reminder(task_title, due_date):
+        due = due_date.strftime("%Y-%m-%d %H:%M") if due_date else "soon"
+        return f"Reminder: {task_title}", f"The task \"{task_title}\" is due {due}."
+
+    def _deliver(self, email, subject, body):
+        # Attend que le serveur ait accepté le message : une erreur SMTP remonte
+        # à l'appelant. Pour ne pas attendre, send_task_reminders renvoie les Futures
+        self._submit(email, subject, body).result()
         return True
 
+    def _submit(self, email, subject, body):
+        return self.pipeline.submit(build_message(self.sender, email, subject, body))
+
     def _is_valid_email(self, email):
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
+        return _is_valid_address(email)
 
 class ReportService:
-    def generate_daily_report(self, tasks, date=None):
+    def generate_daily_report(self, tasks, date=None, archive=None):
         if date is None:
             date = datetime.now()
         
-        daily_tasks = [task for task in tasks if task.created_at.date() == date.date()]
-        completed_today = [task for task in daily_tasks if task.status.value == "done"]
+        # Un seul parcours ; les rapports sur plusieurs jours passent par aggregate()
+        day = date.date()
+        created = completed = 0
+        for task in self._with_archive(tasks, archive, day):
+            if task.created_at.date() == day:
+                created += 1
+                if task.status is Status.DONE:
+                    completed += 1
         
         return {
             "date": date.strftime("%Y-%m-%d"),
-            "total_tasks_created": len(daily_tasks),
-            "tasks_completed": len(completed_today),
-            "completion_rate": len(completed_today) / len(daily_tasks) * 100 if daily_tasks else 0
+            "total_tasks_created": created,
+            "tasks_completed": completed,
+            "completion_rate": completed / created * 100 if created else 0
         }
 
+    def aggregate(self, tasks) -> ReportAggregator:
+        # Agrégats en un parcours, réutilisables pour plusieurs rapports
+        return tasks if isinstance(tasks, ReportAggregator) else ReportAggregator(tasks)
+
+    def _with_archive(self, tasks, archive, start):
+        # Historique : ajoute les tâches de ``archive`` (TaskArchive) terminées
+        # depuis ``start``, les seules qui peuvent avoir été créées ensuite
+        if archive is None:
+            return tasks
+        if isinstance(tasks, ReportAggregator):
+            raise TypeError("Archived history needs the live tasks, not a ReportAggregator")
+        return chain(tasks, archive.iter_tasks(start=start))
+
+    def generate_range_report(self, tasks, start, end, archive=None):
+        # Le rapport compte des jours entiers : l'archive est lue dès minuit
+        return self.aggregate(self._with_archive(tasks, archive, _day(start))).range_report(start, end)
+
+    def generate_weekly_report(self, tasks, date=None, archive=None):
+        if date is None:
+            date = datetime.now()
+        day = date.date() if isinstance(date, datetime) else date
+        monday = day - timedelta(days=day.weekday())
+        return self.aggregate(self._with_archive(tasks, archive, monday)).weekly_report(date)
+
     def export_tasks_csv(self, tasks, filename):
         try:
             with open(filename, 'w', newline='') as csvfile:
@@ -60,4 +150,12 @@ class ReportService:
                         task.completed_at.isoformat() if task.completed_at else ""
                     ])
         except IOError as e:
-            raise IOError(f"Failed to export CSV: {e}")
\ No newline at end of file
+            raise IOError(f"Failed to export CSV: {e}")
+
+    def stream_tasks_csv(self, tasks, target, **options):
+        # Variante en flux de export_tasks_csv : itérable quelconque, écriture
+        # par morceaux, gzip, objet fichier (voir write_tasks_csv)
+        try:
+            return write_tasks_csv(target, tasks, **options)
+        except IOError as e:
+            raise IOError(f"Failed to export CSV: {e}")
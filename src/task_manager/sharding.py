@@ -0,0 +1,403 @@
+import bisect
+import multiprocessing
+import os
+import threading
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional
+
+from .manager import TaskManager
+from .search import SearchIndex
+from .snapshot import _id_hash
+from .task import Task, Priority, Status
+
+
+class HashRing:
+    """Anneau de hachage cohérent, avec ``replicas`` points virtuels par nœud.
+
+    Une clé appartient au premier point qui suit son hash sur l'anneau. Ajouter
+    ou retirer un nœud ne déplace que les clés des arcs qu'il gagne ou perd,
+    soit environ 1/n des clés.
+    """
+
+    def __init__(self, nodes: Iterable[str] = (), replicas=64):
+        self.replicas = replicas
+        self._points = []
+        self._owners = []
+        for node in nodes:
+            self.add(node)
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def __contains__(self, node):
+        return node in self._owners
+
+    @property
+    def nodes(self) -> List[str]:
+        return sorted(set(self._owners))
+
+    def add(self, node):
+        if node in self._owners:
+            raise ValueError(f"Node already in ring: {node}")
+        for replica in range(self.replicas):
+            point = _id_hash(f"{node}#{replica}")
+            index = bisect.bisect_left(self._points, point)
+            self._points.insert(index, point)
+            self._owners.insert(index, node)
+
+    def remove(self, node):
+        kept = [(point, owner) for point, owner in zip(self._points, self._owners) if owner != node]
+        if len(kept) == len(self._points):
+            raise ValueError(f"Unknown node: {node}")
+        self._points = [point for point, _ in kept]
+        self._owners = [owner for _, owner in kept]
+
+    def node_for(self, key) -> str:
+        if not self._points:
+            raise ValueError("Hash ring is empty")
+        index = bisect.bisect_right(self._points, _id_hash(key))
+        return self._owners[index if index < len(self._points) else 0]
+
+
+# Opérations exécutées dans les processus de shard, en plus des méthodes
+# publiques du TaskManager listées dans _FORWARDED
+def _insert_tasks(manager, tasks):
+    with manager._batch():
+        for task in tasks:
+            manager._insert(task)
+    return len(tasks)
+
+
+def _get_tasks(manager, task_ids):
+    return [task for task in map(manager.get_task, task_ids) if task is not None]
+
+
+def _search(manager, text, limit, prefix):
+    if manager._search_index is None:
+        manager._search_index = SearchIndex(manager.tasks)
+    return [(score, manager.get_task(task_id))
+            for task_id, score in manager._search_index.search_scored(text, limit, prefix)]
+
+
+def _extract(manager, ring, name):
+    # Retire et renvoie les tâches qui n'appartiennent plus à ce shard
+    moved = [task for task in manager.tasks if ring.node_for(task.id) != name]
+    manager.delete_tasks([task.id for task in moved])
+    return moved
+
+
+_OPERATIONS = {
+    "insert": _insert_tasks,
+    "get_many": _get_tasks,
+    "search": _search,
+    "extract": _extract,
+    "count": lambda manager: len(manager.tasks),
+    "all": lambda manager: list(manager.tasks),
+}
+_FORWARDED = {
+    "get_task", "delete_task", "delete_tasks", "complete_tasks", "update_priorities", "assign_to_project",
+    "get_tasks_by_status", "get_tasks_by_priority", "get_tasks_by_project", "get_statistics",
+    "save_to_file", "load_from_file",
+}
+
+
+def _serve(connection, storage_file, journal, compact_threshold):
+    # Boucle d'un processus de shard : (opération, args) -> (succès, résultat)
+    manager = TaskManager(storage_file, journal=journal, compact_threshold=compact_threshold)
+    try:
+        while True:
+            try:
+                request = connection.recv()
+            except EOFError:
+                break
+            if request is None:
+                break
+            operation, args = request
+            try:
+                if operation in _OPERATIONS:
+                    result = _OPERATIONS[operation](manager, *args)
+                elif operation in _FORWARDED:
+                    result = getattr(manager, operation)(*args)
+                else:
+                    raise ValueError(f"Unknown shard operation: {operation}")
+            except Exception as e:
+                connection.send((False, e))
+            else:
+                connection.send((True, result))
+    finally:
+        manager.close()
+        connection.close()
+
+
+class _Shard:
+    def __init__(self, name, storage_file, context, journal, compact_threshold):
+        self.name = name
+        self.storage_file = storage_file
+        # Une requête à la fois par canal ; les shards différents restent parallèles
+        self.lock = threading.Lock()
+        self._connection, child = context.Pipe()
+        self.process = context.Process(target=_serve, args=(child, storage_file, journal, compact_threshold),
+                                       name=f"task-{name}", daemon=True)
+        self.process.start()
+        child.close()
+
+    def send(self, operation, args):
+        self._connection.send((operation, args))
+
+    def receive(self):
+        ok, result = self._connection.recv()
+        if not ok:
+            raise result
+        return result
+
+    def call(self, operation, *args):
+        with self.lock:
+            self.send(operation, args)
+            return self.receive()
+
+    def close(self, timeout=5):
+        with self.lock:
+            try:
+                self._connection.send(None)
+            except OSError:
+                pass
+            self._connection.close()
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+
+
+class ShardedTaskManager:
+    """TaskManager réparti sur plusieurs processus, un shard par processus.
+
+    Les tâches sont placées par hachage cohérent de leur id ; chaque shard
+    tient son propre TaskManager et son fichier (``tasks.shard-0.json``...).
+    Les accès par id sont routés vers un seul shard, les filtres, la
+    recherche et les statistiques sont envoyés à tous les shards puis
+    fusionnés : les shards travaillent en parallèle, sur des cœurs distincts.
+
+    Les tâches renvoyées sont des copies : les modifier ne change pas le
+    shard, on passe par les méthodes groupées (complete_tasks...). Les appels
+    peuvent venir de plusieurs threads, sauf add_shard/remove_shard/rebalance
+    qui doivent s'exécuter seuls.
+    """
+
+    def __init__(self, storage_file="tasks.json", shards=4, journal=False, compact_threshold=10000,
+                 replicas=64, context=None):
+        # shards : nombre de shards, ou liste de leurs noms
+        names = [f"shard-{index}" for index in range(shards)] if isinstance(shards, int) else list(shards)
+        if not names:
+            raise ValueError("At least one shard is required")
+        self.storage_file = storage_file
+        self._options = (journal, compact_threshold)
+        self._context = context if context is not None else multiprocessing.get_context()
+        self._ring = HashRing(replicas=replicas)
+        self._shards = {}
+        try:
+            for name in names:
+                self._start_shard(name)
+        except BaseException:
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __len__(self):
+        return sum(self._broadcast("count").values())
+
+    @property
+    def shard_names(self) -> List[str]:
+        return sorted(self._shards)
+
+    def shard_file(self, name) -> str:
+        root, ext = os.path.splitext(self.storage_file)
+        return f"{root}.{name}{ext}"
+
+    def shard_for(self, task_id) -> str:
+        return self._ring.node_for(task_id)
+
+    def _start_shard(self, name):
+        if name in self._shards:
+            raise ValueError(f"Shard already exists: {name}")
+        self._shards[name] = _Shard(name, self.shard_file(name), self._context, *self._options)
+        self._ring.add(name)
+
+    def _group(self, task_ids):
+        groups = defaultdict(list)
+        for task_id in dict.fromkeys(task_ids):
+            groups[self._ring.node_for(task_id)].append(task_id)
+        return groups
+
+    def _scatter(self, requests) -> Dict[str, object]:
+        # requests : {shard: (opération, args)}. Tout est envoyé avant de lire
+        # la première réponse ; les verrous sont pris dans l'ordre des noms
+        shards = [self._shards[name] for name in sorted(requests)]
+        for shard in shards:
+            shard.lock.acquire()
+        try:
+            for shard in shards:
+                shard.send(*requests[shard.name])
+            results = {}
+            error = None
+            for shard in shards:
+                # Toutes les réponses sont lues pour garder les canaux synchronisés
+                try:
+                    results[shard.name] = shard.receive()
+                except Exception as e:
+                    if error is None:
+                        error = e
+            if error is not None:
+                raise error
+            return results
+        finally:
+            for shard in shards:
+                shard.lock.release()
+
+    def _broadcast(self, operation, *args):
+        return self._scatter({name: (operation, args) for name in self._shards})
+
+    def _route_many(self, operation, task_ids, *args) -> int:
+        groups = self._group(task_ids)
+        results = self._scatter({name: (operation, (ids,) + args) for name, ids in groups.items()})
+        return sum(results.values())
+
+    def _distribute(self, tasks) -> int:
+        groups = defaultdict(list)
+        for task in tasks:
+            groups[self._ring.node_for(task.id)].append(task)
+        return sum(self._scatter({name: ("insert", (group,)) for name, group in groups.items()}).values())
+
+    def add_task(self, title, description="", priority=Priority.MEDIUM, due_at=None):
+        task = Task(title, description, priority, due_at)
+        self._shards[self._ring.node_for(task.id)].call("insert", [task])
+        return task.id
+
+    def add_tasks(self, specs) -> List[str]:
+        # Mêmes specs que TaskManager.add_tasks, validées ici avant tout envoi
+        tasks = Task.create_many(specs)
+        self._distribute(tasks)
+        return [task.id for task in tasks]
+
+    def get_task(self, task_id) -> Optional[Task]:
+        return self._shards[self._ring.node_for(task_id)].call("get_task", task_id)
+
+    def get_tasks(self, task_ids: Iterable[str]) -> List[Task]:
+        # Tâches trouvées, dans l'ordre des ids demandés
+        groups = self._group(task_ids)
+        found = {}
+        for tasks in self._scatter({name: ("get_many", (ids,)) for name, ids in groups.items()}).values():
+            found.update((task.id, task) for task in tasks)
+        return [found[task_id] for task_id in dict.fromkeys(task_ids) if task_id in found]
+
+    def delete_task(self, task_id) -> bool:
+        return self._shards[self._ring.node_for(task_id)].call("delete_task", task_id)
+
+    def delete_tasks(self, task_ids: Iterable[str]) -> int:
+        return self._route_many("delete_tasks", task_ids)
+
+    def complete_tasks(self, task_ids: Iterable[str]) -> int:
+        return self._route_many("complete_tasks", task_ids)
+
+    def update_priorities(self, task_ids: Iterable[str], priority: Priority) -> int:
+        return self._route_many("update_priorities", task_ids, priority)
+
+    def assign_to_project(self, task_ids: Iterable[str], project_id) -> int:
+        return self._route_many("assign_to_project", task_ids, project_id)
+
+    def _gather(self, operation, *args) -> List[Task]:
+        results = self._broadcast(operation, *args)
+        return [task for name in sorted(results) for task in results[name]]
+
+    @property
+    def tasks(self) -> List[Task]:
+        return self._gather("all")
+
+    def get_tasks_by_status(self, status: Status) -> List[Task]:
+        return self._gather("get_tasks_by_status", status)
+
+    def get_tasks_by_priority(self, priority: Priority) -> List[Task]:
+        return self._gather("get_tasks_by_priority", priority)
+
+    def get_tasks_by_project(self, project_id) -> List[Task]:
+        return self._gather("get_tasks_by_project", project_id)
+
+    def search(self, text, limit=20, prefix=True) -> List[Task]:
+        # Fusion des meilleurs résultats de chaque shard. Les scores BM25 sont
+        # calculés avec les statistiques de chaque shard : le classement est
+        # proche de celui d'un index unique, sans lui être identique
+        scored = [hit for hits in self._broadcast("search", text, limit, prefix).values() for hit in hits]
+        scored.sort(key=lambda hit: (-hit[0], hit[1].id))
+        return [task for _, task in scored[:limit]]
+
+    def get_statistics(self):
+        statistics = {
+            "total_tasks": 0,
+            "completed_tasks": 0,
+            "tasks_by_priority": {priority.value: 0 for priority in Priority},
+            "tasks_by_status": {status.value: 0 for status in Status}
+        }
+        for shard_statistics in self._broadcast("get_statistics").values():
+            statistics["total_tasks"] += shard_statistics["total_tasks"]
+            statistics["completed_tasks"] += shard_statistics["completed_tasks"]
+            for key in ("tasks_by_priority", "tasks_by_status"):
+                for value, count in shard_statistics[key].items():
+                    statistics[key][value] += count
+        return statistics
+
+    def save_to_file(self, streaming=False, format="json"):
+        self._broadcast("save_to_file", None, streaming, format)
+
+    def load_from_file(self, streaming=False, format="json"):
+        self._broadcast("load_from_file", None, streaming, format)
+
+    def add_shard(self, name=None) -> int:
+        # Démarre un shard et y déplace les tâches qu'il possède désormais ;
+        # renvoie le nombre de tâches déplacées
+        if name is None:
+            index = len(self._shards)
+            while f"shard-{index}" in self._shards:
+                index += 1
+            name = f"shard-{index}"
+        previous = list(self._shards)
+        self._start_shard(name)
+        moved = self._scatter({shard: ("extract", (self._ring, shard)) for shard in previous})
+        return self._distribute(task for tasks in moved.values() for task in tasks)
+
+    def remove_shard(self, name=None) -> int:
+        # Redistribue les tâches du shard (le dernier par défaut) puis l'arrête.
+        # Son fichier, s'il existe, est réécrit vide pour ne pas être rechargé plus tard
+        if name is None:
+            name = self.shard_names[-1]
+        if name not in self._shards:
+            raise ValueError(f"Unknown shard: {name}")
+        if len(self._shards) == 1:
+            raise ValueError("Cannot remove the last shard")
+        self._ring.remove(name)
+        shard = self._shards[name]
+        try:
+            tasks = shard.call("extract", self._ring, name)
+        except BaseException:
+            self._ring.add(name)
+            raise
+        moved = self._distribute(tasks)
+        if self._options[0] or os.path.exists(shard.storage_file):
+            shard.call("save_to_file")
+        shard.close()
+        del self._shards[name]
+        return moved
+
+    def rebalance(self) -> int:
+        # Replace les tâches mal rangées, par exemple après avoir rechargé des
+        # fichiers écrits avec d'autres shards
+        moved = self._scatter({name: ("extract", (self._ring, name)) for name in self._shards})
+        return self._distribute(task for tasks in moved.values() for task in tasks)
+
+    def close(self):
+        for shard in self._shards.values():
+            shard.close()
+        self._shards = {}
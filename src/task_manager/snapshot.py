@@ -0,0 +1,373 @@
+import bisect
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Iterator, List, Optional
+
+from .columnar import _PRIORITIES, _PRIORITY_CODES, _STATUSES, _STATUS_CODES, _from_micros, _to_micros
+from .store import TaskStore
+from .task import Task, Priority, Status
+
+# Format binaire :
+#   en-tête | hash des ids triés (u64) | lignes correspondantes (u32)
+#   | lignes (offset u64 + longueurs des chaînes) | priorités (u8) | statuts (u8)
+#   | created_at (i64) | completed_at (i64) | due_at (i64) | chaînes UTF-8
+# La version 1, sans colonne due_at, reste lisible.
+MAGIC = b"TASKSNAP"
+VERSION = 2
+_HEADER = struct.Struct("<8sHHI10Q")
+_HEADER_V1 = struct.Struct("<8sHHI9Q")
+_PREFIX = struct.Struct("<8sH")
+_ROW = struct.Struct("<QIIIi")
+_NO_PROJECT = -1
+
+
+def _id_hash(task_id):
+    return int.from_bytes(hashlib.blake2b(task_id.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def _aligned(offset):
+    return (offset + 7) & ~7
+
+
+def _little_endian(values):
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values.tobytes()
+
+
+def write_snapshot(filename, tasks):
+    tasks = list(tasks)
+    rows = bytearray()
+    strings = bytearray()
+    priorities = bytearray()
+    statuses = bytearray()
+    created_at = array("q")
+    completed_at = array("q")
+    due_at = array("q")
+    for task in tasks:
+        encoded = [task.id.encode("utf-8"), task.title.encode("utf-8"), task.description.encode("utf-8")]
+        # Projet stocké en texte, comme dans l'export CSV (assign_to_project(42))
+        project = str(task.project_id).encode("utf-8") if task.project_id is not None else b""
+        rows += _ROW.pack(len(strings), len(encoded[0]), len(encoded[1]), len(encoded[2]),
+                          len(project) if task.project_id is not None else _NO_PROJECT)
+        for value in encoded:
+            strings += value
+        strings += project
+        priorities.append(_PRIORITY_CODES[task.priority])
+        statuses.append(_STATUS_CODES[task.status])
+        created_at.append(_to_micros(task.created_at))
+        completed_at.append(_to_micros(task.completed_at))
+        due_at.append(_to_micros(task.due_at))
+
+    index = sorted((_id_hash(task.id), row) for row, task in enumerate(tasks))
+    hashes = array("Q", (h for h, _ in index))
+    index_rows = array("I", (row for _, row in index))
+
+    sections = [_little_endian(hashes), _little_endian(index_rows), bytes(rows), bytes(priorities),
+                bytes(statuses), _little_endian(created_at), _little_endian(completed_at), _little_endian(due_at), bytes(strings)]
+    offsets = []
+    offset = _HEADER.size
+    for section in sections:
+        offset = _aligned(offset)
+        offsets.append(offset)
+        offset += len(section)
+
+    tmp_file = filename + ".tmp"
+    with open(tmp_file, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, 0, 0, len(tasks), *offsets))
+        for offset, section in zip(offsets, sections):
+            f.write(bytes(offset - f.tell()))
+            f.write(section)
+    os.replace(tmp_file, filename)
+
+
+class BinarySnapshot:
+    """Lecture d'un snapshot binaire via mmap, sans désérialiser les tâches."""
+
+    def __init__(self, filename):
+        self._file = open(filename, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError("Empty snapshot file")
+        if len(self._mm) < _PREFIX.size:
+            self.close()
+            raise ValueError("Truncated snapshot header")
+        magic, version = _PREFIX.unpack_from(self._mm, 0)
+        if magic != MAGIC or version not in (1, VERSION):
+            self.close()
+            raise ValueError("Not a task snapshot file")
+        header = _HEADER if version == VERSION else _HEADER_V1
+        if len(self._mm) < header.size:
+            self.close()
+            raise ValueError("Truncated snapshot header")
+        _, _, _, _, count, *offsets = header.unpack_from(self._mm, 0)
+        if version == 1:
+            offsets.insert(7, None)
+        if sys.byteorder != "little":
+            self.close()
+            raise ValueError("Binary snapshots are only supported on little-endian hosts")
+        self.count = count
+        (self._hashes_offset, self._index_rows_offset, self._rows_offset, self._priorities_offset,
+         self._statuses_offset, self._created_offset, self._completed_offset, due_offset,
+         self._strings_offset) = offsets
+        view = memoryview(self._mm)
+        self._views = [view]
+        self._hashes = self._cast(view, self._hashes_offset, 8, "Q")
+        self._index_rows = self._cast(view, self._index_rows_offset, 4, "I")
+        self._created_at = self._cast(view, self._created_offset, 8, "q")
+        self._completed_at = self._cast(view, self._completed_offset, 8, "q")
+        self._due_at = None if due_offset is None else self._cast(view, due_offset, 8, "q")
+        self._status_counts = None
+        self._priority_counts = None
+
+    def _cast(self, view, offset, itemsize, fmt):
+        cast = view[offset:offset + self.count * itemsize].cast(fmt)
+        self._views.append(cast)
+        return cast
+
+    def find(self, task_id) -> int:
+        key = _id_hash(task_id)
+        i = bisect.bisect_left(self._hashes, key)
+        while i < self.count and self._hashes[i] == key:
+            row = self._index_rows[i]
+            if self._strings(row)[0] == task_id:
+                return row
+            i += 1
+        return -1
+
+    def _strings(self, row):
+        offset, id_len, title_len, description_len, project_len = _ROW.unpack_from(
+            self._mm, self._rows_offset + row * _ROW.size)
+        start = self._strings_offset + offset
+        values = []
+        for length in (id_len, title_len, description_len, max(project_len, 0)):
+            values.append(self._mm[start:start + length].decode("utf-8"))
+            start += length
+        if project_len == _NO_PROJECT:
+            values[3] = None
+        return values
+
+    def id_at(self, row):
+        offset, id_len = _ROW.unpack_from(self._mm, self._rows_offset + row * _ROW.size)[:2]
+        start = self._strings_offset + offset
+        return self._mm[start:start + id_len].decode("utf-8")
+
+    def status_code(self, row):
+        return self._mm[self._statuses_offset + row]
+
+    def priority_code(self, row):
+        return self._mm[self._priorities_offset + row]
+
+    def task_at(self, row) -> Task:
+        task_id, title, description, project_id = self._strings(row)
+        task = Task.__new__(Task)
+        task.id = task_id
+        task._title = title
+        task._description = description
+        task._priority = _PRIORITIES[self.priority_code(row)]
+        task._status = _STATUSES[self.status_code(row)]
+        task._created_at = _from_micros(self._created_at[row])
+        task._completed_at = _from_micros(self._completed_at[row])
+        task._project_id = project_id
+        task._due_at = None if self._due_at is None else _from_micros(self._due_at[row])
+        task._observers = ()
+        return task
+
+    def rows_with_status(self, status: Status) -> List[int]:
+        return self._rows_with(self._statuses_offset, _STATUS_CODES[status])
+
+    def rows_with_priority(self, priority: Priority) -> List[int]:
+        return self._rows_with(self._priorities_offset, _PRIORITY_CODES[priority])
+
+    def _rows_with(self, offset, code):
+        column = self._mm[offset:offset + self.count]
+        rows = []
+        row = column.find(code)
+        while row != -1:
+            rows.append(row)
+            row = column.find(code, row + 1)
+        return rows
+
+    def count_by_status(self, status: Status) -> int:
+        if self._status_counts is None:
+            self._status_counts = self._column_counts(self._statuses_offset, _STATUSES)
+        return self._status_counts[status]
+
+    def count_by_priority(self, priority: Priority) -> int:
+        if self._priority_counts is None:
+            self._priority_counts = self._column_counts(self._priorities_offset, _PRIORITIES)
+        return self._priority_counts[priority]
+
+    def _column_counts(self, offset, members):
+        column = self._mm[offset:offset + self.count]
+        return {member: column.count(code) for code, member in enumerate(members)}
+
+    def close(self):
+        for view in reversed(getattr(self, "_views", [])):
+            view.release()
+        self._views = []
+        if getattr(self, "_mm", None) is not None:
+            self._mm.close()
+            self._mm = None
+        self._file.close()
+
+
+class MappedTaskStore:
+    """Store paresseux adossé à un BinarySnapshot.
+
+    Les tâches restent dans le fichier mappé jusqu'à ce qu'on les demande ;
+    elles sont alors matérialisées dans un TaskStore (l'overlay), qui reçoit
+    aussi les ajouts. Les compteurs combinent les colonnes du snapshot, les
+    lignes déjà matérialisées et l'overlay.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self._snapshot = BinarySnapshot(filename)
+        self._overlay = TaskStore()
+        self._hydrated = bytearray(self._snapshot.count)
+        self._hydrated_count = 0
+        self._hydrated_by_status = {status: 0 for status in Status}
+        self._hydrated_by_priority = {priority: 0 for priority in Priority}
+        self._ordered = None
+
+    def add_listener(self, callback):
+        self._overlay.add_listener(callback)
+
+    def remove_listener(self, callback):
+        self._overlay.remove_listener(callback)
+
+    def _hydrate(self, row) -> Task:
+        task = self._snapshot.task_at(row)
+        self._shadow(row, task)
+        self._overlay.add(task)
+        self._ordered = None
+        return task
+
+    def _shadow(self, row, task):
+        self._hydrated[row] = 1
+        self._hydrated_count += 1
+        self._hydrated_by_status[task.status] += 1
+        self._hydrated_by_priority[task.priority] += 1
+
+    def _snapshot_row(self, task_id):
+        if self._snapshot is None:
+            return -1
+        row = self._snapshot.find(task_id)
+        return -1 if row == -1 or self._hydrated[row] else row
+
+    def _hydrate_rows(self, rows):
+        for row in rows:
+            if not self._hydrated[row]:
+                self._hydrate(row)
+
+    def _hydrate_all(self):
+        if self._snapshot is not None and self._hydrated_count < self._snapshot.count:
+            self._hydrate_rows(range(self._snapshot.count))
+
+    def add(self, task: Task):
+        row = self._snapshot_row(task.id)
+        if row != -1:
+            self._shadow(row, self._snapshot.task_at(row))
+        self._overlay.add(task)
+        self._ordered = None
+
+    def remove(self, task_id) -> Optional[Task]:
+        if self.get(task_id) is None:
+            return None
+        self._ordered = None
+        return self._overlay.remove(task_id)
+
+    def remove_many(self, task_ids) -> List[Task]:
+        present = [task_id for task_id in task_ids if self.get(task_id) is not None]
+        self._ordered = None
+        return self._overlay.remove_many(present)
+
+    def clear(self):
+        self.close()
+        self._overlay.clear()
+        self._ordered = None
+
+    def close(self):
+        if self._snapshot is not None:
+            self._snapshot.close()
+            self._snapshot = None
+            self._hydrated = bytearray()
+            self._hydrated_count = 0
+
+    def get(self, task_id) -> Optional[Task]:
+        task = self._overlay.get(task_id)
+        if task is None:
+            row = self._snapshot_row(task_id)
+            if row != -1:
+                task = self._hydrate(row)
+        return task
+
+    def by_status(self, status: Status) -> List[Task]:
+        if self._snapshot is not None:
+            self._hydrate_rows(self._snapshot.rows_with_status(status))
+        return self._overlay.by_status(status)
+
+    def by_priority(self, priority: Priority) -> List[Task]:
+        if self._snapshot is not None:
+            self._hydrate_rows(self._snapshot.rows_with_priority(priority))
+        return self._overlay.by_priority(priority)
+
+    def by_project(self, project_id) -> List[Task]:
+        self._hydrate_all()
+        return self._overlay.by_project(project_id)
+
+    def count_by_status(self, status: Status) -> int:
+        count = self._overlay.count_by_status(status)
+        if self._snapshot is not None:
+            count += self._snapshot.count_by_status(status) - self._hydrated_by_status[status]
+        return count
+
+    def count_by_priority(self, priority: Priority) -> int:
+        count = self._overlay.count_by_priority(priority)
+        if self._snapshot is not None:
+            count += self._snapshot.count_by_priority(priority) - self._hydrated_by_priority[priority]
+        return count
+
+    def count_by_project(self, project_id) -> int:
+        self._hydrate_all()
+        return self._overlay.count_by_project(project_id)
+
+    def __len__(self):
+        pending = self._snapshot.count - self._hydrated_count if self._snapshot is not None else 0
+        return len(self._overlay) + pending
+
+    def _ordered_tasks(self):
+        # Ordre du fichier d'abord, puis les tâches ajoutées depuis
+        if self._ordered is None:
+            self._hydrate_all()
+            if self._snapshot is None:
+                self._ordered = list(self._overlay)
+            else:
+                ordered = {}
+                for row in range(self._snapshot.count):
+                    task = self._overlay.get(self._snapshot.id_at(row))
+                    if task is not None:
+                        ordered[task.id] = task
+                for task in self._overlay:
+                    ordered.setdefault(task.id, task)
+                self._ordered = list(ordered.values())
+        return self._ordered
+
+    def __iter__(self) -> Iterator[Task]:
+        return iter(list(self._ordered_tasks()))
+
+    def __contains__(self, task_id):
+        return task_id in self._overlay or self._snapshot_row(task_id) != -1
+
+    def __getitem__(self, index):
+        return self._ordered_tasks()[index]
+
+    def __repr__(self):
+        return f"MappedTaskStore({len(self)} tasks)"
@@ -0,0 +1,444 @@
+import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import wraps
+from itertools import islice
+from datetime import datetime
+from typing import Iterable, Iterator, List, Optional
+
+from .streaming import iter_task_dicts
+from .task import Task, Priority, Status, _priority_from_value, _status_from_value
+
+_TABLE = """
+CREATE TABLE IF NOT EXISTS tasks (
+    seq INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL,
+    priority TEXT NOT NULL,
+    status TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    completed_at TEXT,
+    project_id TEXT,
+    due_at TEXT
+)
+"""
+_INDEXES = {
+    "tasks_status": "status",
+    "tasks_priority": "priority",
+    "tasks_project": "project_id",
+    "tasks_created": "created_at, id",
+}
+_COLUMNS = "id, title, description, priority, status, created_at, completed_at, project_id, due_at"
+_INSERT = f"INSERT INTO tasks ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+_SELECT = f"SELECT {_COLUMNS} FROM tasks"
+# Champs notifiés par Task -> colonnes mises à jour
+_UPDATES = {
+    "title": "UPDATE tasks SET title = ? WHERE id = ?",
+    "description": "UPDATE tasks SET description = ? WHERE id = ?",
+    "priority": "UPDATE tasks SET priority = ? WHERE id = ?",
+    "created_at": "UPDATE tasks SET created_at = ? WHERE id = ?",
+    "completed_at": "UPDATE tasks SET completed_at = ? WHERE id = ?",
+    "project_id": "UPDATE tasks SET project_id = ? WHERE id = ?",
+    "due_at": "UPDATE tasks SET due_at = ? WHERE id = ?",
+}
+
+
+def _iso(value):
+    # Dates naïves en ISO 8601 : l'ordre des chaînes suit celui des dates
+    return value.isoformat() if value is not None else None
+
+
+def _row(task):
+    return (task.id, task.title, task.description, task.priority.value, task.status.value,
+            task.created_at.isoformat(), _iso(task.completed_at), task.project_id, _iso(task.due_at))
+
+
+def _task(row) -> Task:
+    task = Task.__new__(Task)
+    task.id = row[0]
+    task._title = row[1]
+    task._description = row[2]
+    task._priority = _priority_from_value(row[3])
+    task._status = _status_from_value(row[4])
+    task._created_at = datetime.fromisoformat(row[5])
+    task._completed_at = datetime.fromisoformat(row[6]) if row[6] else None
+    task._project_id = row[7]
+    task._due_at = datetime.fromisoformat(row[8]) if row[8] else None
+    task._observers = ()
+    return task
+
+
+def _io_errors(method):
+    # Erreurs SQLite (base corrompue, disque plein...) levées en IOError,
+    # comme les autres stockages
+    @wraps(method)
+    def wrapper(*args, **kwargs):
+        try:
+            return method(*args, **kwargs)
+        except sqlite3.Error as e:
+            raise IOError(f"Failed to access task database: {e}")
+    return wrapper
+
+
+def _connect(filename):
+    connection = sqlite3.connect(filename, check_same_thread=False)
+    # WAL : les autres processus lisent pendant qu'on écrit
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.execute(_TABLE)
+    _create_indexes(connection)
+    return connection
+
+
+def _create_indexes(connection):
+    for name, columns in _INDEXES.items():
+        connection.execute(f"CREATE INDEX IF NOT EXISTS {name} ON tasks ({columns})")
+
+
+class SQLiteTaskStore:
+    """Store adossé à une base SQLite, même interface que TaskStore.
+
+    Les filtres et les compteurs sont des requêtes SQL sur les index
+    (statut, priorité, projet, created_at). Les tâches lues sont gardées
+    dans un cache LRU borné : un id déjà en cache renvoie toujours le même
+    objet. Chaque mutation d'une tâche lue est écrite dans la base et validée
+    aussitôt : une fois l'appel revenu, elle survit à un arrêt du processus et
+    les autres connexions la voient. Dans un bloc batch(), les écritures forment
+    une seule transaction, validée à la sortie du bloc. Les autres processus
+    peuvent lire la base, mais ce store doit en être le seul écrivain (cache et
+    compteurs sont tenus en mémoire).
+    """
+
+    def __init__(self, filename, cache_size=10000):
+        self.filename = filename
+        self.cache_size = cache_size
+        try:
+            self._connection = _connect(filename)
+        except sqlite3.Error as e:
+            raise IOError(f"Failed to open task database: {e}")
+        self._lock = threading.RLock()
+        self._cache = OrderedDict()
+        self._listeners = []
+        self._batch_depth = 0
+        self._length = None
+        # Compteurs par statut et priorité, lus une fois puis tenus à jour
+        self._status_counts = None
+        self._priority_counts = None
+
+    def add_listener(self, callback):
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        self._listeners.remove(callback)
+
+    @_io_errors
+    def _write(self, sql, params) -> int:
+        # Renvoie le nombre de lignes touchées
+        changed = self._connection.execute(sql, params).rowcount
+        self._written()
+        return changed
+
+    def _written(self):
+        # Hors batch(), chaque écriture est sa propre transaction
+        if not self._batch_depth:
+            self.flush()
+
+    @_io_errors
+    def flush(self):
+        with self._lock:
+            self._connection.commit()
+
+    @contextmanager
+    def batch(self):
+        # Une seule transaction pour tout le bloc, validée à la sortie
+        with self._lock:
+            self._batch_depth += 1
+            try:
+                yield self
+            finally:
+                self._batch_depth -= 1
+                if not self._batch_depth:
+                    self.flush()
+
+    @_io_errors
+    def close(self):
+        with self._lock:
+            if self._connection is None:
+                return
+            self.flush()
+            for task in self._cache.values():
+                task._remove_observer(self._on_task_changed)
+            self._cache.clear()
+            self._connection.close()
+            self._connection = None
+
+    def _remember(self, task):
+        cache = self._cache
+        cache[task.id] = task
+        cache.move_to_end(task.id)
+        if len(cache) > self.cache_size:
+            # La tâche évincée reste observée : si l'appelant la garde et la
+            # modifie, la base est quand même mise à jour
+            cache.popitem(last=False)
+
+    def _materialize(self, row) -> Task:
+        task = self._cache.get(row[0])
+        if task is not None:
+            self._cache.move_to_end(row[0])
+            return task
+        task = _task(row)
+        task._add_observer(self._on_task_changed)
+        self._remember(task)
+        return task
+
+    @_io_errors
+    def _select(self, where="", params=()) -> List[Task]:
+        with self._lock:
+            rows = self._connection.execute(f"{_SELECT} {where}", params).fetchall()
+            return [self._materialize(row) for row in rows]
+
+    @_io_errors
+    def add(self, task: Task):
+        with self._lock:
+            previous = self._cache.get(task.id)
+            if previous is not None and previous is not task:
+                previous._remove_observer(self._on_task_changed)
+            row = _row(task)
+            try:
+                self._connection.execute(_INSERT, row)
+            except sqlite3.IntegrityError:
+                # Id déjà présent : remplacé et placé en fin, comme TaskStore.add
+                old = self._connection.execute("SELECT status, priority FROM tasks WHERE id = ?",
+                                               (task.id,)).fetchone()
+                self._adjust_counts(old[0], old[1], -1)
+                self._connection.execute("DELETE FROM tasks WHERE id = ?", (task.id,))
+                self._write(_INSERT, row)
+            else:
+                self._written()
+                if self._length is not None:
+                    self._length += 1
+            self._adjust_counts(row[4], row[3], 1)
+            # Une tâche évincée du cache puis rajoutée est déjà observée
+            if self._on_task_changed not in task._observers:
+                task._add_observer(self._on_task_changed)
+            self._remember(task)
+
+    def _adjust_counts(self, status, priority, delta):
+        if self._status_counts is not None:
+            self._status_counts[status] = self._status_counts.get(status, 0) + delta
+            self._priority_counts[priority] = self._priority_counts.get(priority, 0) + delta
+
+    @_io_errors
+    def _counts(self):
+        # (par statut, par priorité), indexés par valeur comme en base
+        with self._lock:
+            if self._status_counts is None:
+                execute = self._connection.execute
+                self._status_counts = dict(execute("SELECT status, COUNT(*) FROM tasks GROUP BY status"))
+                self._priority_counts = dict(execute("SELECT priority, COUNT(*) FROM tasks GROUP BY priority"))
+            return self._status_counts, self._priority_counts
+
+    @_io_errors
+    def _exists(self, task_id):
+        return self._connection.execute("SELECT 1 FROM tasks WHERE id = ?", (task_id,)).fetchone() is not None
+
+    @_io_errors
+    def remove(self, task_id) -> Optional[Task]:
+        with self._lock:
+            task = self.get(task_id)
+            if task is None:
+                return None
+            self._write("DELETE FROM tasks WHERE id = ?", (task_id,))
+            self._cache.pop(task_id, None)
+            task._remove_observer(self._on_task_changed)
+            self._adjust_counts(task.status.value, task.priority.value, -1)
+            if self._length is not None:
+                self._length -= 1
+            return task
+
+    def remove_many(self, task_ids) -> List[Task]:
+        with self.batch():
+            return [task for task in map(self.remove, task_ids) if task is not None]
+
+    @_io_errors
+    def clear(self):
+        with self._lock:
+            for task in self._cache.values():
+                task._remove_observer(self._on_task_changed)
+            self._cache.clear()
+            self._write("DELETE FROM tasks", ())
+            self._length = 0
+            self._status_counts = self._priority_counts = None
+
+    @_io_errors
+    def get(self, task_id) -> Optional[Task]:
+        with self._lock:
+            task = self._cache.get(task_id)
+            if task is not None:
+                self._cache.move_to_end(task_id)
+                return task
+            row = self._connection.execute(f"{_SELECT} WHERE id = ?", (task_id,)).fetchone()
+            return self._materialize(row) if row is not None else None
+
+    def by_status(self, status: Status) -> List[Task]:
+        return self._select("WHERE status = ? ORDER BY seq", (status.value,))
+
+    def by_priority(self, priority: Priority) -> List[Task]:
+        return self._select("WHERE priority = ? ORDER BY seq", (priority.value,))
+
+    def by_project(self, project_id) -> List[Task]:
+        if project_id is None:
+            return self._select("WHERE project_id IS NULL ORDER BY seq")
+        return self._select("WHERE project_id = ? ORDER BY seq", (project_id,))
+
+    @_io_errors
+    def _count(self, where="", params=()) -> int:
+        with self._lock:
+            return self._connection.execute(f"SELECT COUNT(*) FROM tasks {where}", params).fetchone()[0]
+
+    def count_by_status(self, status: Status) -> int:
+        return self._counts()[0].get(status.value, 0)
+
+    def count_by_priority(self, priority: Priority) -> int:
+        return self._counts()[1].get(priority.value, 0)
+
+    def count_by_project(self, project_id) -> int:
+        if project_id is None:
+            return self._count("WHERE project_id IS NULL")
+        return self._count("WHERE project_id = ?", (project_id,))
+
+    def statistics(self) -> dict:
+        # Même résultat que TaskManager.get_statistics ; les compteurs viennent
+        # de deux GROUP BY à la première demande
+        by_status, by_priority = self._counts()
+        return {
+            "total_tasks": sum(by_status.values()),
+            "completed_tasks": by_status.get(Status.DONE.value, 0),
+            "tasks_by_priority": {priority.value: by_priority.get(priority.value, 0) for priority in Priority},
+            "tasks_by_status": {status.value: by_status.get(status.value, 0) for status in Status}
+        }
+
+    @staticmethod
+    def _created_where(start, end):
+        clauses = []
+        params = []
+        if start is not None:
+            clauses.append("created_at >= ?")
+            params.append(start.isoformat())
+        if end is not None:
+            clauses.append("created_at < ?")
+            params.append(end.isoformat())
+        return clauses, params
+
+    def count_created_range(self, start=None, end=None) -> int:
+        clauses, params = self._created_where(start, end)
+        return self._count("WHERE " + " AND ".join(clauses) if clauses else "", params)
+
+    def created_range(self, start=None, end=None, after=None, reverse=False) -> Iterator[Task]:
+        # Même contrat que TaskStore.created_range, via l'index (created_at, id)
+        clauses, params = self._created_where(start, end)
+        if after is not None:
+            clauses.append("(created_at, id) < (?, ?)" if reverse else "(created_at, id) > (?, ?)")
+            params.extend((after[0].isoformat(), after[1]))
+        where = "WHERE " + " AND ".join(clauses) if clauses else ""
+        order = "DESC" if reverse else "ASC"
+        return iter(self._select(f"{where} ORDER BY created_at {order}, id {order}", params))
+
+    @_io_errors
+    def _on_task_changed(self, task, field, old, new):
+        with self._lock:
+            if field == "status":
+                # mark_completed() fixe completed_at avant de notifier le statut
+                changed = self._write("UPDATE tasks SET status = ?, completed_at = ? WHERE id = ?",
+                                      (new.value, _iso(task.completed_at), task.id))
+                if changed and self._status_counts is not None:
+                    self._status_counts[old.value] -= 1
+                    self._status_counts[new.value] = self._status_counts.get(new.value, 0) + 1
+            elif field in _UPDATES:
+                value = new.value if field == "priority" else _iso(new) if field.endswith("_at") else new
+                changed = self._write(_UPDATES[field], (value, task.id))
+                if changed and field == "priority" and self._priority_counts is not None:
+                    self._priority_counts[old.value] -= 1
+                    self._priority_counts[new.value] = self._priority_counts.get(new.value, 0) + 1
+            else:
+                changed = 1
+        if not changed:
+            # Copie évincée du cache d'une tâche supprimée depuis
+            return
+        for callback in self._listeners:
+            callback(task, field, old, new)
+
+    def __len__(self):
+        if self._length is None:
+            self._length = self._count()
+        return self._length
+
+    def __iter__(self) -> Iterator[Task]:
+        return iter(self._select("ORDER BY seq"))
+
+    def __contains__(self, task_id):
+        with self._lock:
+            return task_id in self._cache or self._exists(task_id)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        if index < 0:
+            index += len(self)
+        tasks = self._select("ORDER BY seq LIMIT 1 OFFSET ?", (index,)) if index >= 0 else []
+        if not tasks:
+            raise IndexError("task index out of range")
+        return tasks[0]
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return f"SQLiteTaskStore({self.filename!r}, {len(self)} tasks)"
+
+
+def _dict_row(data):
+    # Dicts au format de Task.to_dict : les dates y sont déjà en ISO 8601
+    return (data["id"], data["title"], data["description"], data["priority"], data["status"],
+            data["created_at"], data.get("completed_at"), data.get("project_id"), data.get("due_at"))
+
+
+@_io_errors
+def _write_rows(filename, rows, chunk_size) -> int:
+    # Insertion sans index puis création des index : bien plus rapide qu'une
+    # mise à jour des index ligne par ligne
+    connection = _connect(filename)
+    count = 0
+    try:
+        with connection:
+            connection.execute("DELETE FROM tasks")
+            for name in _INDEXES:
+                connection.execute(f"DROP INDEX IF EXISTS {name}")
+            rows = iter(rows)
+            while True:
+                chunk = list(islice(rows, chunk_size))
+                if not chunk:
+                    break
+                connection.executemany(_INSERT, chunk)
+                count += len(chunk)
+            _create_indexes(connection)
+    finally:
+        connection.close()
+    return count
+
+
+def write_sqlite(filename, tasks: Iterable[Task], chunk_size=10000) -> int:
+    """Remplace le contenu d'une base SQLite par ``tasks`` ; renvoie leur nombre."""
+    return _write_rows(filename, map(_row, tasks), chunk_size)
+
+
+def migrate_from_json(json_file, sqlite_file, chunk_size=10000) -> int:
+    """Copie un fichier JSON de tâches dans une base SQLite ; renvoie leur nombre.
+
+    Le JSON est lu en flux et ses dicts sont insérés tels quels, sans
+    construire de Task : la migration tient en mémoire bornée.
+    """
+    with open(json_file, "r", encoding="utf-8") as f:
+        return _write_rows(sqlite_file, map(_dict_row, iter_task_dicts(f)), chunk_size)
@@ -0,0 +1,180 @@
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, Iterator, List, Optional
+from .task import Task, Priority, Status
+
+
+class TaskStore:
+    """Stockage indexé des tâches.
+
+    L'index principal est un dict id -> Task (lookup et suppression en O(1)).
+    Les index secondaires (statut, priorité, projet) sont des dicts id -> Task
+    utilisés comme ensembles ordonnés, mis à jour via les observateurs de Task.
+    L'index trié sur created_at n'est construit qu'à la première requête.
+    """
+
+    def __init__(self, tasks=()):
+        self._by_id: Dict[str, Task] = {}
+        self._by_status = {status: {} for status in Status}
+        self._by_priority = {priority: {} for priority in Priority}
+        self._by_project = {}
+        self._by_created = None
+        self._ordered = None
+        self._listeners = []
+        for task in tasks:
+            self.add(task)
+
+    # Les listeners reçoivent les mêmes notifications que les observateurs de Task,
+    # une fois les index mis à jour
+    def add_listener(self, callback):
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        self._listeners.remove(callback)
+
+    def add(self, task: Task):
+        if task.id in self._by_id:
+            self.remove(task.id)
+        self._by_id[task.id] = task
+        self._by_status[task.status][task.id] = task
+        self._by_priority[task.priority][task.id] = task
+        self._by_project.setdefault(task.project_id, {})[task.id] = task
+        if self._by_created is not None:
+            insort(self._by_created, (task.created_at, task.id))
+        task._add_observer(self._on_task_changed)
+        self._ordered = None
+
+    def remove(self, task_id) -> Optional[Task]:
+        task = self._by_id.pop(task_id, None)
+        if task is None:
+            return None
+        del self._by_status[task.status][task_id]
+        del self._by_priority[task.priority][task_id]
+        self._discard_from_project(task.project_id, task_id)
+        if self._by_created is not None:
+            self._discard_created(task.created_at, task_id)
+        task._remove_observer(self._on_task_changed)
+        self._ordered = None
+        return task
+
+    def remove_many(self, task_ids) -> List[Task]:
+        # L'index created_at est filtré une seule fois au lieu d'une
+        # suppression (avec décalage de la liste) par tâche
+        created = self._by_created
+        self._by_created = None
+        removed = [task for task in map(self.remove, task_ids) if task is not None]
+        if created is not None and removed:
+            gone = {task.id for task in removed}
+            created = [entry for entry in created if entry[1] not in gone]
+        self._by_created = created
+        return removed
+
+    def clear(self):
+        for task in self._by_id.values():
+            task._remove_observer(self._on_task_changed)
+        self._by_id.clear()
+        for bucket in self._by_status.values():
+            bucket.clear()
+        for bucket in self._by_priority.values():
+            bucket.clear()
+        self._by_project.clear()
+        self._by_created = None
+        self._ordered = None
+
+    def get(self, task_id) -> Optional[Task]:
+        return self._by_id.get(task_id)
+
+    def by_status(self, status: Status) -> List[Task]:
+        return list(self._by_status[status].values())
+
+    def by_priority(self, priority: Priority) -> List[Task]:
+        return list(self._by_priority[priority].values())
+
+    def by_project(self, project_id) -> List[Task]:
+        return list(self._by_project.get(project_id, {}).values())
+
+    # Les index sont tenus à jour à chaque mutation : leur taille sert de compteur
+    def count_by_status(self, status: Status) -> int:
+        return len(self._by_status[status])
+
+    def count_by_priority(self, priority: Priority) -> int:
+        return len(self._by_priority[priority])
+
+    def count_by_project(self, project_id) -> int:
+        return len(self._by_project.get(project_id, ()))
+
+    def count_created_range(self, start=None, end=None) -> int:
+        lo, hi = self._created_bounds(start, end)
+        return hi - lo
+
+    def created_range(self, start=None, end=None, after=None, reverse=False) -> Iterator[Task]:
+        # Tâches créées dans [start, end[ dans l'ordre de created_at (puis id).
+        # after : clé (created_at, id) de la dernière tâche d'une page précédente
+        index = self._created_index()
+        lo, hi = self._created_bounds(start, end)
+        if after is not None:
+            if reverse:
+                hi = min(hi, bisect_left(index, after))
+            else:
+                lo = max(lo, bisect_right(index, after))
+        positions = range(hi - 1, lo - 1, -1) if reverse else range(lo, hi)
+        by_id = self._by_id
+        for position in positions:
+            yield by_id[index[position][1]]
+
+    def _created_index(self):
+        if self._by_created is None:
+            self._by_created = sorted((task.created_at, task.id) for task in self._by_id.values())
+        return self._by_created
+
+    def _created_bounds(self, start, end):
+        index = self._created_index()
+        lo = 0 if start is None else bisect_left(index, (start,))
+        hi = len(index) if end is None else bisect_left(index, (end,))
+        return lo, max(lo, hi)
+
+    def _discard_created(self, created_at, task_id):
+        position = bisect_left(self._by_created, (created_at, task_id))
+        del self._by_created[position]
+
+    def _discard_from_project(self, project_id, task_id):
+        bucket = self._by_project[project_id]
+        del bucket[task_id]
+        if not bucket:
+            del self._by_project[project_id]
+
+    def _on_task_changed(self, task, field, old, new):
+        if field == "status":
+            del self._by_status[old][task.id]
+            self._by_status[new][task.id] = task
+        elif field == "priority":
+            del self._by_priority[old][task.id]
+            self._by_priority[new][task.id] = task
+        elif field == "project_id":
+            self._discard_from_project(old, task.id)
+            self._by_project.setdefault(new, {})[task.id] = task
+        elif field == "created_at" and self._by_created is not None:
+            self._discard_created(old, task.id)
+            insort(self._by_created, (new, task.id))
+        for callback in self._listeners:
+            callback(task, field, old, new)
+
+    def __len__(self):
+        return len(self._by_id)
+
+    def __iter__(self) -> Iterator[Task]:
+        return iter(list(self._by_id.values()))
+
+    def __contains__(self, task_id):
+        return task_id in self._by_id
+
+    def __getitem__(self, index):
+        # Accès positionnel conservé pour la compatibilité avec l'ancienne liste
+        if self._ordered is None:
+            self._ordered = list(self._by_id.values())
+        return self._ordered[index]
+
+    def __eq__(self, other):
+        return list(self._by_id.values()) == list(other)
+
+    def __repr__(self):
+        return f"TaskStore({len(self._by_id)} tasks)"
@@ -0,0 +1,76 @@
+import json
+from typing import Iterable, Iterator
+
+from .task import Task
+
+_WHITESPACE = " \t\n\r"
+
+
+def iter_task_dicts(f, chunk_size=1 << 16) -> Iterator[dict]:
+    # Parse un tableau JSON élément par élément sans charger tout le document
+    decoder = json.JSONDecoder()
+    buf = ""
+    pos = 0
+    eof = False
+
+    def fill():
+        nonlocal buf, pos, eof
+        chunk = f.read(chunk_size)
+        if not chunk:
+            eof = True
+        buf = buf[pos:] + chunk
+        pos = 0
+
+    def next_char():
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            if pos < len(buf):
+                return buf[pos]
+            if eof:
+                return ""
+            fill()
+
+    def expect(chars):
+        char = next_char()
+        if not char or char not in chars:
+            raise json.JSONDecodeError(f"Expected one of {chars!r}", buf, pos)
+        return char
+
+    expect("[")
+    pos += 1
+    if next_char() == "]":
+        return
+    while True:
+        next_char()
+        while True:
+            try:
+                obj, end = decoder.raw_decode(buf, pos)
+                break
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                fill()
+        pos = end
+        yield obj
+        separator = expect(",]")
+        pos += 1
+        if separator == "]":
+            return
+
+
+def iter_tasks_from_file(filename, chunk_size=1 << 16) -> Iterator[Task]:
+    with open(filename, "r", encoding="utf-8") as f:
+        for task_data in iter_task_dicts(f, chunk_size):
+            yield Task.from_trusted_dict(task_data)
+
+
+def write_tasks(f, tasks: Iterable[Task]):
+    # Même rendu octet par octet que json.dump([...], f, indent=2)
+    first = True
+    for task in tasks:
+        body = json.dumps(task.to_dict(), indent=2).replace("\n", "\n  ")
+        f.write("[\n  " + body if first else ",\n  " + body)
+        first = False
+    f.write("[]" if first else "\n]")
@@ -1,5 +1,6 @@
 from datetime import datetime
 from enum import Enum
+import os
 import time
 import uuid
 
@@ -9,14 +10,51 @@ class Priority(Enum):
     HIGH = "high"
     URGENT = "urgent"
 
+    # Les membres sont des singletons comparés par identité : le hash natif
+    # évite Enum.__hash__ (en Python) à chaque accès aux index
+    __hash__ = object.__hash__
+
 class Status(Enum):
     TODO = "todo"
     IN_PROGRESS = "in_progress"
     DONE = "done"
     CANCELLED = "cancelled"
 
+    __hash__ = object.__hash__
+
+# Cache des enums par valeur : évite Priority(value)/Status(value) au chargement
+_PRIORITIES = {priority.value: priority for priority in Priority}
+_STATUSES = {status.value: status for status in Status}
+
+def _priority_from_value(value):
+    try:
+        return _PRIORITIES[value]
+    except KeyError:
+        return Priority(value)
+
+def _status_from_value(value):
+    try:
+        return _STATUSES[value]
+    except KeyError:
+        return Status(value)
+
+def _new_ids(count):
+    # UUID4 par lots : un seul appel à os.urandom, sans objet uuid.UUID par id
+    random = bytearray(os.urandom(16 * count))
+    ids = []
+    for offset in range(0, 16 * count, 16):
+        random[offset + 6] = (random[offset + 6] & 0x0F) | 0x40
+        random[offset + 8] = (random[offset + 8] & 0x3F) | 0x80
+        h = random[offset:offset + 16].hex()
+        ids.append(f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}")
+    return ids
+
 class Task:
-    def __init__(self, title, description="", priority=Priority.MEDIUM):
+    # __slots__ : pas de __dict__ par instance
+    __slots__ = ("id", "_title", "_description", "_priority", "_status",
+                 "_created_at", "_completed_at", "_project_id", "_due_at", "_observers", "__weakref__")
+
+    def __init__(self, title, description="", priority=Priority.MEDIUM, due_at=None):
         if not title or title.strip() == "":
             raise ValueError("Title cannot be empty")
         
@@ -24,17 +62,126 @@ class Task:
             raise TypeError("Priority must be a Priority enum")
         
         self.id = str(uuid.uuid4())
-        self.title = title
-        self.description = description
-        self.priority = priority
-        self.status = Status.TODO
-        self.created_at = datetime.now()
-        self.completed_at = None
-        self.project_id = None
+        self._title = title
+        self._description = description
+        self._priority = priority
+        self._status = Status.TODO
+        self._created_at = datetime.now()
+        self._completed_at = None
+        self._project_id = None
+        self._due_at = due_at
+        self._observers = ()
+
+    # Les champs indexés passent par des propriétés pour prévenir les observateurs
+    @property
+    def title(self):
+        return self._title
+
+    @title.setter
+    def title(self, value):
+        old = self._title
+        self._title = value
+        if self._observers and old != value:
+            self._notify("title", old, value)
+
+    @property
+    def description(self):
+        return self._description
+
+    @description.setter
+    def description(self, value):
+        old = self._description
+        self._description = value
+        if self._observers and old != value:
+            self._notify("description", old, value)
+
+    @property
+    def status(self):
+        return self._status
+
+    @status.setter
+    def status(self, value):
+        old = self._status
+        self._status = value
+        if self._observers and old is not value:
+            self._notify("status", old, value)
+
+    @property
+    def priority(self):
+        return self._priority
+
+    @priority.setter
+    def priority(self, value):
+        old = self._priority
+        self._priority = value
+        if self._observers and old is not value:
+            self._notify("priority", old, value)
+
+    @property
+    def created_at(self):
+        return self._created_at
+
+    @created_at.setter
+    def created_at(self, value):
+        old = self._created_at
+        self._created_at = value
+        if self._observers and old != value:
+            self._notify("created_at", old, value)
+
+    @property
+    def completed_at(self):
+        return self._completed_at
+
+    @completed_at.setter
+    def completed_at(self, value):
+        old = self._completed_at
+        self._completed_at = value
+        if self._observers and old != value:
+            self._notify("completed_at", old, value)
+
+    @property
+    def project_id(self):
+        return self._project_id
+
+    @project_id.setter
+    def project_id(self, value):
+        old = self._project_id
+        self._project_id = value
+        if self._observers and old != value:
+            self._notify("project_id", old, value)
+
+    @property
+    def due_at(self):
+        return self._due_at
+
+    @due_at.setter
+    def due_at(self, value):
+        old = self._due_at
+        self._due_at = value
+        if self._observers and old != value:
+            self._notify("due_at", old, value)
+
+    def _add_observer(self, callback):
+        self._observers = self._observers + (callback,)
+
+    def _remove_observer(self, callback):
+        self._observers = tuple(cb for cb in self._observers if cb != callback)
+
+    def _notify(self, field, old, new):
+        for callback in self._observers:
+            callback(self, field, old, new)
 
     def mark_completed(self):
-        self.status = Status.DONE
-        self.completed_at = datetime.now()
+        self._complete(datetime.now())
+
+    def _complete(self, moment):
+        # À la première fin, completed_at est fixé sans notification : les
+        # observateurs le lisent avec le changement de statut
+        if self._status is Status.DONE:
+            self.completed_at = moment
+        else:
+            self._completed_at = moment
+            self.status = Status.DONE
 
     def update_priority(self, new_priority):
         if not isinstance(new_priority, Priority):
@@ -44,6 +191,10 @@ class Task:
     def assign_to_project(self, project_id):
         self.project_id = project_id
 
+    def __reduce__(self):
+        # Copie détachée (sans observateurs) pour passer d'un processus à l'autre
+        return (Task.from_trusted_dict, (self.to_dict(),))
+
     def to_dict(self):
         return {
             "id": self.id,
@@ -53,20 +204,76 @@ class Task:
             "status": self.status.value,
             "created_at": self.created_at.isoformat(),
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
-            "project_id": self.project_id
+            "project_id": self.project_id,
+            "due_at": self.due_at.isoformat() if self.due_at else None
         }
 
+    @classmethod
+    def create_many(cls, specs):
+        # specs : titres, ou dicts des arguments du constructeur (plus project_id).
+        # Même validation que __init__, mais un seul datetime.now() et un seul
+        # tirage aléatoire pour tout le lot
+        specs = [{"title": spec} if isinstance(spec, str) else spec for spec in specs]
+        now = datetime.now()
+        tasks = []
+        for task_id, spec in zip(_new_ids(len(specs)), specs):
+            title = spec["title"]
+            if not title or title.strip() == "":
+                raise ValueError("Title cannot be empty")
+            priority = spec.get("priority", Priority.MEDIUM)
+            if not isinstance(priority, Priority):
+                raise TypeError("Priority must be a Priority enum")
+            task = cls.__new__(cls)
+            task.id = task_id
+            task._title = title
+            task._description = spec.get("description", "")
+            task._priority = priority
+            task._status = Status.TODO
+            task._created_at = now
+            task._completed_at = None
+            task._project_id = spec.get("project_id")
+            task._due_at = spec.get("due_at")
+            task._observers = ()
+            tasks.append(task)
+        return tasks
+
     @classmethod
     def from_dict(cls, data):
-        task = cls(
-            title=data["title"],
-            description=data.get("description", ""),
-            priority=Priority(data["priority"])
-        )
+        title = data["title"]
+        if not title or title.strip() == "":
+            raise ValueError("Title cannot be empty")
+        return cls.from_trusted_dict(data)
+
+    @classmethod
+    def from_trusted_dict(cls, data):
+        # Chemin rapide pour nos propres fichiers : pas de validation du titre,
+        # ni uuid4() ni datetime.now() aussitôt écrasés
+        task = cls.__new__(cls)
         task.id = data["id"]
-        task.status = Status(data["status"])
-        task.created_at = datetime.fromisoformat(data["created_at"])
-        if data.get("completed_at"):
-            task.completed_at = datetime.fromisoformat(data["completed_at"])
-        task.project_id = data.get("project_id")
-        return task
\ No newline at end of file
+        task._title = data["title"]
+        task._description = data.get("description", "")
+        task._priority = _priority_from_value(data["priority"])
+        task._status = _status_from_value(data["status"])
+        task._created_at = datetime.fromisoformat(data["created_at"])
+        completed_at = data.get("completed_at")
+        task._completed_at = datetime.fromisoformat(completed_at) if completed_at else None
+        task._project_id = data.get("project_id")
+        due_at = data.get("due_at")
+        task._due_at = datetime.fromisoformat(due_at) if due_at else None
+        task._observers = ()
+        return task
+
+    def _detached_copy(self):
+        # Copie sans observateurs, champ par champ (les valeurs sont immuables)
+        task = Task.__new__(Task)
+        task.id = self.id
+        task._title = self._title
+        task._description = self._description
+        task._priority = self._priority
+        task._status = self._status
+        task._created_at = self._created_at
+        task._completed_at = self._completed_at
+        task._project_id = self._project_id
+        task._due_at = self._due_at
+        task._observers = ()
+        return task
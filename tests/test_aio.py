@@ -0,0 +1,123 @@
+import asyncio
+import json
+import time
+import pytest
+from unittest.mock import patch
+from datetime import datetime
+from src.task_manager.aio import AsyncTaskManager, AsyncReportService, AsyncEmailService
+from src.task_manager.manager import TaskManager
+from src.task_manager.task import Priority, Status
+
+class TestAsyncTaskManager:
+    def test_save_and_load(self, tmp_path):
+        storage = str(tmp_path / "tasks.json")
+
+        async def scenario():
+            manager = AsyncTaskManager(TaskManager(storage))
+            task_id = manager.add_task("Task 1", priority=Priority.HIGH)
+            manager.get_task(task_id).mark_completed()
+            await manager.save()
+
+            reloaded = AsyncTaskManager(TaskManager(storage))
+            await reloaded.load()
+            return manager, reloaded
+
+        manager, reloaded = asyncio.run(scenario())
+        assert reloaded.get_statistics() == manager.get_statistics()
+        with open(storage) as f:
+            assert f.read() == json.dumps([t.to_dict() for t in manager.tasks], indent=2)
+
+    def test_load_nonexistent_file(self, tmp_path):
+        manager = AsyncTaskManager(TaskManager(str(tmp_path / "missing.json")))
+        asyncio.run(manager.load())
+        assert len(manager.tasks) == 0
+
+    def test_load_invalid_file_raises_ioerror(self, tmp_path):
+        storage = tmp_path / "tasks.json"
+        storage.write_text("{")
+        manager = AsyncTaskManager(TaskManager(str(storage)))
+        with pytest.raises(IOError):
+            asyncio.run(manager.load())
+
+    def test_rapid_saves_are_coalesced(self, tmp_path):
+        storage = str(tmp_path / "tasks.json")
+        writes = []
+
+        def counting_write(filename, tasks):
+            writes.append(len(tasks))
+
+        async def scenario():
+            manager = AsyncTaskManager(TaskManager(storage))
+            futures = []
+            for i in range(10):
+                manager.add_task(f"Task {i}")
+                futures.append(manager.save())
+            await asyncio.gather(*futures)
+            manager.add_task("Task 10")
+            await manager.save()
+
+        with patch("src.task_manager.aio._write_json", side_effect=counting_write):
+            asyncio.run(scenario())
+        # Les dix demandes faites avant que l'écriture démarre n'en font qu'une
+        assert writes == [10, 11]
+
+    def test_save_serializes_copies_taken_on_the_loop(self, tmp_path):
+        written = []
+
+        def slow_write(filename, tasks):
+            time.sleep(0.05)
+            written.extend((task.status, task.completed_at) for task in tasks)
+
+        async def scenario():
+            manager = AsyncTaskManager(TaskManager(str(tmp_path / "tasks.json")))
+            task_id = manager.add_task("Task 1")
+            save = manager.save()
+            await asyncio.sleep(0.01)
+            # Modifiée pendant l'écriture : le fichier garde l'état de l'appel
+            manager.get_task(task_id).mark_completed()
+            await save
+
+        with patch("src.task_manager.aio._write_json", side_effect=slow_write):
+            asyncio.run(scenario())
+        assert written == [(Status.TODO, None)]
+
+    def test_save_error_is_reported(self, tmp_path):
+        async def scenario():
+            manager = AsyncTaskManager(TaskManager(str(tmp_path / "missing" / "tasks.json")))
+            manager.add_task("Task 1")
+            await manager.save()
+
+        with pytest.raises(IOError):
+            asyncio.run(scenario())
+
+    def test_binary_save_and_journal_mode(self, tmp_path):
+        async def scenario():
+            journaled = AsyncTaskManager(TaskManager(str(tmp_path / "tasks.json"), journal=True))
+            task_id = journaled.add_task("Task 1")
+            await journaled.save()
+            await journaled.save(str(tmp_path / "tasks.bin"), format="binary")
+            journaled.close()
+
+            reloaded = AsyncTaskManager(TaskManager(str(tmp_path / "tasks.json"), journal=True))
+            await reloaded.load()
+            reloaded.close()
+            return task_id, reloaded
+
+        task_id, reloaded = asyncio.run(scenario())
+        assert reloaded.get_task(task_id).status == Status.TODO
+        assert (tmp_path / "tasks.bin").exists()
+
+class TestAsyncServices:
+    def test_export_csv(self, tmp_path):
+        manager = TaskManager("test_tasks.json")
+        manager.add_task("Réunion équipe")
+        path = str(tmp_path / "tasks.csv")
+        asyncio.run(AsyncReportService().export_tasks_csv(manager.tasks, path))
+        with open(path) as f:
+            assert "Réunion équipe" in f.read()
+
+    def test_email(self):
+        service = AsyncEmailService()
+        assert asyncio.run(service.send_task_reminder("user@example.com", "Task", datetime.now())) is True
+        with pytest.raises(ValueError):
+            asyncio.run(service.send_completion_notification("invalid-email", "Task"))
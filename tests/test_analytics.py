@@ -0,0 +1,107 @@
+import random
+from datetime import datetime, timedelta
+
+from src.task_manager.analytics import ReportAggregator
+from src.task_manager.manager import TaskManager
+from src.task_manager.services import ReportService
+from src.task_manager.task import Task, Priority, Status
+
+
+def make_tasks(count=300, seed=7):
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1)
+    tasks = []
+    for i in range(count):
+        task = Task(f"Task {i}", priority=rng.choice(list(Priority)))
+        task.created_at = start + timedelta(minutes=rng.randrange(30 * 24 * 60))
+        task.assign_to_project(rng.choice([None, "alpha", "beta"]))
+        if rng.random() < 0.5:
+            task.mark_completed()
+            task.completed_at = task.created_at + timedelta(hours=rng.randrange(1, 72))
+        tasks.append(task)
+    return tasks
+
+
+class TestReportAggregator:
+    def setup_method(self):
+        self.tasks = make_tasks()
+        self.aggregator = ReportAggregator(self.tasks)
+
+    def test_daily_report_matches_report_service(self):
+        service = ReportService()
+        for offset in range(-1, 32):
+            date = datetime(2024, 1, 1, 12) + timedelta(days=offset)
+            assert self.aggregator.daily_report(date) == service.generate_daily_report(self.tasks, date)
+
+    def test_range_and_weekly_reports(self):
+        report = self.aggregator.range_report(datetime(2024, 1, 1), datetime(2024, 1, 31))
+        assert report["total_tasks_created"] == len(self.tasks)
+        assert report["tasks_completed"] == sum(1 for task in self.tasks if task.status is Status.DONE)
+        assert len(report["days"]) == 31
+
+        weekly = self.aggregator.weekly_report(datetime(2024, 1, 10))
+        assert weekly["start"] == "2024-01-08"
+        assert weekly["end"] == "2024-01-14"
+
+    def test_throughput_counts_by_completion_day(self):
+        task = Task("Late")
+        task.created_at = datetime(2023, 12, 1)
+        task.mark_completed()
+        task.completed_at = datetime(2024, 2, 3, 10)
+        aggregator = ReportAggregator([task])
+        throughput = aggregator.throughput(datetime(2024, 2, 1), datetime(2024, 2, 4))
+        assert throughput["completed"] == 1
+        assert throughput["per_day"]["2024-02-03"] == 1
+        assert throughput["average_per_day"] == 0.25
+
+    def test_project_report(self):
+        alpha = [task for task in self.tasks if task.project_id == "alpha"]
+        report = self.aggregator.project_report("alpha")
+        assert report["total_tasks"] == len(alpha)
+        assert report["completed_tasks"] == sum(1 for task in alpha if task.status is Status.DONE)
+        assert {entry["project_id"] for entry in self.aggregator.projects_report()} == {None, "alpha", "beta"}
+
+    def test_completion_time_percentiles(self):
+        tasks = []
+        for hours in range(1, 101):
+            task = Task(f"Task {hours}")
+            task.created_at = datetime(2024, 1, 1)
+            task.mark_completed()
+            task.completed_at = task.created_at + timedelta(hours=hours)
+            tasks.append(task)
+        percentiles = ReportAggregator(tasks).completion_time_percentiles((50, 90, 100))
+        assert percentiles == {50: timedelta(hours=50), 90: timedelta(hours=90), 100: timedelta(hours=100)}
+        assert ReportAggregator().completion_time_percentiles() == {}
+
+
+class TestManagerReports:
+    def test_reports_follow_mutations(self):
+        manager = TaskManager()
+        first = manager.add_task("First")
+        manager.add_task("Second")
+        reports = manager.reports()
+        today = datetime.now()
+        assert reports.daily_report(today)["total_tasks_created"] == 2
+
+        manager.get_task(first).mark_completed()
+        assert reports.daily_report(today)["tasks_completed"] == 1
+        assert 50 in reports.completion_time_percentiles()
+        manager.get_task(first).assign_to_project("alpha")
+        assert reports.project_report("alpha")["completed_tasks"] == 1
+
+        manager.add_task("Third")
+        manager.delete_task(first)
+        assert reports.daily_report(today) == ReportService().generate_daily_report(manager.tasks, today)
+        assert reports.project_report("alpha")["total_tasks"] == 0
+        assert reports.completion_time_percentiles() == {}
+
+    def test_reports_are_rebuilt_on_load(self, tmp_path):
+        path = str(tmp_path / "tasks.json")
+        manager = TaskManager(path)
+        manager.tasks = make_tasks(50)
+        manager.save_to_file()
+
+        reports = manager.reports()
+        manager.add_task("Extra")
+        manager.load_from_file()
+        assert len(reports) == 50
@@ -0,0 +1,140 @@
+import gzip
+import os
+from datetime import date, datetime
+
+import pytest
+
+from src.task_manager.archive import TaskArchive, archived_at
+from src.task_manager.concurrency import ConcurrentTaskManager
+from src.task_manager.manager import TaskManager
+from src.task_manager.services import ReportService
+from src.task_manager.task import Task, Priority, Status
+
+
+def make_task(title, created, completed=None, status=None):
+    task = Task(title)
+    task.created_at = created
+    if completed is not None:
+        task.completed_at = completed
+        task.status = Status.DONE
+    if status is not None:
+        task.status = status
+    return task
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = TaskManager(str(tmp_path / "tasks.json"))
+    manager.tasks = [
+        make_task("Old done", datetime(2024, 1, 3), datetime(2024, 1, 10)),
+        make_task("Old cancelled", datetime(2024, 2, 5), status=Status.CANCELLED),
+        make_task("Recent done", datetime(2024, 3, 1), datetime(2024, 3, 20)),
+        make_task("Old todo", datetime(2024, 1, 1)),
+        make_task("February done", datetime(2024, 1, 30), datetime(2024, 2, 2, 12)),
+    ]
+    return manager
+
+
+class TestTaskArchive:
+    def test_archive_completed_moves_old_tasks(self, manager, tmp_path):
+        archive = TaskArchive(str(tmp_path / "archive"))
+        assert manager.archive_completed(archive, date(2024, 3, 1)) == 3
+        assert sorted(task.title for task in manager.tasks) == ["Old todo", "Recent done"]
+        assert archive.partitions() == ["2024-01", "2024-02"]
+        assert sorted(task.title for task in archive) == ["February done", "Old cancelled", "Old done"]
+        assert manager.archive_completed(archive, date(2024, 3, 1)) == 0
+
+    def test_partitions_are_gzip_json_lines(self, manager, tmp_path):
+        archive = TaskArchive(str(tmp_path / "archive"))
+        manager.archive_completed(archive, date(2024, 3, 1))
+        with gzip.open(os.path.join(archive.directory, "tasks-2024-02.jsonl.gz"), "rt") as f:
+            lines = f.read().splitlines()
+        assert len(lines) == 2
+
+    def test_range_query_reads_matching_months(self, manager, tmp_path):
+        archive = TaskArchive(str(tmp_path / "archive"))
+        manager.archive_completed(archive, datetime(2024, 12, 31))
+        os.remove(os.path.join(archive.directory, "tasks-2024-01.jsonl.gz"))
+        # Janvier n'est plus lisible : une requête sur mars ne l'ouvre pas
+        assert [task.title for task in archive.iter_tasks(date(2024, 3, 1), date(2024, 4, 1))] == ["Recent done"]
+        assert archive.count(datetime(2024, 2, 2), datetime(2024, 2, 2, 12)) == 0
+        assert archive.count(datetime(2024, 2, 2), datetime(2024, 2, 3)) == 1
+        assert archive.count(start=date(2024, 2, 1)) == 3
+
+    def test_appends_and_deduplicates(self, tmp_path):
+        archive = TaskArchive(str(tmp_path / "archive"), fsync=False)
+        task = make_task("Done", datetime(2024, 5, 1), datetime(2024, 5, 2))
+        archive.add([task])
+        archive.add([task, make_task("Other", datetime(2024, 5, 1), datetime(2024, 5, 3))])
+        assert [t.title for t in archive] == ["Done", "Other"]
+        restored = next(iter(archive))
+        assert restored.id == task.id
+        assert restored.completed_at == datetime(2024, 5, 2)
+        assert restored.status is Status.DONE
+
+    def test_empty_and_corrupt_archive(self, tmp_path):
+        archive = TaskArchive(str(tmp_path / "missing"))
+        assert archive.partitions() == []
+        assert list(archive) == []
+        os.makedirs(archive.directory)
+        with open(os.path.join(archive.directory, "tasks-2024-01.jsonl.gz"), "wb") as f:
+            f.write(b"not gzip")
+        with pytest.raises(IOError):
+            list(archive)
+
+    def test_archived_at_falls_back_to_creation(self):
+        task = make_task("Cancelled", datetime(2024, 1, 1), status=Status.CANCELLED)
+        assert archived_at(task) == datetime(2024, 1, 1)
+
+    def test_journal_records_archived_deletions(self, tmp_path):
+        path = str(tmp_path / "tasks.json")
+        manager = TaskManager(path, journal=True)
+        task_id = manager.add_task("Done", priority=Priority.HIGH)
+        manager.get_task(task_id).mark_completed()
+        manager.archive_completed(TaskArchive(str(tmp_path / "archive")), datetime.now())
+        manager.close()
+        reloaded = TaskManager(path, journal=True)
+        reloaded.load_from_file()
+        assert len(reloaded.tasks) == 0
+        reloaded.close()
+
+    def test_concurrent_manager(self, tmp_path):
+        manager = ConcurrentTaskManager()
+        task_id = manager.add_task("Done")
+        manager.get_task(task_id).mark_completed()
+        assert manager.archive_completed(TaskArchive(str(tmp_path / "archive")), datetime.now()) == 1
+
+
+class TestHistoryReports:
+    def test_range_report_includes_archive(self, manager, tmp_path):
+        service = ReportService()
+        expected = service.generate_range_report(list(manager.tasks), date(2024, 1, 1), date(2024, 3, 31))
+        archive = TaskArchive(str(tmp_path / "archive"))
+        manager.archive_completed(archive, date(2024, 3, 1))
+        assert service.generate_range_report(manager.tasks, date(2024, 1, 1), date(2024, 3, 31)) != expected
+        report = service.generate_range_report(manager.tasks, date(2024, 1, 1), date(2024, 3, 31), archive=archive)
+        assert report == expected
+
+    def test_range_report_with_time_of_day_includes_whole_first_day(self, manager, tmp_path):
+        service = ReportService()
+        start, end = datetime(2024, 1, 10, 18), datetime(2024, 3, 31)
+        manager.tasks = list(manager.tasks) + [make_task("Morning", datetime(2024, 1, 10, 9), datetime(2024, 1, 10, 12))]
+        expected = service.generate_range_report(list(manager.tasks), start, end)
+        archive = TaskArchive(str(tmp_path / "archive"))
+        manager.archive_completed(archive, date(2024, 3, 1))
+        assert service.generate_range_report(manager.tasks, start, end, archive=archive) == expected
+
+    def test_daily_and_weekly_reports_include_archive(self, manager, tmp_path):
+        service = ReportService()
+        day = datetime(2024, 1, 3)
+        daily = service.generate_daily_report(list(manager.tasks), day)
+        weekly = service.generate_weekly_report(list(manager.tasks), day)
+        archive = TaskArchive(str(tmp_path / "archive"))
+        manager.archive_completed(archive, date(2024, 3, 1))
+        assert service.generate_daily_report(manager.tasks, day, archive=archive) == daily
+        assert service.generate_weekly_report(manager.tasks, day, archive=archive) == weekly
+
+    def test_aggregator_with_archive_is_rejected(self, manager, tmp_path):
+        with pytest.raises(TypeError):
+            ReportService().generate_range_report(manager.reports(), date(2024, 1, 1), date(2024, 1, 31),
+                                                  archive=TaskArchive(str(tmp_path / "archive")))
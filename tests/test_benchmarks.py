@@ -0,0 +1,53 @@
+from benchmarks.dataset import format_size, generate_tasks, iter_task_dicts, parse_size, write_dataset
+from benchmarks.suite import compare, host_mismatch, run_suite
+from src.task_manager.manager import TaskManager
+from src.task_manager.task import Priority, Status
+
+
+class TestDataset:
+    def test_generation_is_deterministic(self):
+        assert list(iter_task_dicts(50, seed=3)) == list(iter_task_dicts(50, seed=3))
+        assert list(iter_task_dicts(50, seed=3)) != list(iter_task_dicts(50, seed=4))
+
+    def test_distributions_and_text_lengths(self):
+        tasks = generate_tasks(2000, seed=1, priorities={Priority.URGENT: 1}, statuses={Status.DONE: 1},
+                               title_words=(3, 3), description_words=(0, 0), projects=0)
+        assert all(task.priority is Priority.URGENT and task.status is Status.DONE for task in tasks)
+        assert all(task.completed_at > task.created_at for task in tasks)
+        assert all(len(task.title.split()) == 4 and task.description == "" for task in tasks)
+        assert all(task.project_id is None for task in tasks)
+        assert len({task.id for task in tasks}) == 2000
+
+    def test_written_dataset_loads_in_manager(self, tmp_path):
+        path = str(tmp_path / "tasks.json")
+        write_dataset(path, 100, seed=2)
+        manager = TaskManager(path)
+        manager.load_from_file()
+        assert [task.to_dict() for task in manager.tasks] == list(iter_task_dicts(100, seed=2))
+
+    def test_sizes(self):
+        assert parse_size("10k") == 10_000
+        assert parse_size("1.5M") == 1_500_000
+        assert parse_size("250") == 250
+        assert format_size(10_000_000) == "10M"
+        assert format_size(1_500) == "1500"
+
+
+class TestSuite:
+    def test_run_suite_and_compare(self):
+        results = run_suite([200], cases=["get_task", "get_statistics"], repeat=1)
+        assert set(results["results"]) == {"get_task@200", "get_statistics@200"}
+        assert results["meta"]["sizes"] == [200]
+
+        slower = {"results": {key: dict(value, median_us=value["median_us"] * 2)
+                              for key, value in results["results"].items()}}
+        rows, regressions = compare(slower, results, tolerance=0.5)
+        assert len(rows) == 2
+        assert [row[0] for row in regressions] == ["get_task@200", "get_statistics@200"]
+        assert compare(results, slower, tolerance=0.5)[1] == []
+
+    def test_baseline_from_another_host_is_detected(self):
+        results = run_suite([200], cases=["get_task"], repeat=1)
+        assert host_mismatch(results, results) == []
+        other = {"meta": dict(results["meta"], host="elsewhere", cpu_count=64), "results": results["results"]}
+        assert host_mismatch(results, other) == ["host", "cpu_count"]
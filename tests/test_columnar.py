@@ -0,0 +1,175 @@
+import pytest
+from datetime import datetime, timezone
+from src.task_manager.columnar import TaskTable
+from src.task_manager.manager import TaskManager
+from src.task_manager.task import Task, Priority, Status
+
+class TestTaskTableStorage:
+    def setup_method(self):
+        self.table = TaskTable()
+        self.task = Task("Réunion équipe", "Réunion hebdomadaire", Priority.HIGH)
+        self.task.assign_to_project("project_123")
+        self.task.mark_completed()
+        self.table.add(self.task)
+
+    def test_round_trip_preserves_all_fields(self):
+        assert self.table.get(self.task.id).to_dict() == self.task.to_dict()
+
+    def test_non_uuid_ids_are_supported(self):
+        task = Task.from_dict({
+            "id": "sample-task-1",
+            "title": "Exemple",
+            "priority": "low",
+            "status": "todo",
+            "created_at": "2023-01-01T10:00:00"
+        })
+        self.table.add(task)
+        assert self.table.get("sample-task-1").to_dict() == task.to_dict()
+        assert self.table[1].id == "sample-task-1"
+        assert "sample-task-1" in self.table
+        assert self.table.get("sample-task-2") is None
+
+    def test_remove(self):
+        other = Task("Other")
+        self.table.add(other)
+        assert self.table.remove(self.task.id).id == self.task.id
+        assert self.table.get(self.task.id) is None
+        assert [t.id for t in self.table] == [other.id]
+        assert self.table.remove(self.task.id) is None
+
+    def test_add_duplicate_id_replaces(self):
+        self.table.add(Task.from_dict(self.task.to_dict()))
+        assert len(self.table) == 1
+
+    def test_aware_datetime_raises_error(self):
+        task = Task("Aware")
+        task.created_at = datetime.now(timezone.utc)
+        with pytest.raises(ValueError):
+            self.table.add(task)
+
+    def test_fixed_width_columns(self):
+        assert self.table.nbytes() == 16 + 1 + 1 + 8 + 8 + 8 + 4
+
+class TestTaskTableMutations:
+    def setup_method(self):
+        self.table = TaskTable()
+        self.task = Task("Task", priority=Priority.LOW)
+        self.table.add(self.task)
+
+    def test_mutations_on_materialized_task_are_written_back(self):
+        task = self.table.get(self.task.id)
+        task.update_priority(Priority.URGENT)
+        task.assign_to_project("project_123")
+        task.mark_completed()
+
+        stored = self.table.get(self.task.id)
+        assert stored.priority == Priority.URGENT
+        assert stored.project_id == "project_123"
+        assert stored.status == Status.DONE
+        assert stored.completed_at == task.completed_at
+
+    def test_completion_date_is_written_back(self):
+        task = Task("Other")
+        self.table.add(task)
+        task.mark_completed()
+        task.completed_at = datetime(2024, 1, 2)
+        task_id = task.id
+        del task
+        # Plus référencée : relue depuis les colonnes
+        assert self.table.get(task_id).completed_at == datetime(2024, 1, 2)
+
+    def test_filters_and_counts(self):
+        self.table.add(Task("Other", priority=Priority.HIGH))
+        self.table.get(self.task.id).mark_completed()
+
+        assert [t.id for t in self.table.by_status(Status.DONE)] == [self.task.id]
+        assert len(self.table.by_priority(Priority.HIGH)) == 1
+        assert len(self.table.by_project(None)) == 2
+        assert self.table.by_project("unknown") == []
+        assert self.table.count_by_status(Status.TODO) == 1
+        assert self.table.count_by_priority(Priority.LOW) == 1
+
+class TestTaskManagerWithTaskTable:
+    def test_manager_api_over_table(self):
+        manager = TaskManager("test_tasks.json", store=TaskTable())
+        task_id = manager.add_task("Task 1", priority=Priority.HIGH)
+        manager.add_task("Task 2", priority=Priority.LOW)
+        manager.get_task(task_id).mark_completed()
+
+        stats = manager.get_statistics()
+        assert stats["total_tasks"] == 2
+        assert stats["completed_tasks"] == 1
+        assert stats["tasks_by_priority"]["high"] == 1
+        assert manager.delete_task(task_id) is True
+        assert len(manager.tasks) == 1
+
+    def test_inserted_task_is_observed(self):
+        task = Task("Other", priority=Priority.LOW)
+        manager = TaskManager("test_tasks.json", store=TaskTable())
+        manager.tasks = [task]
+        task.mark_completed()
+        task.update_priority(Priority.URGENT)
+
+        assert manager.get_task(task.id) is task
+        stats = manager.get_statistics()
+        assert stats["completed_tasks"] == 1
+        assert stats["tasks_by_priority"]["urgent"] == 1
+
+    def test_get_returns_same_object_while_referenced(self):
+        task = Task("Task 1")
+        table = TaskTable([task])
+        assert table.get(task.id) is task
+        task_id = task.id
+        del task
+        assert table.get(task_id) is table.get(task_id)
+
+    def test_removed_task_is_no_longer_written_back(self):
+        task, other = Task("Task 1"), Task("Task 2")
+        table = TaskTable([task, other])
+        assert table.remove(task.id) is task
+        task.update_priority(Priority.LOW)
+        other.update_priority(Priority.URGENT)
+
+        assert table.count_by_priority(Priority.LOW) == 0
+        assert table.get(other.id).priority == Priority.URGENT
+        table.clear()
+        other.mark_completed()
+        assert len(table) == 0
+
+class TestTaskTableRemoveMany:
+    def test_remove_many(self):
+        tasks = [Task(f"Task {i}", priority=list(Priority)[i % 4]) for i in range(10)]
+        store = TaskTable(tasks)
+        removed = store.remove_many([task.id for task in tasks[::3]] + ["nonexistent_id"])
+        assert [task.id for task in removed] == [task.id for task in tasks[::3]]
+        assert len(store) == 6
+        assert [task.id for task in store] == [task.id for task in tasks if task not in tasks[::3]]
+        assert store.count_by_priority(Priority.LOW) == sum(
+            1 for i, task in enumerate(tasks) if i % 3 and task.priority is Priority.LOW)
+        assert store.remove_many([]) == []
+
+
+class TestTaskTableIndex:
+    def test_random_adds_and_removes_match_task_store(self):
+        import random
+        from src.task_manager.store import TaskStore
+        rng = random.Random(3)
+        table, reference = TaskTable(), TaskStore()
+        ids = []
+        for step in range(2000):
+            if ids and rng.random() < 0.45:
+                task_id = ids.pop(rng.randrange(len(ids)))
+                assert table.remove(task_id).id == reference.remove(task_id).id
+            else:
+                task = Task(f"Task {step}", priority=rng.choice(list(Priority)))
+                if rng.random() < 0.2:
+                    task = Task.from_dict(dict(task.to_dict(), id=f"custom-{step}"))
+                ids.append(task.id)
+                table.add(task)
+                reference.add(Task.from_dict(task.to_dict()))
+        assert [task.id for task in table] == [task.id for task in reference]
+        assert len(table) == len(reference)
+        assert all(table.get(task_id).id == task_id for task_id in ids)
+        assert table.count_by_priority(Priority.LOW) == reference.count_by_priority(Priority.LOW)
+        assert table[len(table) - 1].id == reference[len(reference) - 1].id
+        assert table.index_nbytes() <= 16 * max(len(table), 8)
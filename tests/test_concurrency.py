@@ -0,0 +1,195 @@
+import threading
+import time
+import pytest
+from src.task_manager.concurrency import ConcurrentTaskManager, ReadWriteLock
+from src.task_manager.csv_io import write_tasks_csv
+from src.task_manager.task import Task, Priority, Status
+
+class TestReadWriteLock:
+    def test_readers_share_the_lock(self):
+        lock = ReadWriteLock()
+        inside = threading.Barrier(2, timeout=2)
+
+        def reader():
+            with lock.read():
+                inside.wait()
+
+        threads = [threading.Thread(target=reader) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert not inside.broken
+
+    def test_writer_excludes_readers(self):
+        lock = ReadWriteLock()
+        events = []
+        lock.acquire_write()
+
+        def reader():
+            with lock.read():
+                events.append("read")
+
+        thread = threading.Thread(target=reader)
+        thread.start()
+        time.sleep(0.05)
+        events.append("write done")
+        lock.release_write()
+        thread.join()
+        assert events == ["write done", "read"]
+
+    def test_writer_is_reentrant_and_can_read(self):
+        lock = ReadWriteLock()
+        with lock.write():
+            with lock.write():
+                with lock.read():
+                    pass
+        with lock.read():
+            pass
+
+class TestConcurrentTaskManager:
+    def setup_method(self):
+        self.manager = ConcurrentTaskManager("test_tasks.json")
+
+    def test_basic_api(self):
+        task_id = self.manager.add_task("Task 1", priority=Priority.HIGH)
+        self.manager.get_task(task_id).mark_completed()
+        assert self.manager.get_tasks_by_status(Status.DONE)[0].id == task_id
+        assert self.manager.get_statistics()["completed_tasks"] == 1
+        assert [t.id for t in self.manager.query().priority(Priority.HIGH)] == [task_id]
+        assert [t.id for t in self.manager.search("task")] == [task_id]
+        assert isinstance(self.manager.tasks, list)
+        assert self.manager.delete_task(task_id) is True
+
+    def test_concurrent_writers_and_readers(self):
+        errors = []
+
+        def writer(offset):
+            try:
+                for i in range(200):
+                    task_id = self.manager.add_task(f"Task {offset + i}")
+                    if i % 2:
+                        self.manager.get_task(task_id).mark_completed()
+                    if i % 5 == 0:
+                        self.manager.delete_task(task_id)
+            except Exception as e:
+                errors.append(e)
+
+        def reader():
+            try:
+                for _ in range(200):
+                    stats = self.manager.get_statistics()
+                    assert stats["total_tasks"] >= 0
+                    self.manager.get_tasks_by_status(Status.DONE)
+                    self.manager.query().status(Status.TODO).order_by("created_at").limit(5).all()
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=writer, args=(i * 1000,)) for i in range(4)]
+        threads += [threading.Thread(target=reader) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        stats = self.manager.get_statistics()
+        assert stats["total_tasks"] == 4 * 160
+        assert stats["completed_tasks"] == len([t for t in self.manager.tasks if t.status == Status.DONE])
+
+    def test_save_and_load(self, tmp_path):
+        storage = str(tmp_path / "tasks.json")
+        manager = ConcurrentTaskManager(storage)
+        manager.add_task("Task 1")
+        manager.save_to_file()
+        reloaded = ConcurrentTaskManager(storage)
+        reloaded.load_from_file()
+        assert [t.title for t in reloaded.tasks] == ["Task 1"]
+
+    def test_binary_load_is_rejected(self, tmp_path):
+        with pytest.raises(ValueError):
+            self.manager.load_from_file(str(tmp_path / "tasks.bin"), format="binary")
+
+    def test_sqlite_load_is_rejected(self, tmp_path):
+        with pytest.raises(ValueError):
+            self.manager.load_from_file(str(tmp_path / "tasks.db"), format="sqlite")
+        assert not (tmp_path / "tasks.db").exists()
+
+    def test_journal_is_written_outside_the_lock(self, tmp_path):
+        manager = ConcurrentTaskManager(str(tmp_path / "tasks.json"), journal=True)
+        journal = manager._journal
+        write_locked = journal._write_locked
+        held = []
+
+        def checking(records):
+            held.append(manager._lock._writer == threading.get_ident())
+            write_locked(records)
+
+        journal._write_locked = checking
+
+        def worker(slot):
+            for i in range(50):
+                task_id = manager.add_task(f"Task {slot}-{i}")
+                manager.get_task(task_id).update_priority(Priority.HIGH)
+
+        threads = [threading.Thread(target=worker, args=(slot,)) for slot in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        manager.complete_tasks([task.id for task in manager.tasks][:20])
+        manager.close()
+        assert held and not any(held)
+
+        reloaded = ConcurrentTaskManager(str(tmp_path / "tasks.json"), journal=True)
+        reloaded.load_from_file()
+        assert len(reloaded.tasks) == 200
+        assert len(reloaded.get_tasks_by_priority(Priority.HIGH)) == 200
+        assert len(reloaded.get_tasks_by_status(Status.DONE)) == 20
+        reloaded.close()
+
+    def test_saved_copies_are_detached(self, tmp_path):
+        task_id = self.manager.add_task("Task 1")
+        copies = self.manager._tasks_to_save()
+        assert copies[0].to_dict() == self.manager.get_task(task_id).to_dict()
+        copies[0].mark_completed()
+        assert self.manager.get_task(task_id).status == Status.TODO
+
+    def test_csv_import_takes_the_write_lock(self, tmp_path):
+        path = str(tmp_path / "tasks.csv")
+        write_tasks_csv(path, [Task(f"Task {i}") for i in range(10)])
+        manager = ConcurrentTaskManager(str(tmp_path / "tasks.json"), journal=True)
+        add = manager._store.add
+        held = []
+
+        def checking(task):
+            held.append(manager._lock._writer == threading.get_ident())
+            add(task)
+
+        manager._store.add = checking
+        assert manager.import_csv(path) == 10
+        assert held == [True] * 10
+        assert not manager._journal._pending
+        manager.close()
+
+        reloaded = ConcurrentTaskManager(str(tmp_path / "tasks.json"), journal=True)
+        reloaded.load_from_file()
+        assert len(reloaded.tasks) == 10
+
+    def test_loaded_contents_are_journaled_under_the_lock(self, tmp_path):
+        other = ConcurrentTaskManager(str(tmp_path / "other.json"))
+        other.add_task("Other")
+        other.save_to_file()
+        path = str(tmp_path / "tasks.json")
+        manager = ConcurrentTaskManager(path, journal=True)
+        manager.add_task("Old")
+        manager.load_from_file(str(tmp_path / "other.json"))
+        assert not manager._journal._pending
+        manager.tasks = manager.tasks + [Task("Assigned")]
+        assert not manager._journal._pending
+
+        # Sans close() : le journal suffit à retrouver le contenu chargé
+        reloaded = ConcurrentTaskManager(path, journal=True)
+        reloaded.load_from_file()
+        assert sorted(task.title for task in reloaded.tasks) == ["Assigned", "Other"]
+        manager.close()
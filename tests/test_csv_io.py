@@ -0,0 +1,144 @@
+import gzip
+import io
+from datetime import datetime
+
+import pytest
+
+from src.task_manager.csv_io import iter_csv_chunks, read_tasks_csv, write_tasks_csv
+from src.task_manager.manager import TaskManager
+from src.task_manager.services import ReportService
+from src.task_manager.task import Task, Priority, Status
+
+
+def make_tasks(count=25):
+    tasks = []
+    for i in range(count):
+        task = Task(f"Task {i}", f"Line one, \"quoted\"\nline two {i}", list(Priority)[i % 4])
+        if i % 3 == 0:
+            task.mark_completed()
+        if i % 5 == 0:
+            task.assign_to_project(f"project-{i % 2}")
+            task.due_at = datetime(2024, 5, 1 + i % 28, 9, 30)
+        tasks.append(task)
+    return tasks
+
+
+class TestCsvExport:
+    def setup_method(self):
+        self.tasks = make_tasks()
+
+    def test_matches_report_service_export(self, tmp_path):
+        expected = tmp_path / "expected.csv"
+        ReportService().export_tasks_csv(self.tasks, str(expected))
+        streamed = tmp_path / "streamed.csv"
+        assert write_tasks_csv(str(streamed), iter(self.tasks), chunk_size=4) == 25
+        assert streamed.read_bytes() == expected.read_bytes()
+
+    def test_accepts_generators_and_text_streams(self):
+        out = io.StringIO()
+        count = write_tasks_csv(out, (task for task in self.tasks if task.status is Status.DONE), chunk_size=2)
+        assert count == 9
+        assert out.getvalue().count("\r\n") == 1 + 9
+
+    def test_chunks_are_yielded_lazily(self):
+        chunks = iter_csv_chunks(self.tasks, chunk_size=10)
+        assert next(chunks).startswith("ID,Title")
+        assert len(list(chunks)) == 3
+
+    def test_process_pool_keeps_row_order(self):
+        serial = "".join(iter_csv_chunks(self.tasks, chunk_size=3))
+        parallel = "".join(iter_csv_chunks(self.tasks, chunk_size=3, processes=2))
+        assert parallel == serial
+
+    def test_gzip_to_path_and_binary_stream(self, tmp_path):
+        path = tmp_path / "tasks.csv.gz"
+        write_tasks_csv(str(path), self.tasks)
+        plain = "".join(iter_csv_chunks(self.tasks))
+        assert gzip.decompress(path.read_bytes()).decode("utf-8") == plain
+
+        stream = io.BytesIO()
+        write_tasks_csv(stream, self.tasks, compress=True)
+        assert gzip.decompress(stream.getvalue()).decode("utf-8") == plain
+        assert not stream.closed
+
+    def test_gzip_requires_binary_stream(self):
+        with pytest.raises(ValueError):
+            write_tasks_csv(io.StringIO(), self.tasks, compress=True)
+
+    def test_non_string_project_id(self):
+        task = Task("Numbered project")
+        task.assign_to_project(42)
+        buffer = io.StringIO()
+        write_tasks_csv(buffer, [task], extended=True)
+        assert buffer.getvalue().splitlines()[1].split(",")[7] == "42"
+
+    def test_failed_export_leaves_no_temporary_file(self, tmp_path):
+        def tasks():
+            yield make_tasks(1)[0]
+            raise RuntimeError("source failed")
+
+        path = tmp_path / "tasks.csv"
+        with pytest.raises(RuntimeError):
+            write_tasks_csv(str(path), tasks())
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestCsvImport:
+    def setup_method(self):
+        self.tasks = make_tasks()
+
+    @pytest.mark.parametrize("filename", ["tasks.csv", "tasks.csv.gz"])
+    def test_extended_round_trip(self, tmp_path, filename):
+        path = str(tmp_path / filename)
+        write_tasks_csv(path, self.tasks, extended=True)
+        assert [task.to_dict() for task in read_tasks_csv(path)] == [task.to_dict() for task in self.tasks]
+
+    def test_basic_export_round_trip_without_project(self):
+        stream = io.BytesIO()
+        write_tasks_csv(stream, self.tasks, compress=True)
+        stream.seek(0)
+        loaded = list(read_tasks_csv(stream))
+        assert [task.id for task in loaded] == [task.id for task in self.tasks]
+        assert loaded[0].project_id is None
+        assert loaded[0].completed_at == self.tasks[0].completed_at
+
+    def test_invalid_rows_raise_error(self):
+        text = "ID,Title,Description,Priority,Status,Created,Completed\r\n1,Task,,bogus,todo,2024-01-01T00:00:00,\r\n"
+        with pytest.raises(ValueError, match="line 2"):
+            list(read_tasks_csv(io.StringIO(text)))
+        with pytest.raises(ValueError):
+            list(read_tasks_csv(io.StringIO("a,b\r\n")))
+
+    def test_manager_import_and_export(self, tmp_path):
+        path = str(tmp_path / "tasks.csv.gz")
+        source = TaskManager()
+        source.tasks = self.tasks
+        assert source.export_csv(path, extended=True) == 25
+
+        manager = TaskManager()
+        manager.add_task("Existing")
+        assert manager.import_csv(path) == 25
+        assert len(manager.tasks) == 26
+        assert manager.get_tasks_by_project("project-0")
+        assert manager.search("quoted")
+
+        assert manager.import_csv(path, replace=True) == 25
+        assert len(manager.tasks) == 25
+
+    def test_manager_import_publishes_one_batch(self, tmp_path):
+        path = str(tmp_path / "tasks.csv")
+        write_tasks_csv(path, self.tasks)
+        manager = TaskManager()
+        subscription = manager.changes().subscribe()
+        offers = []
+        offer = subscription._offer
+        subscription._offer = lambda events: offers.append(len(events)) or offer(events)
+        assert manager.import_csv(path) == 25
+        assert offers == [25]
+        subscription.close()
+
+    def test_manager_import_error_raises_ioerror(self, tmp_path):
+        path = tmp_path / "broken.csv"
+        path.write_text("not,a,task,export\n")
+        with pytest.raises(IOError):
+            TaskManager().import_csv(str(path))
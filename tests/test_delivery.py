@@ -0,0 +1,213 @@
+import queue
+import smtplib
+import socketserver
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+from src.task_manager.delivery import DeliveryPipeline, RateLimiter, SMTPConnectionPool, build_message
+from src.task_manager.services import EmailService, _is_valid_address
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    # Serveur SMTP minimal : assez pour smtplib (EHLO, MAIL, RCPT, DATA, RSET, QUIT)
+    def handle(self):
+        server = self.server
+        with server.lock:
+            server.connections += 1
+        self._reply("220 localhost ready")
+        recipients = []
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode().strip().upper()
+            if command.startswith(("EHLO", "HELO")):
+                self._reply("250 localhost")
+            elif command.startswith("MAIL"):
+                recipients = []
+                self._reply("250 OK")
+            elif command.startswith("RCPT"):
+                recipient = line.decode().split(":", 1)[1].strip().strip("<>")
+                if recipient in server.rejected:
+                    self._reply("550 No such user")
+                else:
+                    recipients.append(recipient)
+                    self._reply("250 OK")
+            elif command == "DATA":
+                self._reply("354 End data with <CR><LF>.<CR><LF>")
+                data = []
+                while True:
+                    line = self.rfile.readline()
+                    if line in (b".\r\n", b""):
+                        break
+                    data.append(line)
+                with server.lock:
+                    server.messages.append((recipients, b"".join(data).decode()))
+                self._reply("250 OK")
+            elif command == "RSET" or command == "NOOP":
+                self._reply("250 OK")
+            elif command == "QUIT":
+                self._reply("221 Bye")
+                return
+            else:
+                self._reply("500 Unknown command")
+
+    def _reply(self, text):
+        self.wfile.write(text.encode() + b"\r\n")
+
+
+class _SMTPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _SMTPHandler)
+        self.lock = threading.Lock()
+        self.messages = []
+        self.connections = 0
+        self.rejected = set()
+
+
+@pytest.fixture
+def smtp_server():
+    server = _SMTPServer()
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _pipeline(server, **options):
+    pool = SMTPConnectionPool("127.0.0.1", server.server_address[1], size=options.pop("size", 2), timeout=5)
+    return DeliveryPipeline(pool, **options)
+
+
+class _FlakyConnection:
+    # Connexion factice qui se coupe après ``fail_after`` envois
+    def __init__(self, sent, fail_after):
+        self.sent = sent
+        self.fail_after = fail_after
+
+    def send_message(self, message):
+        if self.fail_after == 0:
+            raise smtplib.SMTPServerDisconnected("Connection lost")
+        self.fail_after -= 1
+        self.sent.append(message["To"])
+
+    def quit(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class TestDeliveryPipeline:
+    def test_delivers_messages_over_reused_connections(self, smtp_server):
+        pipeline = _pipeline(smtp_server, workers=2, batch_size=10)
+        futures = [pipeline.submit(build_message("noreply@example.com", f"user{i}@example.com", "Hi", "Body"))
+                   for i in range(50)]
+        assert all(future.result(timeout=5) for future in futures)
+        pipeline.close()
+
+        assert len(smtp_server.messages) == 50
+        assert smtp_server.connections <= 2
+        assert {recipients[0] for recipients, _ in smtp_server.messages} == {f"user{i}@example.com" for i in range(50)}
+
+    def test_permanent_rejection_fails_only_that_message(self, smtp_server):
+        smtp_server.rejected.add("ghost@example.com")
+        pipeline = _pipeline(smtp_server, workers=1)
+        bad = pipeline.submit(build_message("noreply@example.com", "ghost@example.com", "Hi", "Body"))
+        good = pipeline.submit(build_message("noreply@example.com", "user@example.com", "Hi", "Body"))
+
+        with pytest.raises(smtplib.SMTPRecipientsRefused):
+            bad.result(timeout=5)
+        assert good.result(timeout=5) is True
+        pipeline.close()
+        assert len(smtp_server.messages) == 1
+
+    def test_retries_rest_of_batch_after_disconnect(self):
+        sent = []
+        attempts = iter([2, 100])
+        pool = SMTPConnectionPool("unused", factory=lambda host, port, timeout: _FlakyConnection(sent, next(attempts)))
+        pipeline = DeliveryPipeline(pool, workers=1, batch_size=10, backoff=0.01)
+        messages = [build_message("noreply@example.com", f"user{i}@example.com", "Hi", "Body") for i in range(5)]
+        futures = [pipeline.submit(message) for message in messages]
+
+        assert all(future.result(timeout=5) for future in futures)
+        pipeline.close()
+        assert sorted(sent) == sorted(f"user{i}@example.com" for i in range(5))
+
+    def test_gives_up_after_max_retries(self):
+        def refuse(host, port, timeout):
+            raise ConnectionRefusedError("No server")
+
+        pipeline = DeliveryPipeline(SMTPConnectionPool("unused", factory=refuse), workers=1,
+                                    max_retries=2, backoff=0.01)
+        future = pipeline.submit(build_message("noreply@example.com", "user@example.com", "Hi", "Body"))
+        with pytest.raises(ConnectionRefusedError):
+            future.result(timeout=5)
+        pipeline.close()
+
+    def test_bounded_queue_applies_backpressure(self):
+        release = threading.Event()
+
+        class Blocking(_FlakyConnection):
+            def send_message(self, message):
+                release.wait()
+
+        pool = SMTPConnectionPool("unused", factory=lambda host, port, timeout: Blocking([], 0))
+        pipeline = DeliveryPipeline(pool, queue_size=1, batch_size=1, workers=1)
+        message = build_message("noreply@example.com", "user@example.com", "Hi", "Body")
+        pipeline.submit(message)
+        time.sleep(0.05)
+        pipeline.submit(message)
+        with pytest.raises(queue.Full):
+            pipeline.submit(message, timeout=0.05)
+        release.set()
+        pipeline.close()
+
+    def test_rate_limiter_spaces_sends(self):
+        limiter = RateLimiter(100, burst=1)
+        start = time.monotonic()
+        for _ in range(6):
+            limiter.acquire()
+        assert time.monotonic() - start >= 0.04
+
+
+class TestPooledEmailService:
+    def test_send_reminders_through_pipeline(self, smtp_server):
+        service = EmailService("127.0.0.1", smtp_server.server_address[1], pipeline=_pipeline(smtp_server))
+        assert service.send_task_reminder("user@example.com", "Write report", datetime(2024, 1, 2, 9, 30)) is True
+        futures = service.send_task_reminders(
+            [(f"user{i}@example.com", f"Task {i}", None) for i in range(20)])
+        assert all(future.result(timeout=5) for future in futures)
+        service.close()
+
+        assert len(smtp_server.messages) == 21
+        bodies = [body for _, body in smtp_server.messages]
+        assert any("Subject: Reminder: Write report" in body and "2024-01-02 09:30" in body for body in bodies)
+
+    def test_single_send_waits_for_delivery_and_raises(self, smtp_server):
+        smtp_server.rejected.add("ghost@example.com")
+        service = EmailService("127.0.0.1", smtp_server.server_address[1], pipeline=_pipeline(smtp_server))
+        assert service.send_completion_notification("user@example.com", "Write report") is True
+        assert len(smtp_server.messages) == 1
+        with pytest.raises(smtplib.SMTPRecipientsRefused):
+            service.send_completion_notification("ghost@example.com", "Write report")
+        service.close()
+
+    def test_bulk_send_requires_pipeline(self):
+        with pytest.raises(RuntimeError):
+            EmailService().send_task_reminders([("user@example.com", "Task", None)])
+
+    def test_email_validation_is_memoized(self):
+        _is_valid_address.cache_clear()
+        service = EmailService()
+        assert service._is_valid_email("user@example.com")
+        assert service._is_valid_email("user@example.com")
+        assert not service._is_valid_email("invalid-email")
+        assert _is_valid_address.cache_info().hits == 1
@@ -0,0 +1,245 @@
+import threading
+
+import pytest
+
+from src.task_manager.concurrency import ConcurrentTaskManager
+from src.task_manager.events import (
+    BLOCK, COMPLETED, CREATED, DELETED, DROP_NEWEST, PRIORITY_CHANGED, PROJECT_ASSIGNED,
+    STATUS_CHANGED, ChangeFeed,
+)
+from src.task_manager.manager import TaskManager
+from src.task_manager.task import Task, Priority, Status
+
+
+def kinds(events):
+    return [event.kind for event in events]
+
+
+class TestChangeFeed:
+    def test_manager_mutations_emit_events(self, tmp_path):
+        manager = TaskManager(str(tmp_path / "tasks.json"))
+        subscription = manager.changes().subscribe()
+        task_id = manager.add_task("Write report")
+        task = manager.get_task(task_id)
+        task.priority = Priority.URGENT
+        task.assign_to_project("project-1")
+        task.status = Status.IN_PROGRESS
+        task.mark_completed()
+        manager.delete_task(task_id)
+
+        events = subscription.get_batch(timeout=0)
+        assert kinds(events) == [CREATED, PRIORITY_CHANGED, PROJECT_ASSIGNED, STATUS_CHANGED, COMPLETED, DELETED]
+        assert {event.task_id for event in events} == {task_id}
+        assert (events[1].old, events[1].new) == (Priority.MEDIUM, Priority.URGENT)
+        assert [event.sequence for event in events] == sorted(event.sequence for event in events)
+
+    def test_bulk_operations_emit_one_event_per_task(self, tmp_path):
+        manager = TaskManager(str(tmp_path / "tasks.json"))
+        subscription = manager.changes().subscribe(batch_size=1000)
+        ids = manager.add_tasks([f"Task {i}" for i in range(10)])
+        manager.complete_tasks(ids[:4])
+        manager.update_priorities(ids, Priority.HIGH)
+        manager.delete_tasks(ids[8:])
+
+        events = subscription.get_batch(timeout=0)
+        assert kinds(events).count(CREATED) == 10
+        assert kinds(events).count(COMPLETED) == 4
+        assert kinds(events).count(PRIORITY_CHANGED) == 10
+        assert [event.task_id for event in events if event.kind == DELETED] == ids[8:]
+
+    def test_filters_by_kind_and_predicate(self, tmp_path):
+        manager = TaskManager(str(tmp_path / "tasks.json"))
+        feed = manager.changes()
+        completed = feed.subscribe(kinds=[COMPLETED])
+        urgent = feed.subscribe(predicate=lambda event: event.task.priority is Priority.URGENT)
+        ids = manager.add_tasks(["Low", {"title": "Urgent", "priority": Priority.URGENT}])
+        manager.complete_tasks(ids)
+
+        assert [event.task.title for event in completed.get_batch(timeout=0)] == ["Low", "Urgent"]
+        assert kinds(urgent.get_batch(timeout=0)) == [CREATED, COMPLETED]
+        with pytest.raises(ValueError):
+            feed.subscribe(kinds=["renamed"])
+
+    def test_reload_emits_incremental_diff(self, tmp_path):
+        path = str(tmp_path / "tasks.json")
+        manager = TaskManager(path)
+        kept, done, removed = manager.add_tasks(["Kept", "Done", "Removed"])
+        manager.save_to_file()
+        manager.get_task(done).mark_completed()
+        manager.delete_task(removed)
+        added = manager.add_task("Added")
+
+        subscription = manager.changes().subscribe()
+        manager.load_from_file()
+        events = subscription.get_batch(timeout=0)
+        # Retour à l'état du fichier : seules les différences sont publiées
+        assert sorted((event.kind, event.task_id) for event in events) == sorted([
+            (CREATED, removed), (STATUS_CHANGED, done), (DELETED, added),
+        ])
+
+    def test_journal_replay_emits_created_events(self, tmp_path):
+        path = str(tmp_path / "tasks.json")
+        writer = TaskManager(path, journal=True)
+        writer.add_tasks(["A", "B"])
+        writer.close()
+
+        reader = TaskManager(path, journal=True)
+        subscription = reader.changes().subscribe()
+        reader.load_from_file()
+        assert kinds(subscription.get_batch(timeout=0)) == [CREATED, CREATED]
+        reader.close()
+
+    def test_store_swap_emits_diff(self, tmp_path):
+        manager = TaskManager(str(tmp_path / "tasks.db"))
+        task_id = manager.add_task("Stored")
+        manager.save_to_file(format="sqlite")
+        manager.add_task("Only in memory")
+
+        subscription = manager.changes().subscribe()
+        manager.load_from_file(format="sqlite")
+        events = subscription.get_batch(timeout=0)
+        assert kinds(events) == [DELETED]
+        manager.get_task(task_id).mark_completed()
+        assert kinds(subscription.get_batch(timeout=0)) == [COMPLETED]
+        manager.close()
+
+
+class TestBackpressure:
+    def test_drop_oldest_keeps_latest_events(self):
+        manager = TaskManager()
+        subscription = manager.changes().subscribe(maxsize=3)
+        ids = manager.add_tasks([f"Task {i}" for i in range(5)])
+        assert [event.task_id for event in subscription.get_batch(timeout=0)] == ids[2:]
+        assert subscription.dropped == 2
+
+    def test_drop_newest_keeps_first_events(self):
+        manager = TaskManager()
+        subscription = manager.changes().subscribe(maxsize=3, policy=DROP_NEWEST)
+        ids = manager.add_tasks([f"Task {i}" for i in range(5)])
+        assert [event.task_id for event in subscription.get_batch(timeout=0)] == ids[:3]
+        assert subscription.dropped == 2
+
+    def test_block_waits_for_consumer(self):
+        manager = TaskManager()
+        subscription = manager.changes().subscribe(maxsize=2, policy=BLOCK)
+        received = []
+
+        def consume():
+            for batch in subscription.batches(timeout=1):
+                received.extend(batch)
+
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+        manager.add_tasks([f"Task {i}" for i in range(50)])
+        consumer.join()
+        assert len(received) == 50
+        assert subscription.dropped == 0
+
+    def test_block_timeout_drops(self):
+        subscription = TaskManager().changes().subscribe(maxsize=1, policy=BLOCK, block_timeout=0.01)
+        subscription._feed.created([Task("A"), Task("B")])
+        assert len(subscription) == 1
+        assert subscription.dropped == 1
+
+    def test_invalid_policy(self):
+        with pytest.raises(ValueError):
+            ChangeFeed().subscribe(policy="spill")
+
+
+class TestSubscriptionLifecycle:
+    def test_close_unsubscribes(self):
+        manager = TaskManager()
+        with manager.changes().subscribe() as subscription:
+            manager.add_task("Before")
+        manager.add_task("After")
+        assert len(manager.changes()) == 0
+        assert [event.task.title for event in subscription.get_batch(timeout=0)] == ["Before"]
+        assert subscription.get(timeout=0) is None
+
+    def test_callback_receives_batches(self):
+        manager = TaskManager()
+        batches = []
+        subscription = manager.changes().subscribe(kinds=[COMPLETED], callback=batches.append)
+        ids = manager.add_tasks(["A", "B", "C"])
+        manager.complete_tasks(ids)
+        subscription.close()
+        assert sum(len(batch) for batch in batches) == 3
+        assert all(event.kind == COMPLETED for batch in batches for event in batch)
+
+    def test_completion_notifications(self):
+        # Exemple d'usage : notifier les fins de tâches sans relire toutes les tâches
+        manager = TaskManager()
+        notified = []
+        subscription = manager.changes().subscribe(kinds=[COMPLETED])
+        task_id = manager.add_task("Ship release")
+        manager.get_task(task_id).mark_completed()
+        for event in subscription.get_batch(timeout=0):
+            notified.append(("team@example.com", event.task.title))
+        assert notified == [("team@example.com", "Ship release")]
+
+    def test_concurrent_manager(self):
+        manager = ConcurrentTaskManager()
+        subscription = manager.changes().subscribe()
+        ids = manager.add_tasks(["A", "B"])
+        manager.complete_tasks(ids[:1])
+        assert kinds(subscription.get_batch(timeout=0)) == [CREATED, CREATED, COMPLETED]
+
+    def test_no_feed_without_subscriber(self):
+        manager = TaskManager()
+        manager.add_task("A")
+        assert manager._change_feed is None
+
+
+class TestBatching:
+    def count_offers(self, subscription):
+        calls = []
+        offer = subscription._offer
+
+        def counting(events):
+            calls.append(len(events))
+            offer(events)
+
+        subscription._offer = counting
+        return calls
+
+    def test_bulk_apis_publish_one_batch(self):
+        manager = TaskManager()
+        subscription = manager.changes().subscribe(maxsize=10_000)
+        calls = self.count_offers(subscription)
+        ids = manager.add_tasks([f"Task {i}" for i in range(1000)])
+        manager.complete_tasks(ids)
+        manager.update_priorities(ids, Priority.URGENT)
+        manager.assign_to_project(ids, "project-1")
+        manager.delete_tasks(ids)
+        assert calls == [1000] * 5
+        assert len(subscription) == 5000
+
+    def test_nested_batches_publish_on_outer_exit(self):
+        feed = ChangeFeed()
+        subscription = feed.subscribe()
+        with feed.batch():
+            with feed.batch():
+                feed.created([Task("A")])
+            assert len(subscription) == 0
+            feed.created([Task("B")])
+        assert [event.task.title for event in subscription.get_batch(timeout=0)] == ["A", "B"]
+
+    def test_events_follow_the_journal_write(self, tmp_path):
+        manager = TaskManager(str(tmp_path / "tasks.json"), journal=True)
+        subscription = manager.changes().subscribe()
+        journaled = []
+        offer = subscription._offer
+
+        def checking(events):
+            log = (tmp_path / "tasks.json.log").read_text()
+            for event in events:
+                record = '"id":"%s"' if event.kind == CREATED else '"op":"delete","id":"%s"'
+                journaled.append(record % event.task_id in log)
+            offer(events)
+
+        subscription._offer = checking
+        task_id = manager.add_task("Task 1")
+        manager.add_tasks(["Task 2", "Task 3"])
+        manager.delete_task(task_id)
+        manager.close()
+        assert journaled == [True] * 4
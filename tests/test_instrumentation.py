@@ -0,0 +1,127 @@
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from src.task_manager.instrumentation import Instrumentation, MetricsRegistry, ProfileCapture, prometheus_text
+from src.task_manager.manager import TaskManager
+from src.task_manager.services import EmailService, ReportService
+from src.task_manager.task import Priority
+
+
+def entry(snapshot, name, **labels):
+    return next(item for item in snapshot[name] if item["labels"] == labels)
+
+
+class TestMetricsRegistry:
+    def test_counters_and_histograms(self):
+        registry = MetricsRegistry()
+        registry.counter("calls_total", method="get").inc()
+        registry.counter("calls_total", method="get").inc(2)
+        histogram = registry.histogram("latency_seconds", buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 5):
+            histogram.observe(value)
+
+        snapshot = registry.snapshot()
+        assert entry(snapshot, "calls_total", method="get")["value"] == 3
+        latency = entry(snapshot, "latency_seconds")
+        assert latency["count"] == 3
+        assert list(latency["buckets"].values()) == [1, 2, 3]
+        with pytest.raises(ValueError):
+            registry.histogram("calls_total", method="get")
+
+    def test_gauges_are_read_at_export(self):
+        registry = MetricsRegistry()
+        depth = [3]
+        registry.gauge("queue_depth", lambda: depth[0], queue="email")
+        depth[0] = 7
+        assert entry(registry.snapshot(), "queue_depth", queue="email")["value"] == 7
+        registry.remove_gauge("queue_depth", queue="email")
+        assert "queue_depth" not in registry.snapshot()
+
+    def test_prometheus_text(self):
+        registry = MetricsRegistry()
+        registry.describe("calls_total", "Number of calls")
+        registry.counter("calls_total", method='say "hi"').inc()
+        registry.histogram("latency_seconds", buckets=(0.5,)).observe(0.25)
+        text = registry.export(prometheus_text)
+        assert "# HELP calls_total Number of calls\n# TYPE calls_total counter\n" in text
+        assert 'calls_total{method="say \\"hi\\""} 1\n' in text
+        assert 'latency_seconds_bucket{le="0.5"} 1\n' in text
+        assert 'latency_seconds_bucket{le="+Inf"} 1\n' in text
+        assert "latency_seconds_count 1\n" in text
+
+
+class TestInstrumentation:
+    def setup_method(self):
+        self.instrumentation = Instrumentation()
+
+    def test_manager_calls_mutations_and_bytes(self, tmp_path):
+        manager = TaskManager(str(tmp_path / "tasks.json"))
+        self.instrumentation.instrument(manager)
+        task_id = manager.add_task("Report", priority=Priority.HIGH)
+        manager.get_task(task_id).mark_completed()
+        manager.get_statistics()
+        manager.get_statistics()
+        manager.save_to_file()
+        manager.load_from_file()
+
+        snapshot = self.instrumentation.snapshot()
+        assert entry(snapshot, "task_manager_call_seconds", method="get_statistics")["count"] == 2
+        assert entry(snapshot, "task_mutations_total", manager="default", field="status")["value"] == 1
+        size = (tmp_path / "tasks.json").stat().st_size
+        assert entry(snapshot, "task_manager_bytes_written_total", manager="default")["value"] == size
+        assert entry(snapshot, "task_manager_bytes_read_total", manager="default")["value"] == size
+        assert entry(snapshot, "task_manager_tasks", manager="default")["value"] == 1
+
+    def test_errors_are_counted(self):
+        manager = self.instrumentation.instrument(TaskManager())
+        with pytest.raises(ValueError):
+            manager.add_task("")
+        snapshot = self.instrumentation.snapshot()
+        assert entry(snapshot, "task_manager_errors_total", method="add_task")["value"] == 1
+        assert entry(snapshot, "task_manager_call_seconds", method="add_task")["count"] == 1
+
+    def test_uninstrument_restores_original_methods(self):
+        manager = TaskManager()
+        self.instrumentation.instrument(manager)
+        assert "get_task" in vars(manager)
+        self.instrumentation.uninstrument(manager)
+        assert "get_task" not in vars(manager)
+        task_id = manager.add_task("Task")
+        manager.get_task(task_id).mark_completed()
+        snapshot = self.instrumentation.snapshot()
+        assert "task_mutations_total" not in snapshot
+        assert "task_manager_tasks" not in snapshot
+
+    def test_services(self, tmp_path):
+        reports = self.instrumentation.instrument(ReportService())
+        reports.generate_daily_report([], datetime(2024, 1, 1))
+        reports.export_tasks_csv([], str(tmp_path / "tasks.csv"))
+
+        pipeline = Mock()
+        pipeline.qsize.return_value = 12
+        email = self.instrumentation.instrument(EmailService(pipeline=pipeline))
+        email.send_task_reminder("a@example.com", "Report", None)
+
+        snapshot = self.instrumentation.snapshot()
+        assert entry(snapshot, "report_service_call_seconds", method="generate_daily_report")["count"] == 1
+        assert entry(snapshot, "report_service_bytes_written_total")["value"] > 0
+        assert entry(snapshot, "email_service_call_seconds", method="send_task_reminder")["count"] == 1
+        assert entry(snapshot, "email_queue_depth", service="default")["value"] == 12
+        assert "email_queue_depth" in self.instrumentation.prometheus()
+
+    def test_instrument_rejects_unknown_types(self):
+        with pytest.raises(TypeError):
+            self.instrumentation.instrument(object())
+
+
+class TestProfileCapture:
+    def test_cpu_and_memory_capture(self):
+        manager = TaskManager()
+        with Instrumentation().profile(cpu=True, memory=True) as capture:
+            for i in range(200):
+                manager.add_task(f"Task {i}")
+        assert "add_task" in capture.stats(limit=50)
+        assert capture.peak_memory > 0
+        assert capture.top_allocations(3)
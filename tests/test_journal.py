@@ -0,0 +1,190 @@
+import json
+from datetime import datetime
+import pytest
+from src.task_manager.journal import TaskJournal, apply_record
+from src.task_manager.manager import TaskManager
+from src.task_manager.task import Task, Priority, Status
+
+class TestApplyRecord:
+    def setup_method(self):
+        self.task = Task("Test task", priority=Priority.LOW)
+        self.tasks = {}
+        apply_record(self.tasks, {"op": "add", "task": self.task.to_dict()})
+
+    def test_add_and_delete(self):
+        assert self.tasks[self.task.id]["title"] == "Test task"
+        apply_record(self.tasks, {"op": "delete", "id": self.task.id})
+        assert self.tasks == {}
+
+    def test_mutations(self):
+        apply_record(self.tasks, {"op": "complete", "id": self.task.id, "completed_at": "2023-01-01T10:00:00"})
+        apply_record(self.tasks, {"op": "reprioritize", "id": self.task.id, "priority": "urgent"})
+        apply_record(self.tasks, {"op": "assign", "id": self.task.id, "project_id": "project_123"})
+        apply_record(self.tasks, {"op": "reschedule", "id": self.task.id, "due_at": "2023-01-02T09:00:00"})
+        data = self.tasks[self.task.id]
+        assert data["status"] == "done"
+        assert data["completed_at"] == "2023-01-01T10:00:00"
+        assert data["priority"] == "urgent"
+        assert data["project_id"] == "project_123"
+        assert data["due_at"] == "2023-01-02T09:00:00"
+
+    def test_mutation_of_unknown_task_is_ignored(self):
+        apply_record(self.tasks, {"op": "complete", "id": "nonexistent_id", "completed_at": None})
+        assert list(self.tasks) == [self.task.id]
+
+    def test_unknown_operation_raises_error(self):
+        with pytest.raises(ValueError):
+            apply_record(self.tasks, {"op": "explode", "id": self.task.id})
+
+class TestJournalManager:
+    def setup_method(self):
+        self.manager = None
+
+    def teardown_method(self):
+        if self.manager is not None:
+            self.manager.close()
+
+    def make_manager(self, path, **kwargs):
+        self.manager = TaskManager(str(path), journal=True, **kwargs)
+        return self.manager
+
+    def test_mutations_are_appended_as_compact_records(self, tmp_path):
+        storage = tmp_path / "tasks.json"
+        manager = self.make_manager(storage)
+        task_id = manager.add_task("Task 1", priority=Priority.LOW)
+        task = manager.get_task(task_id)
+        task.update_priority(Priority.HIGH)
+        task.assign_to_project("project_123")
+        task.mark_completed()
+        manager.delete_task(task_id)
+        manager.close()
+
+        lines = (tmp_path / "tasks.json.log").read_text().splitlines()
+        ops = [json.loads(line)["op"] for line in lines]
+        assert ops == ["add", "reprioritize", "assign", "complete", "delete"]
+        assert all(": " not in line for line in lines)
+        assert not storage.exists()
+
+    def test_load_replays_log_tail(self, tmp_path):
+        storage = tmp_path / "tasks.json"
+        manager = self.make_manager(storage)
+        kept_id = manager.add_task("Task 1", priority=Priority.LOW)
+        deleted_id = manager.add_task("Task 2")
+        manager.get_task(kept_id).mark_completed()
+        manager.delete_task(deleted_id)
+        manager.close()
+
+        reloaded = self.make_manager(storage)
+        reloaded.load_from_file()
+        assert len(reloaded.tasks) == 1
+        task = reloaded.get_task(kept_id)
+        assert task.status == Status.DONE
+        assert task.completed_at is not None
+
+    def test_save_compacts_into_snapshot(self, tmp_path):
+        storage = tmp_path / "tasks.json"
+        manager = self.make_manager(storage)
+        task_id = manager.add_task("Task 1")
+        manager.save_to_file()
+
+        assert not (tmp_path / "tasks.json.log").exists()
+        assert not (tmp_path / "tasks.json.log.1").exists()
+        assert [t["id"] for t in json.loads(storage.read_text())] == [task_id]
+
+        manager.get_task(task_id).update_priority(Priority.URGENT)
+        manager.close()
+        reloaded = self.make_manager(storage)
+        reloaded.load_from_file()
+        assert reloaded.get_task(task_id).priority == Priority.URGENT
+
+    def test_threshold_triggers_background_compaction(self, tmp_path):
+        storage = tmp_path / "tasks.json"
+        manager = self.make_manager(storage, compact_threshold=3)
+        ids = [manager.add_task(f"Task {i}") for i in range(4)]
+        manager.close()
+
+        assert len(json.loads(storage.read_text())) == 3
+        reloaded = self.make_manager(storage)
+        reloaded.load_from_file()
+        assert [t.id for t in reloaded.tasks] == ids
+
+    def test_torn_last_record_is_dropped(self, tmp_path):
+        storage = tmp_path / "tasks.json"
+        manager = self.make_manager(storage)
+        task_id = manager.add_task("Task 1")
+        manager.close()
+        with open(tmp_path / "tasks.json.log", "a") as f:
+            f.write('{"op": "delete", "id"')
+
+        reloaded = self.make_manager(storage)
+        reloaded.load_from_file()
+        assert reloaded.get_task(task_id) is not None
+        reloaded.add_task("Task 2")
+        reloaded.close()
+        assert len(self.make_manager(storage).tasks) == 0
+        self.manager.load_from_file()
+        assert len(self.manager.tasks) == 2
+
+    def test_interrupted_compaction_is_recovered(self, tmp_path):
+        storage = tmp_path / "tasks.json"
+        journal = TaskJournal(str(storage))
+        task = Task("Task 1")
+        journal.record_add(task)
+        journal.close()
+        (tmp_path / "tasks.json.log").rename(tmp_path / "tasks.json.log.1")
+
+        data = TaskJournal(str(storage)).load()
+        assert [d["id"] for d in data] == [task.id]
+        assert not (tmp_path / "tasks.json.log.1").exists()
+
+    def test_corrupt_log_raises_ioerror(self, tmp_path):
+        storage = tmp_path / "tasks.json"
+        (tmp_path / "tasks.json.log").write_text("not json\n")
+        manager = self.make_manager(storage)
+        with pytest.raises(IOError):
+            manager.load_from_file()
+
+    def test_text_and_creation_edits_are_replayed(self, tmp_path):
+        storage = tmp_path / "tasks.json"
+        manager = self.make_manager(storage)
+        task_id = manager.add_task("Draft", "Old")
+        task = manager.get_task(task_id)
+        task.title = "Final"
+        task.description = "New"
+        task.created_at = datetime(2024, 1, 2, 3, 4)
+        manager.close()
+
+        reloaded = self.make_manager(storage)
+        reloaded.load_from_file()
+        task = reloaded.get_task(task_id)
+        assert (task.title, task.description, task.created_at) == ("Final", "New", datetime(2024, 1, 2, 3, 4))
+
+    def test_repeated_completion_is_replayed(self, tmp_path):
+        storage = tmp_path / "tasks.json"
+        manager = self.make_manager(storage)
+        task = manager.get_task(manager.add_task("Task"))
+        task.mark_completed()
+        task.mark_completed()
+        task.completed_at = datetime(2024, 5, 6, 7, 8)
+        manager.close()
+
+        reloaded = self.make_manager(storage)
+        reloaded.load_from_file()
+        assert reloaded.get_task(task.id).completed_at == datetime(2024, 5, 6, 7, 8)
+
+    def test_loading_other_file_resets_journal(self, tmp_path):
+        other = TaskManager(str(tmp_path / "other.json"))
+        other.add_task("X")
+        other.save_to_file()
+
+        storage = tmp_path / "tasks.json"
+        manager = self.make_manager(storage)
+        manager.add_task("A")
+        manager.add_task("B")
+        manager.load_from_file(str(tmp_path / "other.json"))
+        manager.save_to_file()
+        manager.close()
+
+        reloaded = self.make_manager(storage)
+        reloaded.load_from_file()
+        assert [task.title for task in reloaded.tasks] == ["X"]
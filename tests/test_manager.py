@@ -113,4 +113,106 @@ class TestTaskManagerPersistence:
     @patch('builtins.open', side_effect=IOError("Permission denied"))
     def test_save_to_file_error(self, mock_file):
         with pytest.raises(IOError):
-            self.manager.save_to_file()
\ No newline at end of file
+            self.manager.save_to_file()
+
+class TestTaskManagerIndexes:
+    def setup_method(self):
+        self.manager = TaskManager("test_tasks.json")
+        self.task_id = self.manager.add_task("Task 1", "Desc 1", Priority.LOW)
+
+    def test_filters_follow_task_mutations(self):
+        task = self.manager.get_task(self.task_id)
+        task.update_priority(Priority.URGENT)
+        task.assign_to_project("project_123")
+        task.mark_completed()
+
+        assert self.manager.get_tasks_by_priority(Priority.LOW) == []
+        assert self.manager.get_tasks_by_priority(Priority.URGENT) == [task]
+        assert self.manager.get_tasks_by_status(Status.DONE) == [task]
+        assert self.manager.get_tasks_by_project("project_123") == [task]
+
+    def test_assign_tasks_list_rebuilds_store(self):
+        task = Task("Replacement")
+        self.manager.tasks = [task]
+        assert self.manager.get_task(self.task_id) is None
+        assert self.manager.get_task(task.id) is task
+        assert len(self.manager.tasks) == 1
+
+    def test_statistics_match_full_scan(self):
+        self.manager.add_task("Task 2", priority=Priority.HIGH)
+        done_id = self.manager.add_task("Task 3", priority=Priority.URGENT)
+        self.manager.get_task(done_id).mark_completed()
+        self.manager.get_task(self.task_id).update_priority(Priority.HIGH)
+        self.manager.delete_task(self.manager.add_task("Task 4"))
+
+        tasks = list(self.manager.tasks)
+        expected = {
+            "total_tasks": len(tasks),
+            "completed_tasks": len([t for t in tasks if t.status == Status.DONE]),
+            "tasks_by_priority": {p.value: len([t for t in tasks if t.priority == p]) for p in Priority},
+            "tasks_by_status": {s.value: len([t for t in tasks if t.status == s]) for s in Status}
+        }
+        assert self.manager.get_statistics() == expected
+
+class TestTaskManagerBulkOperations:
+    def setup_method(self):
+        self.manager = TaskManager("test_tasks.json")
+        self.ids = self.manager.add_tasks(
+            ["Task 0", {"title": "Task 1", "priority": Priority.HIGH, "project_id": "p1"}] +
+            [f"Task {i}" for i in range(2, 10)])
+
+    def test_add_tasks(self):
+        assert len(self.ids) == 10 == len(set(self.ids))
+        first = self.manager.get_task(self.ids[0])
+        second = self.manager.get_task(self.ids[1])
+        assert first.priority is Priority.MEDIUM
+        assert second.priority is Priority.HIGH
+        assert self.manager.get_tasks_by_project("p1") == [second]
+        assert first.created_at == second.created_at
+
+    def test_add_tasks_validates_whole_batch_first(self):
+        with pytest.raises(ValueError):
+            self.manager.add_tasks(["Valid", "  "])
+        with pytest.raises(TypeError):
+            self.manager.add_tasks([{"title": "Valid", "priority": "high"}])
+        assert len(self.manager.tasks) == 10
+
+    def test_bulk_mutations(self):
+        assert self.manager.complete_tasks(self.ids[:4] + ["nonexistent_id"]) == 4
+        assert self.manager.complete_tasks(self.ids[:4]) == 0
+        assert self.manager.update_priorities(self.ids[2:6], Priority.URGENT) == 4
+        assert self.manager.assign_to_project(self.ids[5:], "p2") == 5
+
+        stats = self.manager.get_statistics()
+        assert stats["completed_tasks"] == 4
+        assert stats["tasks_by_priority"]["urgent"] == 4
+        assert len(self.manager.get_tasks_by_project("p2")) == 5
+        assert len({task.completed_at for task in self.manager.get_tasks_by_status(Status.DONE)}) == 1
+        with pytest.raises(TypeError):
+            self.manager.update_priorities(self.ids, "high")
+
+    def test_delete_tasks(self):
+        self.manager.query().order_by("created_at").all()
+        assert self.manager.search("task")
+        assert self.manager.delete_tasks(self.ids[::2] + ["nonexistent_id"]) == 5
+        assert len(self.manager.tasks) == 5
+        assert self.manager.get_task(self.ids[0]) is None
+        assert len(self.manager.query().order_by("created_at").all()) == 5
+        assert {task.id for task in self.manager.search("task", limit=None)} == set(self.ids[1::2])
+
+    def test_bulk_operations_write_journal_once(self, tmp_path):
+        path = str(tmp_path / "tasks.json")
+        manager = TaskManager(path, journal=True)
+        with patch.object(manager._journal, "_write", wraps=manager._journal._write) as write:
+            ids = manager.add_tasks([f"Task {i}" for i in range(5)])
+            manager.complete_tasks(ids[:3])
+            manager.update_priorities(ids, Priority.LOW)
+            manager.delete_tasks(ids[3:])
+            assert write.call_count == 4
+        manager.close()
+
+        reloaded = TaskManager(path, journal=True)
+        reloaded.load_from_file()
+        assert len(reloaded.tasks) == 3
+        assert all(task.status is Status.DONE and task.priority is Priority.LOW for task in reloaded.tasks)
+        reloaded.close()
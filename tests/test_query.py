@@ -0,0 +1,146 @@
+import pytest
+from datetime import datetime, timedelta
+from src.task_manager.columnar import TaskTable
+from src.task_manager.manager import TaskManager
+from src.task_manager.task import Task, Priority, Status
+
+BASE = datetime(2023, 1, 1, 9, 0)
+
+class TestQueryFilters:
+    def setup_method(self):
+        self.manager = TaskManager("test_tasks.json")
+        self.tasks = []
+        specs = [
+            ("Finir le rapport", Priority.URGENT, "project-x"),
+            ("Réunion équipe", Priority.MEDIUM, "project-x"),
+            ("Acheter du café", Priority.LOW, None),
+            ("Rapport annuel", Priority.URGENT, "project-x"),
+            ("Préparer présentation", Priority.URGENT, "project-y"),
+        ]
+        for day, (title, priority, project_id) in enumerate(specs):
+            task = self.manager.get_task(self.manager.add_task(title, "", priority))
+            task.created_at = BASE + timedelta(days=day)
+            task.assign_to_project(project_id)
+            self.tasks.append(task)
+        self.tasks[3].mark_completed()
+
+    def test_combined_filters(self):
+        result = (self.manager.query()
+                  .priority(Priority.URGENT)
+                  .exclude_status(Status.DONE)
+                  .project("project-x")
+                  .all())
+        assert result == [self.tasks[0]]
+
+    def test_created_range_and_title(self):
+        result = (self.manager.query()
+                  .created_between(BASE + timedelta(days=1), BASE + timedelta(days=4))
+                  .title_contains("RAPPORT")
+                  .all())
+        assert result == [self.tasks[3]]
+
+    def test_title_and_description_on_full_scan(self):
+        self.tasks[1].description = "Ordre du jour : le RAPPORT"
+        assert self.manager.query().title_contains("rapport").all() == [self.tasks[0], self.tasks[3]]
+        assert self.manager.query().description_contains("rapport").all() == [self.tasks[1]]
+        assert self.manager.query().title_contains("réunion").description_contains("jour").all() == [self.tasks[1]]
+        assert self.manager.query().title_contains("café").description_contains("jour").all() == []
+
+    def test_completed_range(self):
+        now = datetime.now()
+        result = self.manager.query().completed_between(now - timedelta(hours=1), now + timedelta(hours=1)).all()
+        assert result == [self.tasks[3]]
+
+    def test_ids_and_custom_predicate(self):
+        result = (self.manager.query()
+                  .ids(self.tasks[0].id, self.tasks[2].id, "nonexistent_id")
+                  .filter(lambda task: task.project_id is None)
+                  .all())
+        assert result == [self.tasks[2]]
+
+    def test_invalid_enum_raises_error(self):
+        with pytest.raises(TypeError):
+            self.manager.query().status("done")
+
+    def test_count_and_first(self):
+        query = self.manager.query().priority(Priority.URGENT).order_by("created_at")
+        assert query.count() == 3
+        assert query.first() is self.tasks[0]
+        assert query.count() == 3
+
+class TestQueryOrdering:
+    def setup_method(self):
+        self.manager = TaskManager("test_tasks.json")
+        self.tasks = []
+        for i in range(10):
+            task = self.manager.get_task(self.manager.add_task(f"Task {i}", "", list(Priority)[i % 4]))
+            # Dates de création dans le désordre
+            task.created_at = BASE + timedelta(hours=(i * 7) % 10)
+            self.tasks.append(task)
+        self.by_created = sorted(self.tasks, key=lambda t: t.created_at)
+
+    def test_order_offset_limit(self):
+        result = self.manager.query().order_by("created_at").offset(2).limit(3).all()
+        assert result == self.by_created[2:5]
+
+    def test_descending_order(self):
+        result = self.manager.query().order_by("created_at", descending=True).limit(4).all()
+        assert result == self.by_created[::-1][:4]
+
+    def test_sort_on_priority_uses_rank(self):
+        result = self.manager.query().order_by("priority", descending=True).all()
+        assert [t.priority for t in result[:3]] == [Priority.URGENT] * 2 + [Priority.HIGH]
+
+    def test_cursor_pagination(self):
+        seen = []
+        cursor = None
+        while True:
+            page, cursor = self.manager.query().page(3, cursor)
+            seen.extend(page)
+            if cursor is None:
+                break
+        assert seen == self.by_created
+
+    def test_cursor_pagination_with_sort(self):
+        query = self.manager.query().order_by("title", descending=True)
+        first, cursor = query.page(4)
+        second, _ = self.manager.query().order_by("title", descending=True).page(4, cursor)
+        expected = sorted(self.tasks, key=lambda t: t.title, reverse=True)
+        assert first + second == expected[:8]
+
+    def test_cursor_requires_order(self):
+        with pytest.raises(ValueError):
+            self.manager.query().after((0, BASE, "x")).all()
+
+    def test_created_index_follows_mutations(self):
+        moved = self.by_created[0]
+        moved.created_at = BASE + timedelta(days=30)
+        self.manager.delete_task(self.by_created[1].id)
+        result = self.manager.query().order_by("created_at").all()
+        assert result == self.by_created[2:] + [moved]
+
+    def test_lazy_iteration(self):
+        iterator = iter(self.manager.query().order_by("created_at"))
+        assert next(iterator) is self.by_created[0]
+
+class TestQueryPlanner:
+    def setup_method(self):
+        self.manager = TaskManager("test_tasks.json")
+        for i in range(100):
+            self.manager.add_task(f"Task {i}", "", Priority.URGENT if i < 5 else Priority.LOW)
+
+    def test_picks_most_selective_index(self):
+        assert self.manager.query().priority(Priority.URGENT).explain().startswith("priority index (~5")
+        assert self.manager.query().status(Status.DONE).priority(Priority.LOW).explain().startswith("status index (~0")
+        assert self.manager.query().title_contains("Task").explain().startswith("scan")
+
+    def test_ordered_scan_with_limit(self):
+        plan = self.manager.query().priority(Priority.LOW).order_by("created_at").limit(5).explain()
+        assert "created_at index" in plan and "pre-sorted" in plan
+
+    def test_query_over_store_without_created_index(self):
+        manager = TaskManager("test_tasks.json", store=TaskTable())
+        first = manager.add_task("B")
+        manager.add_task("A")
+        assert [t.title for t in manager.query().order_by("title")] == ["A", "B"]
+        assert manager.query().order_by("created_at").first().id == first
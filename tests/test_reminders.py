@@ -0,0 +1,137 @@
+import time
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from src.task_manager.manager import TaskManager
+from src.task_manager.reminders import ReminderScheduler
+from src.task_manager.services import EmailService
+from src.task_manager.task import Task, Priority, Status
+
+
+class TestDueAt:
+    def test_due_at_round_trip(self):
+        due = datetime(2024, 3, 1, 17, 0)
+        task = Task("Report", due_at=due)
+        data = task.to_dict()
+        assert data["due_at"] == "2024-03-01T17:00:00"
+        assert Task.from_dict(data).due_at == due
+
+    def test_missing_due_at_loads_as_none(self):
+        data = Task("Report").to_dict()
+        del data["due_at"]
+        assert Task.from_dict(data).due_at is None
+
+    def test_add_task_with_due_date_is_persisted(self, tmp_path):
+        due = datetime(2024, 3, 1, 17, 0)
+        manager = TaskManager(str(tmp_path / "tasks.json"))
+        task_id = manager.add_task("Report", due_at=due)
+        manager.save_to_file()
+
+        reloaded = TaskManager(str(tmp_path / "tasks.json"))
+        reloaded.load_from_file()
+        assert reloaded.get_task(task_id).due_at == due
+        assert reloaded.query().due_between(due, due + timedelta(minutes=1)).count() == 1
+
+
+class TestReminderScheduler:
+    def setup_method(self):
+        self.now = datetime(2024, 1, 1, 9, 0)
+        self.email_service = EmailService()
+        self.email_service.send_task_reminder = Mock(return_value=True)
+        self.scheduler = ReminderScheduler(self.email_service, clock=lambda: self.now)
+
+    def test_sends_only_due_reminders_in_order(self):
+        later = Task("Later", due_at=self.now + timedelta(hours=2))
+        sooner = Task("Sooner", due_at=self.now + timedelta(hours=1))
+        self.scheduler.schedule(later, "a@example.com")
+        self.scheduler.schedule(sooner, "b@example.com")
+        assert self.scheduler.next_due() == sooner.due_at
+
+        assert self.scheduler.run_pending() == 0
+        assert self.scheduler.run_pending(self.now + timedelta(hours=3)) == 2
+        calls = self.email_service.send_task_reminder.call_args_list
+        assert [call.args[1] for call in calls] == ["Sooner", "Later"]
+        assert len(self.scheduler) == 0
+
+    def test_mark_completed_cancels_reminder(self):
+        task = Task("Task", due_at=self.now)
+        self.scheduler.schedule(task, "a@example.com")
+        task.mark_completed()
+
+        assert task.id not in self.scheduler
+        assert self.scheduler.run_pending() == 0
+        assert self.scheduler.next_due() is None
+
+    def test_changing_due_date_reschedules(self):
+        task = Task("Task", due_at=self.now + timedelta(hours=1))
+        self.scheduler.schedule(task, "a@example.com")
+        task.due_at = self.now + timedelta(days=1)
+
+        assert self.scheduler.run_pending(self.now + timedelta(hours=2)) == 0
+        assert self.scheduler.next_due() == self.now + timedelta(days=1)
+
+    def test_reprioritization_moves_reminder_earlier(self):
+        scheduler = ReminderScheduler(self.email_service, lead_times={Priority.URGENT: timedelta(hours=4)},
+                                      clock=lambda: self.now)
+        task = Task("Task", priority=Priority.LOW, due_at=self.now + timedelta(hours=3))
+        scheduler.schedule(task, "a@example.com")
+        assert scheduler.run_pending() == 0
+
+        task.update_priority(Priority.URGENT)
+        assert scheduler.next_due() == self.now - timedelta(hours=1)
+        assert scheduler.run_pending() == 1
+
+    def test_higher_priority_first_at_same_time(self):
+        low = Task("Low", priority=Priority.LOW, due_at=self.now)
+        high = Task("High", priority=Priority.HIGH, due_at=self.now)
+        self.scheduler.schedule_many([(low, "a@example.com"), (high, "b@example.com")])
+        self.scheduler.run_pending()
+        calls = self.email_service.send_task_reminder.call_args_list
+        assert [call.args[1] for call in calls] == ["High", "Low"]
+
+    def test_schedule_validates_input(self):
+        with pytest.raises(ValueError):
+            self.scheduler.schedule(Task("No due date"), "a@example.com")
+        with pytest.raises(ValueError):
+            self.scheduler.schedule(Task("Task", due_at=self.now), "invalid-email")
+        done = Task("Done", due_at=self.now)
+        done.mark_completed()
+        assert self.scheduler.schedule(done, "a@example.com") is False
+
+    def test_deleted_tasks_are_not_reminded(self):
+        manager = TaskManager()
+        scheduler = ReminderScheduler(self.email_service, manager=manager, clock=lambda: self.now)
+        task_id = manager.add_task("Task", due_at=self.now)
+        scheduler.schedule(manager.get_task(task_id), "a@example.com")
+        manager.delete_task(task_id)
+        assert scheduler.run_pending() == 0
+
+    def test_send_errors_are_recorded(self):
+        self.email_service.send_task_reminder.side_effect = OSError("SMTP down")
+        task = Task("Task", due_at=self.now)
+        self.scheduler.schedule(task, "a@example.com")
+        assert self.scheduler.run_pending() == 0
+        assert self.scheduler.errors[0][0] == task.id
+
+    def test_stale_entries_are_compacted(self):
+        task = Task("Task", due_at=self.now)
+        self.scheduler.schedule(task, "a@example.com")
+        for minutes in range(5000):
+            task.due_at = self.now + timedelta(minutes=minutes)
+        assert len(self.scheduler._heap) < 2500
+        assert self.scheduler.next_due() == self.now + timedelta(minutes=4999)
+
+    def test_background_thread_wakes_for_next_reminder(self):
+        scheduler = ReminderScheduler(self.email_service)
+        scheduler.start()
+        try:
+            scheduler.schedule(Task("Soon", due_at=datetime.now() + timedelta(milliseconds=50)), "a@example.com")
+            deadline = time.monotonic() + 2
+            while not self.email_service.send_task_reminder.called and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            scheduler.stop()
+        self.email_service.send_task_reminder.assert_called_once()
+        assert len(scheduler) == 0
@@ -0,0 +1,85 @@
+import pytest
+from src.task_manager.manager import TaskManager
+from src.task_manager.search import SearchIndex, normalize, tokenize
+from src.task_manager.task import Task, Priority
+
+class TestTokenizer:
+    def test_normalize_removes_accents_and_case(self):
+        assert normalize("Réunion ÉQUIPE") == "reunion equipe"
+
+    def test_tokenize(self):
+        assert tokenize("Acheter du café, vite !") == ["acheter", "du", "cafe", "vite"]
+        assert tokenize("") == []
+
+class TestSearchIndex:
+    def setup_method(self):
+        self.tasks = [
+            Task("Réunion équipe", "Réunion hebdomadaire"),
+            Task("Acheter du café", "Pour la machine du bureau"),
+            Task("Préparer présentation", "Présentation client pour la réunion"),
+        ]
+        self.index = SearchIndex(self.tasks)
+
+    def test_accent_insensitive_match(self):
+        assert self.index.search("reunion") == [self.tasks[0].id, self.tasks[2].id]
+        assert self.index.search("CAFÉ") == [self.tasks[1].id]
+
+    def test_title_matches_rank_first(self):
+        scored = self.index.search_scored("reunion", prefix=False)
+        assert [task_id for task_id, _ in scored] == [self.tasks[0].id, self.tasks[2].id]
+        assert scored[0][1] > scored[1][1] > 0
+
+    def test_prefix_queries(self):
+        assert self.index.search("pres") == [self.tasks[2].id]
+        assert self.index.search("pres", prefix=False) == []
+        assert self.index.search("ach* cafe", prefix=False) == [self.tasks[1].id]
+
+    def test_all_terms_must_match(self):
+        assert self.index.search("reunion client") == [self.tasks[2].id]
+        assert self.index.search("reunion inconnu") == []
+
+    def test_remove_and_update(self):
+        self.index.remove(self.tasks[0].id)
+        assert self.index.search("hebdomadaire") == []
+        self.tasks[1].title = "Commander des croissants"
+        self.index.update(self.tasks[1])
+        assert self.index.search("croissant") == [self.tasks[1].id]
+        assert self.index.search("cafe") == []
+        assert len(self.index) == 2
+
+    def test_limit(self):
+        assert len(self.index.search("la", limit=1)) == 1
+
+    def test_empty_query(self):
+        assert self.index.search("  ") == []
+
+class TestManagerSearch:
+    def setup_method(self):
+        self.manager = TaskManager("test_tasks.json")
+        self.meeting_id = self.manager.add_task("Réunion équipe", "Réunion hebdomadaire")
+        self.coffee_id = self.manager.add_task("Acheter du café", "", Priority.LOW)
+
+    def test_search_returns_tasks(self):
+        assert [t.id for t in self.manager.search("equipe")] == [self.meeting_id]
+
+    def test_index_follows_manager_changes(self):
+        self.manager.search("cafe")
+        new_id = self.manager.add_task("Café du matin")
+        assert {t.id for t in self.manager.search("cafe")} == {self.coffee_id, new_id}
+
+        self.manager.delete_task(self.coffee_id)
+        assert [t.id for t in self.manager.search("cafe")] == [new_id]
+
+        self.manager.get_task(new_id).description = "Réunion rapide"
+        assert {t.id for t in self.manager.search("reunion")} == {self.meeting_id, new_id}
+
+    def test_index_follows_load(self, tmp_path):
+        self.manager.search("cafe")
+        storage = str(tmp_path / "tasks.json")
+        other = TaskManager(storage)
+        other.add_task("Finir le rapport")
+        other.save_to_file()
+
+        self.manager.load_from_file(storage)
+        assert self.manager.search("cafe") == []
+        assert [t.title for t in self.manager.search("rapp")] == ["Finir le rapport"]
@@ -0,0 +1,118 @@
+import pytest
+
+from src.task_manager.manager import TaskManager
+from src.task_manager.sharding import HashRing, ShardedTaskManager
+from src.task_manager.task import Priority, Status
+
+
+class TestHashRing:
+    def test_keys_are_spread_over_nodes(self):
+        ring = HashRing(["a", "b", "c", "d"])
+        owners = [ring.node_for(f"task-{i}") for i in range(4000)]
+        assert {owner: owners.count(owner) for owner in "abcd"}.keys() == set("abcd")
+        assert min(owners.count(owner) for owner in "abcd") > 500
+
+    def test_adding_a_node_only_moves_its_keys(self):
+        ring = HashRing(["a", "b", "c"])
+        keys = [f"task-{i}" for i in range(3000)]
+        before = {key: ring.node_for(key) for key in keys}
+        ring.add("d")
+        moved = [key for key in keys if ring.node_for(key) != before[key]]
+        assert all(ring.node_for(key) == "d" for key in moved)
+        assert 400 < len(moved) < 1200
+
+        ring.remove("d")
+        assert all(ring.node_for(key) == before[key] for key in keys)
+
+    def test_invalid_nodes(self):
+        ring = HashRing(["a"])
+        with pytest.raises(ValueError):
+            ring.add("a")
+        with pytest.raises(ValueError):
+            ring.remove("b")
+        with pytest.raises(ValueError):
+            HashRing().node_for("task")
+
+
+class TestShardedTaskManager:
+    @pytest.fixture(autouse=True)
+    def manager(self, tmp_path):
+        self.manager = ShardedTaskManager(str(tmp_path / "tasks.json"), shards=3)
+        yield self.manager
+        self.manager.close()
+
+    def test_routes_tasks_by_id(self):
+        task_id = self.manager.add_task("Report", priority=Priority.HIGH)
+        assert self.manager.get_task(task_id).title == "Report"
+        assert self.manager.shard_for(task_id) in self.manager.shard_names
+        assert self.manager.delete_task(task_id) is True
+        assert self.manager.get_task(task_id) is None
+        assert len(self.manager) == 0
+
+    def test_bulk_operations_and_scatter_gather(self):
+        ids = self.manager.add_tasks([f"Task {i}" for i in range(60)])
+        assert len(self.manager) == 60
+        assert [task.id for task in self.manager.get_tasks(ids[:5])] == ids[:5]
+
+        assert self.manager.complete_tasks(ids[:10]) == 10
+        assert self.manager.update_priorities(ids[10:20], Priority.URGENT) == 10
+        assert self.manager.assign_to_project(ids[:15], "alpha") == 15
+        assert self.manager.delete_tasks(ids[50:]) == 10
+
+        assert len(self.manager.get_tasks_by_status(Status.DONE)) == 10
+        assert len(self.manager.get_tasks_by_priority(Priority.URGENT)) == 10
+        assert len(self.manager.get_tasks_by_project("alpha")) == 15
+
+        reference = TaskManager()
+        reference.tasks = self.manager.tasks
+        assert self.manager.get_statistics() == reference.get_statistics()
+
+    def test_search_merges_shard_results(self):
+        self.manager.add_tasks(["Write report", "Review report", "Call client", "Report bug"])
+        titles = {task.title for task in self.manager.search("report")}
+        assert titles == {"Write report", "Review report", "Report bug"}
+        assert len(self.manager.search("report", limit=2)) == 2
+
+    def test_worker_errors_are_raised(self):
+        with pytest.raises(ValueError):
+            self.manager.save_to_file(format="xml")
+        # Les canaux restent utilisables après une erreur
+        assert self.manager.get_statistics()["total_tasks"] == 0
+
+    def test_add_and_remove_shard_keep_all_tasks(self):
+        ids = self.manager.add_tasks([f"Task {i}" for i in range(300)])
+        moved = self.manager.add_shard()
+        assert self.manager.shard_names == ["shard-0", "shard-1", "shard-2", "shard-3"]
+        assert 0 < moved < 200
+        assert len(self.manager) == 300
+        assert all(self.manager.get_task(task_id) is not None for task_id in ids)
+
+        self.manager.remove_shard("shard-0")
+        assert len(self.manager) == 300
+        assert len(self.manager.get_tasks(ids)) == 300
+        assert self.manager.rebalance() == 0
+
+
+class TestShardedPersistence:
+    def test_shards_save_and_load_their_own_files(self, tmp_path):
+        path = str(tmp_path / "tasks.json")
+        with ShardedTaskManager(path, shards=2) as manager:
+            ids = manager.add_tasks([f"Task {i}" for i in range(20)])
+            manager.save_to_file()
+            assert (tmp_path / "tasks.shard-0.json").exists()
+            assert (tmp_path / "tasks.shard-1.json").exists()
+
+        with ShardedTaskManager(path, shards=2) as manager:
+            manager.load_from_file()
+            assert len(manager.get_tasks(ids)) == 20
+
+    def test_journal_mode_persists_without_save(self, tmp_path):
+        path = str(tmp_path / "tasks.json")
+        with ShardedTaskManager(path, shards=2, journal=True) as manager:
+            ids = manager.add_tasks(["First", "Second", "Third"])
+            manager.complete_tasks(ids[:1])
+
+        with ShardedTaskManager(path, shards=2, journal=True) as manager:
+            manager.load_from_file()
+            assert manager.get_task(ids[0]).status is Status.DONE
+            assert len(manager) == 3
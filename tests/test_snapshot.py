@@ -0,0 +1,183 @@
+import json
+import struct
+from datetime import datetime
+
+import pytest
+from src.task_manager.manager import TaskManager
+from src.task_manager.snapshot import BinarySnapshot, MappedTaskStore, write_snapshot
+from src.task_manager.task import Task, Priority, Status
+
+def make_tasks():
+    tasks = [
+        Task("Finir le rapport", "Rapport mensuel à rendre", Priority.HIGH),
+        Task("Réunion équipe", "Réunion hebdomadaire", Priority.MEDIUM),
+        Task("Acheter du café", "", Priority.LOW),
+        Task.from_dict({
+            "id": "sample-task-1",
+            "title": "Exemple de tâche",
+            "priority": "high",
+            "status": "todo",
+            "created_at": "2023-01-01T10:00:00",
+            "project_id": "project-1"
+        })
+    ]
+    tasks[0].mark_completed()
+    tasks[2].assign_to_project("")
+    tasks[1].due_at = datetime(2023, 1, 5, 14, 0)
+    return tasks
+
+class TestBinarySnapshot:
+    def setup_method(self):
+        self.tasks = make_tasks()
+
+    def test_round_trip(self, tmp_path):
+        path = str(tmp_path / "tasks.bin")
+        write_snapshot(path, self.tasks)
+        snapshot = BinarySnapshot(path)
+        try:
+            assert snapshot.count == 4
+            for task in self.tasks:
+                row = snapshot.find(task.id)
+                assert snapshot.task_at(row).to_dict() == task.to_dict()
+            assert snapshot.find("nonexistent_id") == -1
+            assert snapshot.count_by_status(Status.DONE) == 1
+            assert snapshot.count_by_priority(Priority.HIGH) == 2
+            assert snapshot.rows_with_priority(Priority.HIGH) == [0, 3]
+        finally:
+            snapshot.close()
+
+    def test_reads_version_1_without_due_dates(self, tmp_path):
+        path = tmp_path / "tasks.bin"
+        write_snapshot(str(path), self.tasks)
+        data = bytearray(path.read_bytes())
+        # En-tête v1 : mêmes sections, sans l'offset de la colonne due_at
+        magic, _, _, _, count, *offsets = struct.unpack_from("<8sHHI10Q", data)
+        del offsets[7]
+        struct.pack_into("<8sHHI9Q", data, 0, magic, 1, 0, 0, count, *offsets)
+        path.write_bytes(bytes(data))
+
+        snapshot = BinarySnapshot(str(path))
+        try:
+            task = snapshot.task_at(snapshot.find(self.tasks[1].id))
+            assert task.title == "Réunion équipe"
+            assert task.due_at is None
+        finally:
+            snapshot.close()
+
+    def test_empty_snapshot(self, tmp_path):
+        path = str(tmp_path / "tasks.bin")
+        write_snapshot(path, [])
+        snapshot = BinarySnapshot(path)
+        assert snapshot.count == 0
+        assert snapshot.find("nonexistent_id") == -1
+        snapshot.close()
+
+    def test_invalid_file_raises_error(self, tmp_path):
+        path = tmp_path / "tasks.bin"
+        path.write_bytes(b"[]" * 64)
+        with pytest.raises(ValueError):
+            BinarySnapshot(str(path))
+
+class TestMappedTaskStore:
+    def setup_method(self):
+        self.tasks = make_tasks()
+
+    def test_lazy_materialization_and_counts(self, tmp_path):
+        path = str(tmp_path / "tasks.bin")
+        write_snapshot(path, self.tasks)
+        store = MappedTaskStore(path)
+        try:
+            assert len(store) == 4
+            assert len(store._overlay) == 0
+            assert store.count_by_status(Status.TODO) == 3
+
+            task = store.get(self.tasks[1].id)
+            assert store.get(self.tasks[1].id) is task
+            task.mark_completed()
+            assert store.count_by_status(Status.DONE) == 2
+            assert store.count_by_status(Status.TODO) == 2
+            assert len(store) == 4
+
+            assert store.remove(self.tasks[2].id).id == self.tasks[2].id
+            assert store.count_by_priority(Priority.LOW) == 0
+            assert len(store) == 3
+
+            new_task = Task("Nouvelle tâche", priority=Priority.URGENT)
+            store.add(new_task)
+            assert store.count_by_priority(Priority.URGENT) == 1
+            assert [t.id for t in store.by_status(Status.DONE)] == [self.tasks[1].id, self.tasks[0].id]
+            assert {t.id for t in store} == {self.tasks[0].id, self.tasks[1].id, self.tasks[3].id, new_task.id}
+        finally:
+            store.close()
+
+    def test_add_replaces_snapshot_task(self, tmp_path):
+        path = str(tmp_path / "tasks.bin")
+        write_snapshot(path, self.tasks)
+        store = MappedTaskStore(path)
+        replacement = Task.from_dict(self.tasks[0].to_dict())
+        replacement.update_priority(Priority.LOW)
+        store.add(replacement)
+        assert len(store) == 4
+        assert store.count_by_priority(Priority.HIGH) == 1
+        assert store.count_by_priority(Priority.LOW) == 2
+        store.close()
+
+class TestBinaryManager:
+    def test_save_and_load_binary(self, tmp_path):
+        path = str(tmp_path / "tasks.bin")
+        manager = TaskManager(path)
+        manager.tasks = make_tasks()
+        manager.save_to_file(format="binary")
+
+        reloaded = TaskManager(path)
+        reloaded.load_from_file(format="binary")
+        try:
+            assert reloaded.get_statistics() == manager.get_statistics()
+            assert reloaded.get_task("sample-task-1").project_id == "project-1"
+            assert [t.to_dict() for t in reloaded.tasks] == [t.to_dict() for t in manager.tasks]
+        finally:
+            reloaded.close()
+
+    def test_non_string_project_id_is_stored_as_text(self, tmp_path):
+        path = str(tmp_path / "tasks.bin")
+        manager = TaskManager(path)
+        task_id = manager.add_task("Numbered project")
+        manager.get_task(task_id).assign_to_project(42)
+        manager.save_to_file(format="binary")
+
+        reloaded = TaskManager(path)
+        reloaded.load_from_file(format="binary")
+        try:
+            assert reloaded.get_task(task_id).project_id == "42"
+        finally:
+            reloaded.close()
+
+    def test_default_format_follows_target_file(self, tmp_path):
+        path = str(tmp_path / "tasks.bin")
+        tasks = make_tasks()
+        write_snapshot(path, tasks)
+        manager = TaskManager(path)
+        manager.load_from_file(format="binary")
+        try:
+            manager.save_to_file(str(tmp_path / "export.json"))
+            manager.save_to_file()
+        finally:
+            manager.close()
+        with open(str(tmp_path / "export.json")) as f:
+            assert [data["id"] for data in json.load(f)] == [task.id for task in tasks]
+        with open(path, "rb") as f:
+            assert f.read(8) == b"TASKSNAP"
+
+    def test_unknown_format_raises_error(self):
+        manager = TaskManager("test_tasks.json")
+        with pytest.raises(ValueError):
+            manager.save_to_file(format="xml")
+
+    def test_journal_listener_follows_store(self, tmp_path):
+        path = str(tmp_path / "tasks.bin")
+        write_snapshot(path, make_tasks())
+        manager = TaskManager(str(tmp_path / "tasks.json"), journal=True)
+        manager.load_from_file(path, format="binary")
+        manager.get_task("sample-task-1").mark_completed()
+        manager.close()
+        assert '"op":"complete"' in (tmp_path / "tasks.json.log").read_text()
@@ -0,0 +1,259 @@
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.task_manager.manager import TaskManager
+from src.task_manager.sqlite_store import SQLiteTaskStore, migrate_from_json
+from src.task_manager.store import TaskStore
+from src.task_manager.task import Task, Priority, Status
+
+
+def make_tasks(count=30):
+    start = datetime(2024, 1, 1)
+    tasks = []
+    for i in range(count):
+        task = Task(f"Task {i}", f"Description {i}", list(Priority)[i % 4], due_at=start + timedelta(days=i))
+        task.created_at = start + timedelta(hours=i)
+        task.assign_to_project(None if i % 3 == 0 else f"project-{i % 3}")
+        if i % 5 == 0:
+            task.mark_completed()
+        tasks.append(task)
+    return tasks
+
+
+def make_tasks_copy(tasks):
+    return [Task.from_trusted_dict(task.to_dict()) for task in tasks]
+
+
+def read_row(path, task_id):
+    connection = sqlite3.connect(path)
+    try:
+        return connection.execute("SELECT status, completed_at, priority, project_id FROM tasks WHERE id = ?",
+                                  (task_id,)).fetchone()
+    finally:
+        connection.close()
+
+
+class TestSQLiteTaskStore:
+    def setup_method(self):
+        self.tasks = make_tasks()
+        self.reference = TaskStore(make_tasks_copy(self.tasks))
+
+    @pytest.fixture(autouse=True)
+    def store(self, tmp_path):
+        self.path = str(tmp_path / "tasks.db")
+        self.store = SQLiteTaskStore(self.path, cache_size=8)
+        for task in self.tasks:
+            self.store.add(task)
+        yield self.store
+        self.store.close()
+
+    def test_filters_and_counts_match_task_store(self):
+        for status in Status:
+            assert [t.id for t in self.store.by_status(status)] == [t.id for t in self.reference.by_status(status)]
+            assert self.store.count_by_status(status) == self.reference.count_by_status(status)
+        for priority in Priority:
+            assert self.store.count_by_priority(priority) == self.reference.count_by_priority(priority)
+        for project_id in (None, "project-1", "project-2", "missing"):
+            assert len(self.store.by_project(project_id)) == self.reference.count_by_project(project_id)
+        assert len(self.store) == 30
+        assert [task.id for task in self.store] == [task.id for task in self.tasks]
+        assert self.store[-1].id == self.tasks[-1].id
+
+    def test_created_range_uses_same_order_as_task_store(self):
+        start, end = datetime(2024, 1, 1, 5), datetime(2024, 1, 1, 20)
+        expected = [task.id for task in self.reference.created_range(start, end)]
+        assert [task.id for task in self.store.created_range(start, end)] == expected
+        assert self.store.count_created_range(start, end) == len(expected)
+        after = (self.tasks[10].created_at, self.tasks[10].id)
+        assert [t.id for t in self.store.created_range(start, end, after=after, reverse=True)] == expected[:5][::-1]
+
+    def test_mutations_are_written_through(self):
+        task = self.store.get(self.tasks[1].id)
+        task.mark_completed()
+        task.update_priority(Priority.URGENT)
+        task.assign_to_project("alpha")
+        self.store.flush()
+        status, completed_at, priority, project_id = read_row(self.path, task.id)
+        assert (status, priority, project_id) == ("done", "urgent", "alpha")
+        assert completed_at == task.completed_at.isoformat()
+        assert self.store.count_by_status(Status.DONE) == self.reference.count_by_status(Status.DONE) + 1
+
+    def test_repeated_completion_is_written_through(self):
+        task = self.store.get(self.tasks[1].id)
+        task.mark_completed()
+        task.completed_at = task.completed_at + timedelta(seconds=1)
+        task.mark_completed()
+        self.store.flush()
+        assert read_row(self.path, task.id)[1] == task.completed_at.isoformat()
+
+    def test_cache_is_bounded_and_keeps_identity(self):
+        first = self.store.get(self.tasks[0].id)
+        assert self.store.get(self.tasks[0].id) is first
+        self.store.by_status(Status.TODO)
+        assert len(self.store._cache) <= 8
+        # Une copie évincée reste écrite dans la base
+        evicted = self.tasks[0]
+        assert evicted.id not in self.store._cache
+        evicted.update_priority(Priority.LOW)
+        self.store.flush()
+        assert read_row(self.path, evicted.id)[2] == "low"
+
+    def test_remove_and_replace(self):
+        removed = self.store.remove(self.tasks[2].id)
+        assert removed.id == self.tasks[2].id
+        assert self.tasks[2].id not in self.store
+        assert self.store.remove("missing") is None
+        assert len(self.store.remove_many([task.id for task in self.tasks[3:6]])) == 3
+        assert len(self.store) == 26
+
+        replacement = Task.from_trusted_dict(dict(self.tasks[7].to_dict(), title="Renamed"))
+        self.store.add(replacement)
+        assert self.store.get(replacement.id).title == "Renamed"
+        assert self.store[-1].id == replacement.id
+        assert len(self.store) == 26
+        self.store.clear()
+        assert len(self.store) == 0
+
+    def test_cached_counts_follow_writes(self):
+        self.store.statistics()
+        self.store.get(self.tasks[1].id).mark_completed()
+        self.store.get(self.tasks[2].id).update_priority(Priority.URGENT)
+        self.store.remove(self.tasks[3].id)
+        self.store.add(Task.from_trusted_dict(dict(self.tasks[4].to_dict(), status="cancelled")))
+        self.store.add(Task("New", priority=Priority.LOW))
+        self.store.flush()
+        fresh = SQLiteTaskStore(self.path)
+        try:
+            assert self.store.statistics() == fresh.statistics()
+            assert fresh.statistics()["total_tasks"] == len(self.store) == 30
+        finally:
+            fresh.close()
+
+    def test_writes_are_committed_immediately(self):
+        reader = SQLiteTaskStore(self.path)
+        try:
+            assert len(reader) == 30
+            task = Task("Later")
+            self.store.add(task)
+            assert task.id in reader
+            task.mark_completed()
+            assert read_row(self.path, task.id)[0] == "done"
+            # Dans batch(), rien n'est visible avant la sortie du bloc
+            with self.store.batch():
+                other = Task("Batched")
+                self.store.add(other)
+                assert other.id not in reader
+            assert other.id in reader
+        finally:
+            reader.close()
+
+    def test_writes_survive_process_crash(self):
+        task_id = self.tasks[1].id
+        script = (
+            "import os, sys\n"
+            "from src.task_manager.sqlite_store import SQLiteTaskStore\n"
+            "store = SQLiteTaskStore(sys.argv[1])\n"
+            "store.get(sys.argv[2]).mark_completed()\n"
+            "os._exit(0)\n"
+        )
+        subprocess.run([sys.executable, "-c", script, self.path, task_id], check=True,
+                       cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        assert read_row(self.path, task_id)[0] == "done"
+
+
+class TestTaskManagerWithSQLite:
+    def test_load_mutate_and_reopen(self, tmp_path):
+        path = str(tmp_path / "tasks.db")
+        manager = TaskManager(path)
+        manager.load_from_file(format="sqlite")
+        ids = manager.add_tasks([f"Task {i}" for i in range(20)])
+        manager.complete_tasks(ids[:5])
+        manager.delete_tasks(ids[15:])
+        assert manager.get_statistics()["completed_tasks"] == 5
+        assert manager.query().status(Status.DONE).count() == 5
+        assert len(manager.search("task")) == 15
+        manager.close()
+
+        reopened = TaskManager(path)
+        reopened.load_from_file(format="sqlite")
+        statistics = reopened.get_statistics()
+        assert statistics["total_tasks"] == 15
+        assert statistics["tasks_by_status"]["done"] == 5
+        reopened.close()
+
+    def test_migration_from_json(self, tmp_path):
+        json_path = str(tmp_path / "tasks.json")
+        db_path = str(tmp_path / "tasks.db")
+        manager = TaskManager(json_path)
+        manager.tasks = make_tasks()
+        manager.save_to_file()
+
+        assert migrate_from_json(json_path, db_path) == 30
+        migrated = TaskManager(db_path)
+        migrated.load_from_file(format="sqlite")
+        with open(json_path) as f:
+            assert [task.to_dict() for task in migrated.tasks] == json.load(f)
+        assert migrated.get_statistics() == manager.get_statistics()
+        migrated.close()
+
+    def test_save_as_sqlite_from_memory(self, tmp_path):
+        path = str(tmp_path / "tasks.db")
+        manager = TaskManager()
+        manager.tasks = make_tasks()
+        manager.save_to_file(path, format="sqlite")
+        loaded = TaskManager(path)
+        loaded.load_from_file(format="sqlite")
+        assert [task.id for task in loaded.tasks] == [task.id for task in manager.tasks]
+        loaded.close()
+
+    def test_invalid_database_raises_ioerror(self, tmp_path):
+        path = tmp_path / "tasks.db"
+        path.write_text("not a database")
+        with pytest.raises(IOError):
+            TaskManager(str(path)).load_from_file(format="sqlite")
+
+    def test_default_save_keeps_sqlite_database(self, tmp_path):
+        path = str(tmp_path / "tasks.db")
+        manager = TaskManager(path)
+        manager.load_from_file(format="sqlite")
+        ids = manager.add_tasks([f"Task {i}" for i in range(3000)])
+        manager.close()
+
+        reopened = TaskManager(path)
+        reopened.load_from_file(format="sqlite")
+        reopened.get_task(ids[0]).mark_completed()
+        reopened.save_to_file()
+        with pytest.raises(IOError):
+            reopened.save_to_file(format="json")
+        reopened.load_from_file()
+        assert reopened.get_statistics()["completed_tasks"] == 1
+        reopened.close()
+
+    def test_default_save_to_other_file_is_json(self, tmp_path):
+        path = str(tmp_path / "tasks.db")
+        manager = TaskManager(path)
+        manager.load_from_file(format="sqlite")
+        manager.add_tasks(["Task 1", "Task 2"])
+        export = str(tmp_path / "export.json")
+        manager.save_to_file(export)
+        with open(export) as f:
+            assert [data["title"] for data in json.load(f)] == ["Task 1", "Task 2"]
+        manager.close()
+
+    def test_database_errors_after_open_raise_ioerror(self, tmp_path):
+        path = str(tmp_path / "tasks.db")
+        manager = TaskManager(path)
+        manager.load_from_file(format="sqlite")
+        manager.add_task("Task")
+        manager.tasks._connection.execute("DROP TABLE tasks")
+        with pytest.raises(IOError):
+            manager.get_statistics()
+        with pytest.raises(IOError):
+            manager.add_task("Other")
+        manager.close()
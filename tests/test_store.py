@@ -0,0 +1,101 @@
+import pytest
+from src.task_manager.store import TaskStore
+from src.task_manager.task import Task, Priority, Status
+
+class TestTaskStoreBasics:
+    def setup_method(self):
+        self.store = TaskStore()
+        self.task1 = Task("Task 1", priority=Priority.HIGH)
+        self.task2 = Task("Task 2", priority=Priority.LOW)
+        self.store.add(self.task1)
+        self.store.add(self.task2)
+
+    def test_get_by_id(self):
+        assert self.store.get(self.task1.id) is self.task1
+        assert self.store.get("nonexistent_id") is None
+
+    def test_len_iter_and_index(self):
+        assert len(self.store) == 2
+        assert list(self.store) == [self.task1, self.task2]
+        assert self.store[0] is self.task1
+        assert self.store[-1] is self.task2
+
+    def test_remove_updates_indexes(self):
+        removed = self.store.remove(self.task1.id)
+        assert removed is self.task1
+        assert self.store.by_priority(Priority.HIGH) == []
+        assert self.store.by_status(Status.TODO) == [self.task2]
+        assert self.store.remove(self.task1.id) is None
+
+    def test_add_duplicate_id_replaces(self):
+        clone = Task.from_dict(self.task1.to_dict())
+        self.store.add(clone)
+        assert len(self.store) == 2
+        assert self.store.get(self.task1.id) is clone
+        assert self.store.by_priority(Priority.HIGH) == [clone]
+
+class TestTaskStoreIndexMaintenance:
+    def setup_method(self):
+        self.store = TaskStore()
+        self.task = Task("Task", priority=Priority.MEDIUM)
+        self.store.add(self.task)
+
+    def test_mark_completed_moves_status_index(self):
+        self.task.mark_completed()
+        assert self.store.by_status(Status.TODO) == []
+        assert self.store.by_status(Status.DONE) == [self.task]
+
+    def test_update_priority_moves_priority_index(self):
+        self.task.update_priority(Priority.URGENT)
+        assert self.store.by_priority(Priority.MEDIUM) == []
+        assert self.store.by_priority(Priority.URGENT) == [self.task]
+
+    def test_assign_to_project_moves_project_index(self):
+        self.task.assign_to_project("project_123")
+        assert self.store.by_project(None) == []
+        assert self.store.by_project("project_123") == [self.task]
+
+    def test_removed_task_no_longer_tracked(self):
+        self.store.remove(self.task.id)
+        self.task.mark_completed()
+        assert self.store.by_status(Status.DONE) == []
+
+    def test_clear_detaches_tasks(self):
+        self.store.clear()
+        self.task.update_priority(Priority.HIGH)
+        assert len(self.store) == 0
+        assert self.store.by_priority(Priority.HIGH) == []
+
+class TestTaskStoreCounters:
+    def test_counts_follow_add_remove_and_mutations(self):
+        store = TaskStore()
+        task1 = Task("Task 1", priority=Priority.HIGH)
+        task2 = Task("Task 2", priority=Priority.HIGH)
+        store.add(task1)
+        store.add(task2)
+        task2.assign_to_project("project_123")
+        task1.mark_completed()
+        task2.update_priority(Priority.LOW)
+
+        assert store.count_by_status(Status.DONE) == 1
+        assert store.count_by_status(Status.TODO) == 1
+        assert store.count_by_priority(Priority.HIGH) == 1
+        assert store.count_by_priority(Priority.LOW) == 1
+        assert store.count_by_project("project_123") == 1
+
+        store.remove(task2.id)
+        assert store.count_by_priority(Priority.LOW) == 0
+        assert store.count_by_project("project_123") == 0
+
+class TestTaskStoreRemoveMany:
+    def test_remove_many(self):
+        tasks = [Task(f"Task {i}", priority=list(Priority)[i % 4]) for i in range(10)]
+        store = TaskStore(tasks)
+        removed = store.remove_many([task.id for task in tasks[::3]] + ["nonexistent_id"])
+        assert [task.id for task in removed] == [task.id for task in tasks[::3]]
+        assert len(store) == 6
+        assert [task.id for task in store] == [task.id for task in tasks if task not in tasks[::3]]
+        assert store.count_by_priority(Priority.LOW) == sum(
+            1 for i, task in enumerate(tasks) if i % 3 and task.priority is Priority.LOW)
+        assert store.remove_many([]) == []
+
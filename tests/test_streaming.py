@@ -0,0 +1,80 @@
+import io
+import json
+import pytest
+from pathlib import Path
+from src.task_manager.manager import TaskManager
+from src.task_manager.streaming import iter_task_dicts, iter_tasks_from_file, write_tasks
+from src.task_manager.task import Task, Priority, Status
+
+SAMPLE_FILE = Path(__file__).parent / "fixtures" / "sample_data.json"
+
+class TestIterTaskDicts:
+    def test_matches_json_load(self):
+        with open(SAMPLE_FILE, encoding="utf-8") as f:
+            expected = json.load(f)
+        with open(SAMPLE_FILE, encoding="utf-8") as f:
+            assert list(iter_task_dicts(f, chunk_size=7)) == expected
+
+    def test_empty_array(self):
+        assert list(iter_task_dicts(io.StringIO("  [ ]  "))) == []
+
+    def test_objects_split_across_chunks(self):
+        data = [{"id": str(i), "title": "é" * i, "nested": {"a": [1, 2]}} for i in range(50)]
+        text = json.dumps(data)
+        assert list(iter_task_dicts(io.StringIO(text), chunk_size=3)) == data
+
+    def test_truncated_document_raises_error(self):
+        with pytest.raises(ValueError):
+            list(iter_task_dicts(io.StringIO('[{"id": "1"}, {"id": '), chunk_size=4))
+
+    def test_not_an_array_raises_error(self):
+        with pytest.raises(ValueError):
+            list(iter_task_dicts(io.StringIO('{"id": "1"}')))
+
+class TestWriteTasks:
+    def setup_method(self):
+        self.tasks = [Task("Réunion équipe", "Ligne 1\nLigne 2", Priority.HIGH), Task("Acheter du café")]
+        self.tasks[1].mark_completed()
+
+    def test_byte_compatible_with_json_dump(self):
+        streamed = io.StringIO()
+        write_tasks(streamed, self.tasks)
+        assert streamed.getvalue() == json.dumps([t.to_dict() for t in self.tasks], indent=2)
+
+    def test_empty_list(self):
+        streamed = io.StringIO()
+        write_tasks(streamed, [])
+        assert streamed.getvalue() == json.dumps([], indent=2)
+
+class TestStreamingManager:
+    def test_streaming_round_trip(self, tmp_path):
+        storage = str(tmp_path / "tasks.json")
+        manager = TaskManager(storage)
+        task_id = manager.add_task("Task 1", priority=Priority.URGENT)
+        manager.get_task(task_id).mark_completed()
+        manager.add_task("Task 2")
+        manager.save_to_file(streaming=True)
+
+        reloaded = TaskManager(storage)
+        reloaded.load_from_file(streaming=True)
+        assert [t.to_dict() for t in reloaded.tasks] == [t.to_dict() for t in manager.tasks]
+        assert reloaded.get_statistics() == manager.get_statistics()
+
+    def test_streaming_load_nonexistent_file(self, tmp_path):
+        manager = TaskManager(str(tmp_path / "missing.json"))
+        manager.load_from_file(streaming=True)
+        assert len(manager.tasks) == 0
+
+    def test_streaming_load_invalid_file_raises_ioerror(self, tmp_path):
+        storage = tmp_path / "tasks.json"
+        storage.write_text("[{")
+        with pytest.raises(IOError):
+            TaskManager(str(storage)).load_from_file(streaming=True)
+
+    def test_iter_tasks_does_not_load_manager(self):
+        manager = TaskManager(str(SAMPLE_FILE))
+        tasks = list(manager.iter_tasks_from_file())
+        assert [t.id for t in tasks] == ["sample-task-1", "sample-task-2"]
+        assert tasks[1].status == Status.DONE
+        assert len(manager.tasks) == 0
+        assert [t.id for t in iter_tasks_from_file(SAMPLE_FILE)] == ["sample-task-1", "sample-task-2"]
@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 from datetime import datetime
 from src.task_manager.task import Task, Priority, Status
@@ -38,6 +40,13 @@ class TestTaskOperations:
         assert self.task.status == Status.DONE
         assert self.task.completed_at is not None
 
+    def test_repeated_completion_notifies_completed_at(self):
+        changes = []
+        self.task._add_observer(lambda task, field, old, new: changes.append(field))
+        self.task.mark_completed()
+        self.task.completed_at = datetime(2024, 1, 2)
+        assert changes == ["status", "completed_at"]
+
     def test_update_priority_valid(self):
         self.task.update_priority(Priority.HIGH)
         assert self.task.priority == Priority.HIGH
@@ -78,4 +87,47 @@ class TestTaskSerialization:
         assert new_task.description == self.task.description
         assert new_task.priority == self.task.priority
         assert new_task.status == self.task.status
-        assert new_task.project_id == self.task.project_id
\ No newline at end of file
+        assert new_task.project_id == self.task.project_id
+
+    def test_from_dict_empty_title_raises_error(self):
+        data = self.task.to_dict()
+        data["title"] = " "
+        with pytest.raises(ValueError):
+            Task.from_dict(data)
+
+    def test_from_dict_invalid_priority_raises_error(self):
+        data = self.task.to_dict()
+        data["priority"] = "invalid"
+        with pytest.raises(ValueError):
+            Task.from_dict(data)
+
+    def test_from_trusted_dict_round_trip(self):
+        data = self.task.to_dict()
+        new_task = Task.from_trusted_dict(data)
+
+        assert new_task.to_dict() == data
+        assert new_task.priority is Priority.HIGH
+        assert new_task.status is Status.DONE
+        assert isinstance(new_task.completed_at, datetime)
+
+    def test_from_trusted_dict_optional_fields(self):
+        new_task = Task.from_trusted_dict({
+            "id": "1",
+            "title": "Test",
+            "priority": "low",
+            "status": "todo",
+            "created_at": "2023-01-01T00:00:00"
+        })
+        assert new_task.description == ""
+        assert new_task.completed_at is None
+        assert new_task.project_id is None
+
+
+class TestTaskPickling:
+    def test_pickled_task_is_a_detached_copy(self):
+        task = Task("Report", priority=Priority.HIGH)
+        task.assign_to_project("alpha")
+        task._add_observer(lambda *args: None)
+        copy = pickle.loads(pickle.dumps(task))
+        assert copy.to_dict() == task.to_dict()
+        assert copy._observers == ()